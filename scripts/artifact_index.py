@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+artifact_index.py - AgenticOps Value Train Artifact Index
+
+Answers artifact existence queries from directory listings instead of one
+stat per artifact. Each directory holding artifacts is listed once with
+os.scandir; listings can be persisted under .valuetrain-cache/ and reused
+while the directory's mtime is unchanged.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from fs_utils import atomic_write_text
+from parse_cache import RACY_WINDOW_NS, ParseCache
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE_NAME = "artifact-index.json"
+
+
+class DirectoryListing(NamedTuple):
+    """Entry names of one directory, as of its mtime_ns."""
+
+    mtime_ns: int
+    scanned_at_ns: int
+    names: frozenset
+    symlinks: frozenset
+
+
+class ArtifactIndex:
+    """Set-membership view of the artifact directories' contents."""
+
+    def __init__(self, persist_path: Optional[Path] = None):
+        self.persist_path = persist_path
+        self._listings: Dict[Path, Optional[DirectoryListing]] = {}
+        self._persisted: Dict[str, DirectoryListing] = {}
+        self._dirty = False
+        if persist_path is not None:
+            self._persisted = self._read_persisted(persist_path)
+
+    @classmethod
+    def for_project(cls, project_root: Path) -> "ArtifactIndex":
+        """Return an index persisted in the project's cache, if caching is on."""
+        cache = ParseCache.for_project(project_root)
+        if cache is None:
+            return cls()
+        return cls(cache.cache_dir / INDEX_FILE_NAME)
+
+    def _listing(self, directory: Path) -> Optional[DirectoryListing]:
+        """Return the listing of a directory, or None if it does not exist."""
+        if directory in self._listings:
+            return self._listings[directory]
+
+        listing = self._scan(directory)
+        self._listings[directory] = listing
+        return listing
+
+    def _scan(self, directory: Path) -> Optional[DirectoryListing]:
+        import time
+
+        try:
+            stat = directory.stat()
+        except OSError:
+            return None
+
+        persisted = self._persisted.get(str(directory))
+        if (
+            persisted is not None
+            and persisted.mtime_ns == stat.st_mtime_ns
+            and persisted.scanned_at_ns - stat.st_mtime_ns > RACY_WINDOW_NS
+        ):
+            return persisted
+
+        names = set()
+        symlinks = set()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    names.add(entry.name)
+                    if entry.is_symlink():
+                        symlinks.add(entry.name)
+        except (NotADirectoryError, PermissionError):
+            return None
+
+        listing = DirectoryListing(
+            stat.st_mtime_ns, time.time_ns(), frozenset(names), frozenset(symlinks)
+        )
+        if self.persist_path is not None:
+            self._persisted[str(directory)] = listing
+            self._dirty = True
+        return listing
+
+    def exists(self, path: Path) -> bool:
+        """Return the same answer as `path.exists()`."""
+        listing = self._listing(path.parent)
+        if listing is None or path.name not in listing.names:
+            return False
+        if path.name in listing.symlinks:
+            # Dangling symlinks do not exist; only their targets can tell
+            return path.exists()
+        return True
+
+    def missing(self, paths: Iterable[Path]) -> List[Path]:
+        """Return the paths that do not exist, in their original order."""
+        return [path for path in paths if not self.exists(path)]
+
+    def _read_persisted(self, persist_path: Path) -> Dict[str, DirectoryListing]:
+        import json
+
+        try:
+            with open(persist_path, "r") as f:
+                raw = json.load(f)
+            return {
+                directory: DirectoryListing(
+                    entry["mtime_ns"],
+                    entry["scanned_at_ns"],
+                    frozenset(entry["names"]),
+                    frozenset(entry["symlinks"]),
+                )
+                for directory, entry in raw.items()
+            }
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.debug(f"Ignoring unreadable artifact index {persist_path}: {e}")
+            return {}
+
+    def save(self):
+        """Persist the directory listings if any were rescanned."""
+        if self.persist_path is None or not self._dirty:
+            return
+
+        import json
+
+        serialized = json.dumps(
+            {
+                directory: {
+                    "mtime_ns": listing.mtime_ns,
+                    "scanned_at_ns": listing.scanned_at_ns,
+                    "names": sorted(listing.names),
+                    "symlinks": sorted(listing.symlinks),
+                }
+                for directory, listing in self._persisted.items()
+            }
+        )
+        try:
+            atomic_write_text(self.persist_path, serialized)
+            self._dirty = False
+        except OSError as e:
+            logger.debug(f"Could not write artifact index {self.persist_path}: {e}")
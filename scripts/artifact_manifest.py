@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+artifact_manifest.py - AgenticOps Value Train Artifact Manifest
+
+Records size, mtime_ns and a content hash for each resolved artifact in
+.valuetrain/artifacts.lock. Files are re-hashed only when their stat
+changed; large files are hashed through a memory map in chunks. The
+manifest also keeps the hash at the last phase advance (the baseline) so
+content changes since then can be reported.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from fs_utils import atomic_write_text
+from parse_cache import RACY_WINDOW_NS
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_RELATIVE_PATH = Path(".valuetrain") / "artifacts.lock"
+MANIFEST_VERSION = 1
+
+CHUNK_SIZE = 1024 * 1024
+MMAP_THRESHOLD = 16 * 1024 * 1024
+
+# Written by check_artifacts.py --create-missing
+PLACEHOLDER_MARKER = b"<!-- Placeholder file created by check_artifacts.py -->"
+PLACEHOLDER_SCAN_BYTES = 4096
+
+MISSING = "missing"
+EMPTY = "empty"
+PLACEHOLDER = "placeholder"
+CHANGED = "changed"
+NEW = "new"
+UNCHANGED = "unchanged"
+
+
+class ArtifactStatus(NamedTuple):
+    """Content status of one artifact."""
+
+    path: Path
+    status: str
+    sha256: Optional[str] = None
+
+
+def hash_file(path: Path) -> str:
+    """Return the sha256 of a file, memory-mapping large files."""
+    import hashlib
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            import mmap
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    for offset in range(0, size, CHUNK_SIZE):
+                        digest.update(view[offset : offset + CHUNK_SIZE])
+                finally:
+                    view.release()
+        else:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _is_placeholder(path: Path) -> bool:
+    with open(path, "rb") as f:
+        return PLACEHOLDER_MARKER in f.read(PLACEHOLDER_SCAN_BYTES)
+
+
+class ArtifactManifest:
+    """Incrementally maintained fingerprints of a project's artifacts."""
+
+    def __init__(self, project_root: Path):
+        self.project_root = project_root
+        self.path = project_root / MANIFEST_RELATIVE_PATH
+        self.entries: Dict[str, dict] = self._read()
+        self.rehashed = 0
+        self._dirty = False
+
+    def _read(self) -> Dict[str, dict]:
+        import json
+
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable artifact manifest {self.path}: {e}")
+            return {}
+
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            logger.warning(f"Ignoring artifact manifest in unknown format: {self.path}")
+            return {}
+        return data.get("artifacts", {})
+
+    def _key(self, path: Path) -> str:
+        try:
+            return path.relative_to(self.project_root).as_posix()
+        except ValueError:
+            return str(path)
+
+    def fingerprint(self, path: Path) -> Optional[dict]:
+        """Return the up-to-date entry for a file, or None if it is missing.
+
+        The file is re-hashed only when its size or mtime_ns differ from the
+        recorded entry, or when it was modified within the racy window of
+        the previous hash.
+        """
+        import time
+
+        key = self._key(path)
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+
+        entry = self.entries.get(key)
+        if (
+            entry is not None
+            and entry.get("size") == stat.st_size
+            and entry.get("mtime_ns") == stat.st_mtime_ns
+            and entry.get("hashed_at_ns", 0) - stat.st_mtime_ns > RACY_WINDOW_NS
+        ):
+            return entry
+
+        updated = dict(entry or {})
+        updated.update(
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            sha256=hash_file(path),
+            placeholder=stat.st_size > 0 and _is_placeholder(path),
+            hashed_at_ns=time.time_ns(),
+        )
+        self.entries[key] = updated
+        self.rehashed += 1
+        self._dirty = True
+        return updated
+
+    def inspect(self, paths: Iterable[Path]) -> List[ArtifactStatus]:
+        """Classify each artifact by its content."""
+        statuses = []
+        for path in paths:
+            entry = self.fingerprint(path) if path.is_file() else None
+            if entry is None:
+                status = MISSING if not path.exists() else UNCHANGED
+                statuses.append(ArtifactStatus(path, status))
+                continue
+
+            if entry["size"] == 0:
+                status = EMPTY
+            elif entry["placeholder"]:
+                status = PLACEHOLDER
+            elif entry.get("baseline_sha256") is None:
+                status = NEW
+            elif entry["baseline_sha256"] != entry["sha256"]:
+                status = CHANGED
+            else:
+                status = UNCHANGED
+            statuses.append(ArtifactStatus(path, status, entry["sha256"]))
+        return statuses
+
+    def mark_baseline(self, paths: Iterable[Path] = ()):
+        """Record current hashes as the baseline for the next phase.
+
+        Fingerprints the given paths, then re-baselines every recorded
+        artifact that still exists and drops the ones that do not.
+        """
+        for path in paths:
+            if path.is_file():
+                self.fingerprint(path)
+
+        for key in list(self.entries):
+            path = Path(key)
+            if not path.is_absolute():
+                path = self.project_root / key
+            entry = self.fingerprint(path)
+            if entry is None:
+                del self.entries[key]
+                self._dirty = True
+            elif entry.get("baseline_sha256") != entry["sha256"]:
+                entry["baseline_sha256"] = entry["sha256"]
+                self._dirty = True
+
+    def save(self) -> bool:
+        """Write the manifest if any entry changed; return True if written."""
+        if not self._dirty:
+            return False
+
+        import json
+
+        atomic_write_text(
+            self.path,
+            json.dumps(
+                {"version": MANIFEST_VERSION, "artifacts": self.entries},
+                indent=2,
+                sort_keys=True,
+            )
+            + "\n",
+        )
+        self._dirty = False
+        return True
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+artifact_router.py - AgenticOps Value Train Artifact Routing
+
+Compiles the `artifact_routing` rules of pipeline.yml into a router that
+maps artifact names to directories under the project root. Plain extension
+rules become a dict lookup; glob, regex, phase-group and other suffix rules
+form an ordered matcher that is tried first. Results are memoized.
+
+Example:
+
+    artifact_routing:
+      rules:
+        - glob: "feature-*.yaml"
+          path: "delivery.features"
+        - phases: ["opportunity", "discovery"]
+          suffix: ".md"
+          path: "preengagement.discovery"
+        - suffix: ".csv"
+          path: "delivery.data"
+      default: "/"
+
+`path` is either a key of `artifact_paths` (`group` or `group.key`, where
+`group` alone means `group.base_path`) or a literal path starting with "/".
+A rule with several conditions matches only when all of them match.
+"""
+
+import re
+from fnmatch import fnmatchcase
+from pathlib import PurePosixPath
+from typing import Dict, List, Optional, Pattern, Sequence, Tuple
+
+# Routing used when pipeline.yml defines no artifact_routing
+DEFAULT_ROUTING: dict = {
+    "rules": [
+        {
+            "regex": "opportunity|use-case|ai-readiness",
+            "suffix": ".md",
+            "path": "preengagement",
+        },
+        {"suffix": ".md", "path": "delivery"},
+        {"suffix": ".py", "path": "delivery"},
+        {"suffix": ".ipynb", "path": "delivery"},
+        {"suffix": ".csv", "path": "delivery.data"},
+        {"suffix": ".yaml", "path": "/config"},
+        {"suffix": ".yml", "path": "/config"},
+    ],
+    "default": "/",
+}
+
+# Fallbacks for artifact_paths keys the built-in routing relies on
+BUILTIN_PATHS = {
+    "preengagement.base_path": "/preengagement",
+    "delivery.base_path": "/delivery",
+    "delivery.data": "/delivery/data",
+}
+
+_CONDITIONS = ("suffix", "glob", "regex", "phases")
+
+
+class _PatternRule:
+    """A routing rule evaluated in order against each artifact."""
+
+    def __init__(
+        self,
+        target: PurePosixPath,
+        suffix: Optional[str] = None,
+        glob: Optional[str] = None,
+        regex: Optional[Pattern] = None,
+        phases: Optional[frozenset] = None,
+    ):
+        self.target = target
+        self.suffix = suffix
+        self.glob = glob
+        self.regex = regex
+        self.phases = phases
+
+    def matches(self, artifact: str, phases: Sequence[str]) -> bool:
+        if self.suffix is not None and not artifact.endswith(self.suffix):
+            return False
+        if self.glob is not None and not fnmatchcase(artifact, self.glob):
+            return False
+        if self.regex is not None and not self.regex.search(artifact):
+            return False
+        if self.phases is not None and self.phases.isdisjoint(phases):
+            return False
+        return True
+
+
+class ArtifactRouter:
+    """Map artifact names to project-relative directories."""
+
+    def __init__(
+        self,
+        pipeline_config: Optional[dict],
+        artifact_phases: Optional[Dict[str, List[str]]] = None,
+    ):
+        config = pipeline_config or {}
+        self.artifact_paths = config.get("artifact_paths", {}) or {}
+        self.artifact_phases = artifact_phases or {}
+        routing = config.get("artifact_routing") or DEFAULT_ROUTING
+
+        self.patterns: List[_PatternRule] = []
+        self.suffixes: Dict[str, PurePosixPath] = {}
+        for rule in routing.get("rules", []) or []:
+            self._compile_rule(rule)
+        self.default = self.target_path(routing.get("default", "/"))
+        self._memo: Dict[Tuple[str, Optional[str]], PurePosixPath] = {}
+
+    def target_path(self, spec: str) -> PurePosixPath:
+        """Resolve a rule target to a path relative to the project root."""
+        if spec.startswith("/"):
+            return PurePosixPath(spec.lstrip("/"))
+
+        group, _, key = spec.partition(".")
+        key = key or "base_path"
+        group_paths = self.artifact_paths.get(group) or {}
+        path = group_paths.get(key) or BUILTIN_PATHS.get(f"{group}.{key}")
+        if path is None:
+            raise ValueError(f"Unknown artifact path '{spec}' in artifact_routing")
+        return PurePosixPath(path.lstrip("/"))
+
+    def _compile_rule(self, rule: dict):
+        if "path" not in rule or not any(name in rule for name in _CONDITIONS):
+            raise ValueError(f"Invalid artifact routing rule: {rule}")
+
+        target = self.target_path(rule["path"])
+        suffix = rule.get("suffix")
+        conditions = [name for name in _CONDITIONS if name in rule]
+        if (
+            conditions == ["suffix"]
+            and isinstance(suffix, str)
+            and suffix.startswith(".")
+            and "/" not in suffix
+        ):
+            # Extension rules are a dict lookup; the first definition wins
+            self.suffixes.setdefault(suffix, target)
+            return
+
+        phases = rule.get("phases")
+        self.patterns.append(
+            _PatternRule(
+                target,
+                suffix=suffix,
+                glob=rule.get("glob"),
+                regex=re.compile(rule["regex"]) if "regex" in rule else None,
+                phases=frozenset(phases) if phases is not None else None,
+            )
+        )
+
+    def route(self, artifact: str, phase: Optional[str] = None) -> PurePosixPath:
+        """Return the project-relative path of an artifact."""
+        key = (artifact, phase)
+        routed = self._memo.get(key)
+        if routed is None:
+            routed = self._route(artifact, phase)
+            self._memo[key] = routed
+        return routed
+
+    def _route(self, artifact: str, phase: Optional[str]) -> PurePosixPath:
+        if artifact.startswith("/"):
+            return PurePosixPath(artifact.lstrip("/"))
+
+        phases = [phase] if phase else self.artifact_phases.get(artifact, [])
+        for rule in self.patterns:
+            if rule.matches(artifact, phases):
+                return rule.target / artifact
+
+        # Longest extension first, so ".tar.gz" beats ".gz"
+        dot = artifact.find(".")
+        while dot != -1:
+            target = self.suffixes.get(artifact[dot:])
+            if target is not None:
+                return target / artifact
+            dot = artifact.find(".", dot + 1)
+
+        return self.default / artifact
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+artifact_scaffold.py - AgenticOps Value Train Artifact Scaffolding
+
+Creates missing artifacts from the templates in docs/templates/. An
+artifact uses the template named in the `artifact_templates` section of
+pipeline.yml, or the template with the same file name. Session fields from
+ACTIVE_SESSION.md fill the template's placeholders: `{{ field }}` (dotted
+keys such as `{{ task.title }}`) and the standard footer placeholders
+`[Agent Name]` and `[YYYY-MM-DD]`. Artifacts without a template get the
+plain placeholder file.
+
+Each template is compiled once per run and files are written atomically
+on a thread pool. Existing files are never overwritten.
+
+Example:
+
+    artifact_templates:
+      use-case-one-pager.md: "use-case-template.md"
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from artifact_manifest import PLACEHOLDER_MARKER
+from fs_utils import atomic_write_text
+
+TEMPLATES_RELATIVE_PATH = Path("docs") / "templates"
+DEFAULT_JOBS = 8
+
+# Recognised by artifact_manifest as an unfinished artifact
+PLACEHOLDER_COMMENT = PLACEHOLDER_MARKER.decode()
+
+# Placeholders the shipped templates already use, and the field filling them
+FOOTER_PLACEHOLDERS = {"[Agent Name]": "agent", "[YYYY-MM-DD]": "date"}
+
+_FIELD_PATTERN = re.compile(
+    r"\{\{\s*([\w.-]+)\s*\}\}|"
+    + "|".join(re.escape(placeholder) for placeholder in FOOTER_PLACEHOLDERS)
+)
+
+
+class CompiledTemplate:
+    """A template split once into literal text and field references."""
+
+    def __init__(self, text: str):
+        # Even indexes are literal text, odd indexes are (field, original)
+        self.parts: List[Any] = []
+        position = 0
+        for match in _FIELD_PATTERN.finditer(text):
+            field = match.group(1) or FOOTER_PLACEHOLDERS[match.group(0)]
+            self.parts.append(text[position : match.start()])
+            self.parts.append((field, match.group(0)))
+            position = match.end()
+        self.parts.append(text[position:])
+
+    def render(self, fields: Dict[str, str]) -> str:
+        """Fill in the known fields; unknown placeholders are left as they are."""
+        rendered = []
+        for index, part in enumerate(self.parts):
+            if index % 2:
+                field, original = part
+                part = fields.get(field, original)
+            rendered.append(part)
+        return "".join(rendered)
+
+
+def session_fields(session: Dict[str, Any], today: Optional[str] = None) -> dict:
+    """Flatten session sections into `dotted.key` -> text template fields."""
+    import datetime
+
+    fields: Dict[str, str] = {}
+
+    def flatten(prefix: str, value: Any):
+        if isinstance(value, dict):
+            for key, nested in value.items():
+                flatten(f"{prefix}{key}.", nested)
+        elif value is not None and not isinstance(value, list):
+            fields[prefix[:-1]] = str(value)
+
+    flatten("", session)
+    fields["date"] = today or datetime.date.today().isoformat()
+    return fields
+
+
+def placeholder_content(artifact_path: Path) -> str:
+    """Return the plain placeholder used when an artifact has no template."""
+    return (
+        f"# {artifact_path.name}\n\n"
+        f"{PLACEHOLDER_COMMENT}\n"
+        f"<!-- TODO: Add actual content for {artifact_path.name} -->\n"
+    )
+
+
+class Scaffolder:
+    """Render and write missing artifacts for one project."""
+
+    def __init__(
+        self,
+        project_root: Path,
+        pipeline_config: Optional[dict],
+        session: Optional[Dict[str, Any]] = None,
+        today: Optional[str] = None,
+    ):
+        self.templates_dir = project_root / TEMPLATES_RELATIVE_PATH
+        config = pipeline_config or {}
+        self.template_names = config.get("artifact_templates") or {}
+        self.fields = session_fields(session or {}, today)
+        self._compiled: Dict[Path, Optional[CompiledTemplate]] = {}
+
+    def template_path(self, artifact_name: str) -> Optional[Path]:
+        """Return the template for an artifact, or None if it has none."""
+        name = self.template_names.get(artifact_name, artifact_name)
+        path = self.templates_dir / name
+        return path if path.is_file() else None
+
+    def _template(self, artifact_name: str) -> Optional[CompiledTemplate]:
+        path = self.template_path(artifact_name)
+        if path is None:
+            return None
+        if path not in self._compiled:
+            with open(path, "r") as f:
+                self._compiled[path] = CompiledTemplate(f.read())
+        return self._compiled[path]
+
+    def render(self, artifact_path: Path, phase: Optional[str] = None) -> str:
+        """Return the initial content of an artifact."""
+        template = self._template(artifact_path.name)
+        if template is None:
+            return placeholder_content(artifact_path)
+
+        fields = dict(self.fields, artifact=artifact_path.name)
+        if phase:
+            fields["phase"] = phase
+        content = template.render(fields)
+        # Keep the title first; the marker must sit near the top of the file
+        title, _, body = content.partition("\n")
+        if title.startswith("#"):
+            return f"{title}\n{PLACEHOLDER_COMMENT}\n{body}"
+        return f"{PLACEHOLDER_COMMENT}\n{content}"
+
+    def scaffold(
+        self,
+        artifacts: Union[List[Path], Dict[Path, Optional[str]]],
+        jobs: int = DEFAULT_JOBS,
+    ) -> List[Path]:
+        """Write the artifacts that do not exist yet and return them.
+
+        `artifacts` is a list of paths or a mapping of path to the phase
+        that requires it.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        if not isinstance(artifacts, dict):
+            artifacts = dict.fromkeys(artifacts)
+        pending = [path for path in artifacts if not path.exists()]
+        # Render up front so every template is read and compiled exactly once
+        contents = [self.render(path, artifacts[path]) for path in pending]
+        if not pending:
+            return []
+
+        workers = max(1, min(jobs, len(pending)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(atomic_write_text, pending, contents))
+        return pending
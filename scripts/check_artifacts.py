@@ -8,20 +8,36 @@ Ensures deliverables are present before allowing CI to pass.
 
 import argparse
 import logging
+import re
 import sys
+from functools import partial
 from pathlib import Path
-from typing import List
-
-import yaml
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Union
+
+from artifact_index import ArtifactIndex
+from file_watcher import DEFAULT_INTERVAL, run_watch
+from fleet import (
+    DEFAULT_JOBS,
+    ProjectResult,
+    SharedPipelineLoader,
+    expand_project_roots,
+    is_fleet_request,
+    report_fleet,
+    run_fleet,
 )
+from logging_setup import configure_logging
+from parse_cache import ParseCache, load_yaml_file
+from pipeline_graph import PipelineGraph
+from session_model import load_session_section, session_path_for
+
 logger = logging.getLogger(__name__)
 
+SCHEMA_SPEC_ARTIFACT = "schema-spec.md"
 
-def load_pipeline_config(project_root: Path) -> dict:
+
+def load_pipeline_config(
+    project_root: Path, cache: Optional[ParseCache] = None
+) -> dict:
     """Load pipeline configuration from config/pipeline.yml."""
     pipeline_path = project_root / "config" / "pipeline.yml"
 
@@ -30,121 +46,444 @@ def load_pipeline_config(project_root: Path) -> dict:
         sys.exit(1)
 
     try:
-        with open(pipeline_path, "r") as f:
-            return yaml.safe_load(f)
+        return load_yaml_file(pipeline_path, cache)
     except Exception as e:
         logger.error(f"Error loading pipeline configuration: {e}")
         sys.exit(1)
 
 
-def load_active_session(project_root: Path) -> dict:
+def load_active_session(project_root: Path, cache: Optional[ParseCache] = None) -> dict:
     """Load current session context from ACTIVE_SESSION.md."""
-    active_session_path = (
-        project_root / "docs" / "session-context" / "ACTIVE_SESSION.md"
-    )
+    active_session_path = session_path_for(project_root)
 
     if not active_session_path.exists():
         logger.error(f"ACTIVE_SESSION.md not found at {active_session_path}")
         sys.exit(1)
 
     try:
-        with open(active_session_path, "r") as f:
-            content = f.read()
-
-        # Extract YAML blocks
-        lines = content.split("\n")
-        current_work_yaml = []
-        in_current_work = False
-
-        for line in lines:
-            if line.strip() == "## Current Work":
-                in_current_work = True
-                continue
-            elif in_current_work and line.strip() == "```yaml":
-                continue
-            elif in_current_work and line.strip() == "```":
-                break
-            elif in_current_work:
-                current_work_yaml.append(line)
-
-        # Parse the YAML
-        current_work_str = "\n".join(current_work_yaml)
-        return yaml.safe_load(current_work_str)
+        return load_session_section(active_session_path, "Current Work", cache)
 
     except Exception as e:
         logger.error(f"Error parsing ACTIVE_SESSION.md: {e}")
         sys.exit(1)
 
 
-def get_phase_artifacts(pipeline_config: dict, phase_name: str) -> List[str]:
+def get_phase_artifacts(
+    pipeline: Union[PipelineGraph, dict], phase_name: str
+) -> List[str]:
     """Get required artifacts for a specific phase."""
-    phases = pipeline_config.get("phases", [])
+    graph = PipelineGraph.coerce(pipeline)
 
-    for phase in phases:
-        if phase.get("name") == phase_name:
-            return phase.get("artifacts", [])
+    if graph.phase(phase_name) is not None:
+        return graph.artifacts(phase_name)
 
     logger.warning(f"Phase '{phase_name}' not found in pipeline configuration")
     return []
 
 
 def resolve_artifact_paths(
-    project_root: Path, artifacts: List[str], pipeline_config: dict
+    project_root: Path,
+    artifacts: List[str],
+    pipeline: Union[PipelineGraph, dict],
+    phase: Optional[str] = None,
 ) -> List[Path]:
-    """Resolve artifact names to actual file paths."""
-    resolved_paths = []
-    artifact_paths = pipeline_config.get("artifact_paths", {})
-
-    for artifact in artifacts:
-        # Handle different artifact path patterns
-        if artifact.startswith("/"):
-            # Absolute path from project root
-            artifact_path = project_root / artifact.lstrip("/")
-        elif artifact.endswith(".md"):
-            # Documentation files
-            if (
-                "opportunity" in artifact
-                or "use-case" in artifact
-                or "ai-readiness" in artifact
-            ):
-                base_path = artifact_paths.get("preengagement", {}).get(
-                    "base_path", "/preengagement"
-                )
-                artifact_path = project_root / base_path.lstrip("/") / artifact
-            else:
-                base_path = artifact_paths.get("delivery", {}).get(
-                    "base_path", "/delivery"
-                )
-                artifact_path = project_root / base_path.lstrip("/") / artifact
-        elif artifact.endswith(".py") or artifact.endswith(".ipynb"):
-            # Code and notebook files
-            base_path = artifact_paths.get("delivery", {}).get("base_path", "/delivery")
-            artifact_path = project_root / base_path.lstrip("/") / artifact
-        elif artifact.endswith(".csv"):
-            # Data files
-            data_path = artifact_paths.get("delivery", {}).get("data", "/delivery/data")
-            artifact_path = project_root / data_path.lstrip("/") / artifact
-        elif artifact.endswith(".yaml") or artifact.endswith(".yml"):
-            # Configuration files
-            artifact_path = project_root / "config" / artifact
-        else:
-            # Default to project root
-            artifact_path = project_root / artifact
+    """Resolve artifact names to actual file paths.
 
-        resolved_paths.append(artifact_path)
+    Routing follows the `artifact_routing` rules of pipeline.yml, compiled
+    once per pipeline graph; see artifact_router for the rule format.
+    """
+    graph = PipelineGraph.coerce(pipeline)
 
-    return resolved_paths
+    try:
+        router = graph.router
+    except (ValueError, re.error) as e:
+        logger.error(f"Invalid artifact routing in pipeline configuration: {e}")
+        sys.exit(1)
 
+    return [project_root / router.route(artifact, phase) for artifact in artifacts]
 
-def check_artifacts_exist(artifact_paths: List[Path]) -> List[Path]:
-    """Check which artifacts are missing."""
-    missing_artifacts = []
 
-    for artifact_path in artifact_paths:
-        if not artifact_path.exists():
-            missing_artifacts.append(artifact_path)
+def check_artifacts_exist(
+    artifact_paths: List[Path], index: Optional[ArtifactIndex] = None
+) -> List[Path]:
+    """Check which artifacts are missing.
+
+    Existence is answered from one directory listing per artifact directory
+    rather than one stat per artifact.
+    """
+    if index is None:
+        index = ArtifactIndex()
+
+    return index.missing(artifact_paths)
+
+
+class PhaseAudit(NamedTuple):
+    """Artifact completeness of one phase."""
 
-    return missing_artifacts
+    phase: str
+    required: int
+    missing: List[Path]
+
+
+def load_presence_index(project_root: Path, git_index: bool = False):
+    """Return the index that answers artifact presence for a project.
+
+    By default presence means "on disk"; with `git_index` it means "tracked
+    in the git index", answered from a single `git ls-files` call.
+    """
+    if not git_index:
+        return ArtifactIndex.for_project(project_root)
+
+    from git_index import GitIndex, GitIndexError
+
+    try:
+        return GitIndex.load(project_root)
+    except GitIndexError as e:
+        logger.error(str(e))
+        sys.exit(1)
+
+
+def audit_all_phases(
+    project_root: Path,
+    pipeline: Union[PipelineGraph, dict],
+    index: Optional[ArtifactIndex] = None,
+) -> List[PhaseAudit]:
+    """Check the artifacts of every phase, in pipeline order.
+
+    All phases share one index, so each artifact directory is scanned once
+    no matter how many phases keep artifacts in it.
+    """
+    graph = PipelineGraph.coerce(pipeline)
+    if index is None:
+        index = ArtifactIndex()
+
+    audits = []
+    for phase_name in graph.phases:
+        artifact_paths = resolve_artifact_paths(
+            project_root, graph.artifacts(phase_name), graph, phase_name
+        )
+        audits.append(
+            PhaseAudit(phase_name, len(artifact_paths), index.missing(artifact_paths))
+        )
+    return audits
+
+
+def format_audit_matrix(audits: List[PhaseAudit]) -> List[str]:
+    """Format phase audits as a completeness table with a totals row."""
+
+    def row(name: str, required: int, missing: int) -> str:
+        present = required - missing
+        complete = f"{100 * present // required}%" if required else "-"
+        return (
+            f"{name:<{width}}  {required:>8}  {present:>7}  {missing:>7}  "
+            f"{complete:>8}"
+        )
+
+    width = max([len("Phase"), len("TOTAL")] + [len(a.phase) for a in audits])
+    lines = [
+        f"{'Phase':<{width}}  {'Required':>8}  {'Present':>7}  {'Missing':>7}  "
+        f"{'Complete':>8}"
+    ]
+    lines.extend(row(a.phase, a.required, len(a.missing)) for a in audits)
+    lines.append(
+        row(
+            "TOTAL",
+            sum(a.required for a in audits),
+            sum(len(a.missing) for a in audits),
+        )
+    )
+    return lines
+
+
+class ArtifactWatch:
+    """Incremental artifact re-validation for --watch.
+
+    Artifact directories are watched for entry changes; a change re-checks
+    only the artifacts resolved into that directory. Pipeline or session
+    edits re-resolve the whole phase.
+    """
+
+    def __init__(self, project_root: Path, phase: Optional[str] = None):
+        self.project_root = project_root
+        self.fixed_phase = phase
+        self.pipeline_path = project_root / "config" / "pipeline.yml"
+        self.session_path = session_path_for(project_root)
+        self.artifact_paths: List[Path] = []
+        self.missing: Set[Path] = set()
+
+    def targets(self) -> List[Path]:
+        """Return the config files and artifact directories to watch."""
+        targets = [self.pipeline_path]
+        if self.fixed_phase is None:
+            targets.append(self.session_path)
+        targets.extend(sorted({path.parent for path in self.artifact_paths}))
+        return targets
+
+    def start(self) -> List[str]:
+        """Evaluate the initial state."""
+        return self._reload()
+
+    def update(self, changed: Iterable[Path]) -> List[str]:
+        """Re-check only the artifacts affected by the changed paths."""
+        changed = set(changed)
+        if self.pipeline_path in changed or self.session_path in changed:
+            return self._reload()
+
+        affected = [path for path in self.artifact_paths if path.parent in changed]
+        if not affected:
+            return []
+        now_missing = set(check_artifacts_exist(affected))
+        return self._report(set(affected), now_missing)
+
+    def _reload(self) -> List[str]:
+        try:
+            pipeline = PipelineGraph(load_pipeline_config(self.project_root))
+            phase = self.fixed_phase
+            if phase is None:
+                phase = load_active_session(self.project_root).get("phase")
+        except SystemExit:
+            return ["Waiting for a valid pipeline and session..."]
+
+        lines = []
+        if phase is None:
+            lines.append("No current phase found in ACTIVE_SESSION.md")
+        required = pipeline.artifacts(phase) if phase is not None else []
+        artifact_paths = resolve_artifact_paths(
+            self.project_root, required, pipeline, phase
+        )
+        if artifact_paths != self.artifact_paths:
+            lines.append(f"Phase: {phase}, watching {len(artifact_paths)} artifacts")
+        self.missing &= set(artifact_paths)
+        self.artifact_paths = artifact_paths
+        now_missing = set(check_artifacts_exist(artifact_paths))
+        return lines + self._report(set(artifact_paths), now_missing)
+
+    def _report(self, checked: Set[Path], now_missing: Set[Path]) -> List[str]:
+        previously_missing = self.missing & checked
+        self.missing = (self.missing - checked) | now_missing
+
+        appeared = previously_missing - now_missing
+        disappeared = now_missing - previously_missing
+        lines = [f"✅ Now present: {path}" for path in sorted(appeared)]
+        lines.extend(f"❌ Missing: {path}" for path in sorted(disappeared))
+        if lines:
+            lines.append(
+                f"{len(self.missing)} of {len(self.artifact_paths)} artifacts missing"
+            )
+        return lines
+
+
+def check_project_artifacts(
+    project_root: Path,
+    pipelines: SharedPipelineLoader,
+    phase: Optional[str] = None,
+    all_phases: bool = False,
+    git_index: bool = False,
+) -> ProjectResult:
+    """Check one project's artifacts for fleet mode."""
+    pipeline = pipelines.load(project_root)
+    index = load_presence_index(project_root, git_index)
+
+    if all_phases:
+        audits = audit_all_phases(project_root, pipeline, index)
+        index.save()
+        required = sum(audit.required for audit in audits)
+        missing = list(
+            dict.fromkeys(path for audit in audits for path in audit.missing)
+        )
+        present = required - sum(len(audit.missing) for audit in audits)
+        summary = f"{present} of {required} artifacts present across all phases"
+    else:
+        if phase is None:
+            cache = ParseCache.for_project(project_root)
+            phase = load_active_session(project_root, cache).get("phase")
+            if not phase:
+                return ProjectResult(
+                    project_root,
+                    False,
+                    "No current phase found in ACTIVE_SESSION.md",
+                    error=True,
+                )
+        artifact_paths = resolve_artifact_paths(
+            project_root, pipeline.artifacts(phase), pipeline, phase
+        )
+        missing = check_artifacts_exist(artifact_paths, index)
+        index.save()
+        summary = (
+            f"phase '{phase}': {len(artifact_paths) - len(missing)} of "
+            f"{len(artifact_paths)} artifacts present"
+        )
+
+    untracked = set(index.untracked(missing)) if git_index else set()
+    messages = [
+        f"{'Untracked' if path in untracked else 'Missing'}: {path}" for path in missing
+    ]
+    return ProjectResult(project_root, not missing, summary, messages)
+
+
+def verify_artifact_content(project_root: Path, artifact_paths: List[Path]) -> list:
+    """Fingerprint existing artifacts and report their content status.
+
+    Returns the ArtifactStatus of empty and placeholder artifacts. Missing
+    artifacts are reported by the presence check and skipped here.
+    """
+    from artifact_manifest import CHANGED, EMPTY, NEW, PLACEHOLDER, ArtifactManifest
+
+    manifest = ArtifactManifest(project_root)
+    statuses = manifest.inspect(artifact_paths)
+    manifest.save()
+    logger.info(
+        f"Fingerprinted {len(artifact_paths)} artifacts "
+        f"({manifest.rehashed} re-hashed)"
+    )
+
+    incomplete = []
+    for artifact in statuses:
+        if artifact.status in (EMPTY, PLACEHOLDER):
+            logger.error(f"  {artifact.status.capitalize()}: {artifact.path}")
+            incomplete.append(artifact)
+        elif artifact.status == CHANGED:
+            logger.info(f"  Changed since last phase advance: {artifact.path}")
+        elif artifact.status == NEW:
+            logger.info(f"  New since last phase advance: {artifact.path}")
+    return incomplete
+
+
+def deep_check_artifacts(
+    project_root: Path,
+    artifact_paths: List[Path],
+    pipeline: Union[PipelineGraph, dict],
+    phase: Optional[str] = None,
+    workers: int = 0,
+) -> List[str]:
+    """Validate the content of existing artifacts and return the problems.
+
+    CSV files are streamed and validated against the schema declared in the
+    phase's schema-spec.md. Notebooks must have been executed without errors.
+    """
+    import csv
+
+    from csv_validator import SchemaError, load_schema, validate_csv
+    from notebook_inspector import NotebookError, inspect_notebook
+
+    problems: List[str] = []
+
+    csv_paths = [path for path in artifact_paths if path.suffix == ".csv"]
+    csv_paths = [path for path in csv_paths if path.is_file()]
+    if csv_paths:
+        spec_path = resolve_artifact_paths(
+            project_root, [SCHEMA_SPEC_ARTIFACT], pipeline, phase
+        )[0]
+        if not spec_path.is_file():
+            logger.warning(f"No {SCHEMA_SPEC_ARTIFACT} at {spec_path}, skipping CSVs")
+            csv_paths = []
+        else:
+            try:
+                schema = load_schema(spec_path)
+            except (OSError, SchemaError) as e:
+                problems.append(str(e))
+                csv_paths = []
+
+    for csv_path in csv_paths:
+        try:
+            report = validate_csv(csv_path, schema, workers=workers)
+        except (OSError, UnicodeDecodeError, csv.Error) as e:
+            problems.append(f"{csv_path.name}: could not be read: {e}")
+            continue
+        logger.info(f"Validated {report.rows} rows of {csv_path.name}")
+        problems.extend(f"{csv_path.name}: {v}" for v in report.violations)
+        hidden = report.violation_count - len(report.violations)
+        if hidden:
+            problems.append(f"{csv_path.name}: ... and {hidden} more violations")
+
+    for notebook_path in artifact_paths:
+        if notebook_path.suffix != ".ipynb" or not notebook_path.is_file():
+            continue
+        try:
+            notebook_report = inspect_notebook(notebook_path)
+        except (OSError, NotebookError) as e:
+            problems.append(f"{notebook_path.name}: {e}")
+            continue
+        logger.info(
+            f"Inspected {notebook_report.code_cells} code cells "
+            f"of {notebook_path.name}"
+        )
+        problems.extend(
+            f"{notebook_path.name}: {p}" for p in notebook_report.problems()
+        )
+
+    return problems
+
+
+def scaffold_missing_artifacts(
+    project_root: Path,
+    pipeline_config: dict,
+    artifacts: Dict[Path, Optional[str]],
+    cache: Optional[ParseCache] = None,
+):
+    """Create missing artifacts from docs/templates, filled from the session.
+
+    `artifacts` maps each artifact path to the phase that requires it.
+    """
+    from artifact_scaffold import Scaffolder
+
+    session: dict = {}
+    session_path = session_path_for(project_root)
+    if session_path.exists():
+        try:
+            for section in ("Session Metadata", "Current Work"):
+                fields = load_session_section(session_path, section, cache)
+                if isinstance(fields, dict):
+                    session.update(fields)
+        except Exception as e:
+            logger.warning(f"Could not read session fields from {session_path}: {e}")
+
+    logger.info("Creating missing artifacts from templates...")
+    scaffolder = Scaffolder(project_root, pipeline_config, session)
+    for artifact_path in scaffolder.scaffold(artifacts):
+        logger.info(f"  Created: {artifact_path}")
+
+
+def audit_pipeline(
+    project_root: Path,
+    pipeline_config: dict,
+    strict: bool,
+    git_index: bool = False,
+    create_missing: bool = False,
+):
+    """Log the all-phases completeness matrix and the missing artifacts."""
+    index = load_presence_index(project_root, git_index)
+    audits = audit_all_phases(project_root, pipeline_config, index)
+    index.save()
+
+    for line in format_audit_matrix(audits):
+        logger.info(line)
+
+    incomplete = [audit for audit in audits if audit.missing]
+    for audit in incomplete:
+        logger.error(
+            f"Phase '{audit.phase}' is missing {len(audit.missing)} artifacts:"
+        )
+        for artifact_path in audit.missing:
+            logger.error(f"  Missing: {artifact_path}")
+
+    if incomplete and create_missing:
+        artifacts: Dict[Path, Optional[str]] = {}
+        for audit in incomplete:
+            for artifact_path in audit.missing:
+                artifacts.setdefault(artifact_path, audit.phase)
+        scaffold_missing_artifacts(project_root, pipeline_config, artifacts)
+    elif not incomplete:
+        logger.info("✅ All phases have their required artifacts!")
+    elif strict:
+        logger.error("Failing CI due to missing artifacts (--strict mode)")
+        sys.exit(1)
+    else:
+        logger.warning(
+            "Missing artifacts found but not failing CI (use --strict to fail)"
+        )
+
+    logger.info("Artifact audit complete.")
 
 
 def main():
@@ -155,14 +494,34 @@ def main():
     parser.add_argument(
         "--project-root",
         type=Path,
-        default=Path.cwd(),
-        help="Root directory of the project (default: current directory)",
+        action="append",
+        help=(
+            "Root directory of the project (default: current directory); "
+            "repeat or use a glob pattern to check several projects"
+        ),
+    )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        help="File listing project roots to check, one per line",
     )
     parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Projects checked concurrently in fleet mode (default: {DEFAULT_JOBS})",
+    )
+    phase_group = parser.add_mutually_exclusive_group()
+    phase_group.add_argument(
         "--phase",
         type=str,
         help="Specific phase to check (default: current phase from ACTIVE_SESSION.md)",
     )
+    phase_group.add_argument(
+        "--all-phases",
+        action="store_true",
+        help="Audit the artifacts of every phase and print a completeness matrix",
+    )
     parser.add_argument(
         "--strict",
         action="store_true",
@@ -171,21 +530,104 @@ def main():
     parser.add_argument(
         "--create-missing",
         action="store_true",
-        help="Create placeholder files for missing artifacts",
+        help="Create missing artifacts from docs/templates (or as placeholders)",
+    )
+    parser.add_argument(
+        "--git-index",
+        action="store_true",
+        help=(
+            "Count artifacts as present only when tracked in the git index "
+            "and report untracked ones"
+        ),
+    )
+    parser.add_argument(
+        "--verify-content",
+        action="store_true",
+        help=(
+            "Fingerprint artifacts in .valuetrain/artifacts.lock and flag empty "
+            "or placeholder files"
+        ),
+    )
+    parser.add_argument(
+        "--deep",
+        action="store_true",
+        help="Validate CSVs against schema-spec.md and check notebooks ran cleanly",
+    )
+    parser.add_argument(
+        "--deep-workers",
+        type=int,
+        default=0,
+        help="Worker processes for --deep validation (default: 0, in-process)",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and report artifacts as they appear or disappear",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=DEFAULT_INTERVAL,
+        help=f"Polling interval in seconds for --watch (default: {DEFAULT_INTERVAL})",
     )
 
     args = parser.parse_args()
+    if args.all_phases and args.watch:
+        parser.error("--all-phases cannot be combined with --watch")
+    if args.all_phases and (args.deep or args.verify_content):
+        parser.error("--deep and --verify-content check the current phase only")
+    fleet = is_fleet_request(args.project_root, args.manifest)
+    if fleet and (args.watch or args.create_missing):
+        parser.error("--watch and --create-missing check a single project root")
+    if fleet and (args.deep or args.verify_content):
+        parser.error("--deep and --verify-content check a single project root")
+    configure_logging()
+
+    if fleet:
+        logger.info("Starting fleet artifact validation...")
+        project_roots = expand_project_roots(args.project_root or [], args.manifest)
+        if not project_roots:
+            logger.error("No project roots matched")
+            sys.exit(1)
+        pipelines = SharedPipelineLoader()
+        check = partial(
+            check_project_artifacts,
+            pipelines=pipelines,
+            phase=args.phase,
+            all_phases=args.all_phases,
+            git_index=args.git_index,
+        )
+        results = run_fleet(project_roots, check, args.jobs)
+        logger.info(f"Parsed {pipelines.parsed} distinct pipeline configurations")
+        sys.exit(report_fleet(results, args.strict))
+
+    args.project_root = (args.project_root or [Path.cwd()])[0]
+
+    if args.watch:
+        run_watch(ArtifactWatch(args.project_root, args.phase), args.interval)
+        return
 
     logger.info("Starting artifact validation...")
 
     # Load pipeline configuration
-    pipeline_config = load_pipeline_config(args.project_root)
+    cache = ParseCache.for_project(args.project_root)
+    pipeline_config = load_pipeline_config(args.project_root, cache)
+
+    if args.all_phases:
+        audit_pipeline(
+            args.project_root,
+            pipeline_config,
+            args.strict,
+            args.git_index,
+            args.create_missing,
+        )
+        return
 
     # Get current phase
     if args.phase:
         current_phase = args.phase
     else:
-        current_work = load_active_session(args.project_root)
+        current_work = load_active_session(args.project_root, cache)
         current_phase = current_work.get("phase")
         if not current_phase:
             logger.error("No current phase found in ACTIVE_SESSION.md")
@@ -194,7 +636,8 @@ def main():
     logger.info(f"Current phase: {current_phase}")
 
     # Get required artifacts for current phase
-    required_artifacts = get_phase_artifacts(pipeline_config, current_phase)
+    pipeline = PipelineGraph(pipeline_config)
+    required_artifacts = get_phase_artifacts(pipeline, current_phase)
 
     if not required_artifacts:
         logger.info(f"No artifacts required for phase '{current_phase}'")
@@ -204,28 +647,33 @@ def main():
 
     # Resolve artifact paths
     artifact_paths = resolve_artifact_paths(
-        args.project_root, required_artifacts, pipeline_config
+        args.project_root, required_artifacts, pipeline, current_phase
     )
 
     # Check for missing artifacts
-    missing_artifacts = check_artifacts_exist(artifact_paths)
+    index = load_presence_index(args.project_root, args.git_index)
+    missing_artifacts = check_artifacts_exist(artifact_paths, index)
+    index.save()
+    untracked = index.untracked(missing_artifacts) if args.git_index else []
 
     if missing_artifacts:
-        logger.error(f"Found {len(missing_artifacts)} missing artifacts:")
+        if args.git_index:
+            logger.error(
+                f"Found {len(missing_artifacts)} artifacts not tracked by git:"
+            )
+        else:
+            logger.error(f"Found {len(missing_artifacts)} missing artifacts:")
         for artifact_path in missing_artifacts:
-            logger.error(f"  Missing: {artifact_path}")
+            label = "Untracked" if artifact_path in untracked else "Missing"
+            logger.error(f"  {label}: {artifact_path}")
 
         if args.create_missing:
-            logger.info("Creating placeholder files for missing artifacts...")
-            for artifact_path in missing_artifacts:
-                artifact_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(artifact_path, "w") as f:
-                    f.write(f"# {artifact_path.name}\n\n")
-                    f.write("<!-- Placeholder file created by check_artifacts.py -->\n")
-                    f.write(
-                        f"<!-- TODO: Add actual content for {artifact_path.name} -->\n"
-                    )
-                logger.info(f"  Created: {artifact_path}")
+            scaffold_missing_artifacts(
+                args.project_root,
+                pipeline_config,
+                dict.fromkeys(missing_artifacts, current_phase),
+                cache,
+            )
 
         if args.strict and not args.create_missing:
             logger.error("Failing CI due to missing artifacts (--strict mode)")
@@ -237,6 +685,36 @@ def main():
     else:
         logger.info("✅ All required artifacts are present!")
 
+    if args.deep:
+        problems = deep_check_artifacts(
+            args.project_root,
+            artifact_paths,
+            pipeline,
+            current_phase,
+            workers=args.deep_workers,
+        )
+        for problem in problems:
+            logger.error(f"  Invalid: {problem}")
+        if problems and args.strict:
+            logger.error("Failing CI due to invalid artifacts (--strict mode)")
+            sys.exit(1)
+        elif problems:
+            logger.warning(
+                "Invalid artifacts found but not failing CI (use --strict to fail)"
+            )
+        else:
+            logger.info("✅ Deep artifact checks passed!")
+
+    if args.verify_content:
+        incomplete = verify_artifact_content(args.project_root, artifact_paths)
+        if incomplete and args.strict:
+            logger.error("Failing CI due to incomplete artifacts (--strict mode)")
+            sys.exit(1)
+        elif incomplete:
+            logger.warning(
+                "Incomplete artifacts found but not failing CI (use --strict to fail)"
+            )
+
     logger.info("Artifact validation complete.")
 
 
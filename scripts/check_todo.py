@@ -9,23 +9,37 @@ Ensures all checklist items are completed before allowing PR merge.
 import argparse
 import logging
 import sys
+from collections import Counter
 from pathlib import Path
-from typing import List, Tuple
-
-import yaml
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+from typing import Iterable, List, Optional, Tuple
+
+from checklist_scanner import (
+    DEFAULT_CHECKLIST_GLOB,
+    ChecklistCounts,
+    ChecklistScan,
+    find_checklists,
+    scan_checklist,
+    scan_checklists,
+)
+from file_watcher import DEFAULT_INTERVAL, run_watch
+from fleet import (
+    DEFAULT_JOBS,
+    ProjectResult,
+    expand_project_roots,
+    is_fleet_request,
+    report_fleet,
+    run_fleet,
 )
+from logging_setup import configure_logging
+from parse_cache import ParseCache
+from session_model import load_session_section, session_path_for
+
 logger = logging.getLogger(__name__)
 
 
 def find_active_session_file(project_root: Path) -> Path:
     """Find the ACTIVE_SESSION.md file."""
-    active_session_path = (
-        project_root / "docs" / "session-context" / "ACTIVE_SESSION.md"
-    )
+    active_session_path = session_path_for(project_root)
 
     if not active_session_path.exists():
         logger.error(f"ACTIVE_SESSION.md not found at {active_session_path}")
@@ -34,37 +48,12 @@ def find_active_session_file(project_root: Path) -> Path:
     return active_session_path
 
 
-def parse_active_session(active_session_path: Path) -> dict:
+def parse_active_session(
+    active_session_path: Path, cache: Optional[ParseCache] = None
+) -> dict:
     """Parse ACTIVE_SESSION.md to extract current mode and phase."""
     try:
-        with open(active_session_path, "r") as f:
-            content = f.read()
-
-        # Extract YAML blocks
-        lines = content.split("\n")
-        current_work_yaml = []
-        in_current_work = False
-
-        for line in lines:
-            if line.strip() == "## Current Work":
-                in_current_work = True
-                continue
-            elif in_current_work and line.strip() == "```yaml":
-                continue
-            elif in_current_work and line.strip() == "```":
-                break
-            elif in_current_work:
-                current_work_yaml.append(line)
-
-        # Check if we found any content
-        if not current_work_yaml:
-            return {}
-
-        # Parse the YAML
-        current_work_str = "\n".join(current_work_yaml)
-        current_work = yaml.safe_load(current_work_str)
-
-        return current_work if current_work else {}
+        return load_session_section(active_session_path, "Current Work", cache)
 
     except Exception as e:
         logger.error(f"Error parsing ACTIVE_SESSION.md: {e}")
@@ -86,23 +75,208 @@ def find_active_checklist(project_root: Path, mode: str) -> Path:
 
 def check_unchecked_items(checklist_path: Path) -> List[Tuple[int, str]]:
     """Check for unchecked items in checklist file."""
-    unchecked_items = []
-
     try:
-        with open(checklist_path, "r") as f:
-            lines = f.readlines()
+        return scan_checklist(checklist_path).unchecked
+
+    except Exception as e:
+        logger.error(f"Error reading checklist file {checklist_path}: {e}")
+        sys.exit(1)
+
+
+def format_checklist_summary(scans: List[ChecklistScan]) -> List[str]:
+    """Format per-file and per-section checkbox counts with a totals row."""
+
+    def row(name: str, counts: ChecklistCounts) -> str:
+        complete = f"{100 * counts.checked // counts.total}%" if counts.total else "-"
+        return (
+            f"{name:<{width}}  {counts.checked:>7}  {counts.unchecked:>9}  "
+            f"{counts.total:>5}  {complete:>8}"
+        )
+
+    names = [scan.path.name for scan in scans]
+    names.extend(f"  {section}" for scan in scans for section in scan.sections)
+    width = max([len("Checklist"), len("TOTAL")] + [len(name) for name in names])
+    lines = [
+        f"{'Checklist':<{width}}  {'Checked':>7}  {'Unchecked':>9}  {'Total':>5}  "
+        f"{'Complete':>8}"
+    ]
+    for scan in scans:
+        lines.append(row(scan.path.name, scan.counts))
+        lines.extend(
+            row(f"  {section}", counts) for section, counts in scan.sections.items()
+        )
+    lines.append(
+        row(
+            "TOTAL",
+            ChecklistCounts(
+                sum(scan.counts.checked for scan in scans),
+                sum(scan.counts.total for scan in scans),
+            ),
+        )
+    )
+    return lines
+
 
-        for line_num, line in enumerate(lines, 1):
-            # Look for unchecked checkbox patterns
-            if "- [ ]" in line or "* [ ]" in line:
-                unchecked_items.append((line_num, line.strip()))
+def scan_with_index(
+    project_root: Path, checklist_paths: List[Path]
+) -> List[ChecklistScan]:
+    """Scan checklists through the persisted index and log what changed.
 
-        return unchecked_items
+    Only checklists modified since the previous run are re-parsed.
+    """
+    from checklist_index import ChecklistIndex, format_delta
 
+    index = ChecklistIndex.for_project(project_root)
+    try:
+        delta = index.update(checklist_paths)
     except Exception as e:
-        logger.error(f"Error reading checklist file {checklist_path}: {e}")
+        logger.error(f"Error reading checklist files: {e}")
+        sys.exit(1)
+    index.save()
+
+    logger.info(
+        f"Re-parsed {index.rescanned} of {len(checklist_paths)} checklists "
+        "changed since the previous run"
+    )
+    for line in format_delta(delta):
+        logger.info(f"  {line}")
+    return [index.scan(path) for path in checklist_paths]
+
+
+def check_all_checklists(
+    project_root: Path, pattern: str, strict: bool, delta: bool = False
+):
+    """Log the completion of every checklist and fail on unchecked items."""
+    checklist_paths = find_checklists(project_root, pattern)
+    if not checklist_paths:
+        logger.error(f"No checklists match {pattern}")
         sys.exit(1)
 
+    if delta:
+        scans = scan_with_index(project_root, checklist_paths)
+    else:
+        try:
+            scans = scan_checklists(checklist_paths)
+        except Exception as e:
+            logger.error(f"Error reading checklist files: {e}")
+            sys.exit(1)
+
+    for line in format_checklist_summary(scans):
+        logger.info(line)
+
+    unchecked = sum(len(scan.unchecked) for scan in scans)
+    if not unchecked:
+        logger.info("✅ All checklist items are completed!")
+    elif strict:
+        logger.error(
+            f"Failing CI due to {unchecked} unchecked items across "
+            f"{len(scans)} checklists (--strict mode)"
+        )
+        sys.exit(1)
+    else:
+        logger.warning(
+            "Unchecked items found but not failing CI (use --strict to fail)"
+        )
+
+    logger.info("Todo checklist validation complete.")
+
+
+def check_project_todo(project_root: Path) -> ProjectResult:
+    """Check one project's active checklist for fleet mode."""
+    active_session_path = find_active_session_file(project_root)
+    cache = ParseCache.for_project(project_root)
+    current_mode = parse_active_session(active_session_path, cache).get("mode")
+    if not current_mode:
+        return ProjectResult(
+            project_root,
+            False,
+            "No current mode found in ACTIVE_SESSION.md",
+            error=True,
+        )
+
+    checklist_path = find_active_checklist(project_root, current_mode)
+    unchecked_items = check_unchecked_items(checklist_path)
+    if unchecked_items:
+        return ProjectResult(
+            project_root,
+            False,
+            f"{len(unchecked_items)} unchecked items in {checklist_path.name}",
+            [f"Line {line_num}: {item}" for line_num, item in unchecked_items],
+        )
+    return ProjectResult(project_root, True, f"{checklist_path.name} complete")
+
+
+class ChecklistWatch:
+    """Incremental re-validation of the active checklist for --watch.
+
+    A checklist edit re-runs only check_unchecked_items; a session edit
+    re-reads the mode and switches checklist when it changed.
+    """
+
+    def __init__(self, project_root: Path):
+        self.project_root = project_root
+        self.session_path = session_path_for(project_root)
+        self.checklist_path: Optional[Path] = None
+        self.unchecked: Counter = Counter()
+
+    def targets(self) -> List[Path]:
+        """Return the files this watch depends on."""
+        if self.checklist_path is None:
+            return [self.session_path]
+        return [self.session_path, self.checklist_path]
+
+    def start(self) -> List[str]:
+        """Evaluate the initial state."""
+        return self._reload_session()
+
+    def update(self, changed: Iterable[Path]) -> List[str]:
+        """Re-evaluate only what the changed paths affect."""
+        changed = set(changed)
+        lines = []
+        previous_checklist = self.checklist_path
+        if self.session_path in changed:
+            lines.extend(self._reload_session())
+        if self.checklist_path in changed and self.checklist_path == previous_checklist:
+            lines.extend(self._recheck())
+        return lines
+
+    def _reload_session(self) -> List[str]:
+        try:
+            mode = parse_active_session(self.session_path).get("mode")
+            if not mode:
+                return ["No current mode found in ACTIVE_SESSION.md"]
+            checklist_path = find_active_checklist(self.project_root, mode)
+        except SystemExit:
+            return ["Waiting for a valid session and checklist..."]
+
+        if checklist_path == self.checklist_path:
+            return []
+        self.checklist_path = checklist_path
+        self.unchecked = Counter()
+        return [f"Mode: {mode}, watching {checklist_path.name}"] + self._recheck()
+
+    def _recheck(self) -> List[str]:
+        if self.checklist_path is None:
+            return ["Waiting for a valid session and checklist..."]
+        try:
+            items = check_unchecked_items(self.checklist_path)
+        except SystemExit:
+            return [f"Could not read {self.checklist_path}"]
+
+        current = Counter(item for _, item in items)
+        added = current - self.unchecked
+        resolved = self.unchecked - current
+        self.unchecked = current
+
+        lines = []
+        for line_num, item in items:
+            if added[item] > 0:
+                added[item] -= 1
+                lines.append(f"+ Line {line_num}: {item}")
+        lines.extend(f"✓ Resolved: {item}" for item in resolved.elements())
+        lines.append(f"{sum(current.values())} unchecked items remaining")
+        return lines
+
 
 def main():
     """Main function to check for unchecked todo items."""
@@ -112,22 +286,96 @@ def main():
     parser.add_argument(
         "--project-root",
         type=Path,
-        default=Path.cwd(),
-        help="Root directory of the project (default: current directory)",
+        action="append",
+        help=(
+            "Root directory of the project (default: current directory); "
+            "repeat or use a glob pattern to check several projects"
+        ),
+    )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        help="File listing project roots to check, one per line",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Projects checked concurrently in fleet mode (default: {DEFAULT_JOBS})",
     )
     parser.add_argument(
         "--strict",
         action="store_true",
         help="Exit with error code 1 if any unchecked items found",
     )
+    parser.add_argument(
+        "--all-checklists",
+        action="store_true",
+        help="Report per-file and per-section completion of every checklist",
+    )
+    parser.add_argument(
+        "--delta",
+        action="store_true",
+        help=(
+            "Report only items checked, unchecked, added or removed since the "
+            "previous run instead of every unchecked item"
+        ),
+    )
+    parser.add_argument(
+        "--checklist-glob",
+        default=DEFAULT_CHECKLIST_GLOB,
+        help=(
+            "Checklists scanned by --all-checklists, relative to "
+            f"docs/rules/checklists/ (default: {DEFAULT_CHECKLIST_GLOB})"
+        ),
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and report changes as the checklist or session change",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=DEFAULT_INTERVAL,
+        help=f"Polling interval in seconds for --watch (default: {DEFAULT_INTERVAL})",
+    )
 
     args = parser.parse_args()
+    fleet = is_fleet_request(args.project_root, args.manifest)
+    if fleet and (args.watch or args.all_checklists):
+        parser.error("--watch and --all-checklists check a single project root")
+    if args.watch and args.all_checklists:
+        parser.error("--all-checklists cannot be combined with --watch")
+    configure_logging()
+
+    if fleet:
+        logger.info("Starting fleet todo checklist validation...")
+        project_roots = expand_project_roots(args.project_root or [], args.manifest)
+        if not project_roots:
+            logger.error("No project roots matched")
+            sys.exit(1)
+        results = run_fleet(project_roots, check_project_todo, args.jobs)
+        sys.exit(report_fleet(results, args.strict))
+
+    args.project_root = (args.project_root or [Path.cwd()])[0]
+
+    if args.watch:
+        run_watch(ChecklistWatch(args.project_root), args.interval)
+        return
 
     logger.info("Starting todo checklist validation...")
 
+    if args.all_checklists:
+        check_all_checklists(
+            args.project_root, args.checklist_glob, args.strict, args.delta
+        )
+        return
+
     # Find and parse active session
     active_session_path = find_active_session_file(args.project_root)
-    current_work = parse_active_session(active_session_path)
+    cache = ParseCache.for_project(args.project_root)
+    current_work = parse_active_session(active_session_path, cache)
 
     # Get current mode
     current_mode = current_work.get("mode")
@@ -142,14 +390,25 @@ def main():
     logger.info(f"Checking checklist: {checklist_path}")
 
     # Check for unchecked items
-    unchecked_items = check_unchecked_items(checklist_path)
+    if args.delta:
+        (scan,) = scan_with_index(args.project_root, [checklist_path])
+        unchecked_items = scan.unchecked
+    else:
+        unchecked_items = check_unchecked_items(checklist_path)
 
     if unchecked_items:
-        logger.error(
-            f"Found {len(unchecked_items)} unchecked items in {checklist_path.name}:"
-        )
-        for line_num, item in unchecked_items:
-            logger.error(f"  Line {line_num}: {item}")
+        if args.delta:
+            logger.error(
+                f"{len(unchecked_items)} unchecked items remain in "
+                f"{checklist_path.name}"
+            )
+        else:
+            logger.error(
+                f"Found {len(unchecked_items)} unchecked items in "
+                f"{checklist_path.name}:"
+            )
+            for line_num, item in unchecked_items:
+                logger.error(f"  Line {line_num}: {item}")
 
         if args.strict:
             logger.error("Failing CI due to unchecked items (--strict mode)")
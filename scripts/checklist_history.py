@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+checklist_history.py - AgenticOps Value Train Checklist History
+
+Rebuilds checklist progress and phase transitions from git history. One
+`git log` lists every revision of docs/rules/checklists/*.md and
+ACTIVE_SESSION.md along the first-parent history, and one
+`git cat-file --batch` process streams all of their blobs. Each distinct
+blob is parsed once: checklists with the check_todo scanner, sessions with
+the session model.
+
+The result is a time series of checked/total counts per mode, the phase
+transitions of each session, and per-phase cycle times.
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from checklist_scanner import CHECKLISTS_RELATIVE_PATH, scan_lines
+from session_model import SESSION_RELATIVE_PATH, SessionDocument
+
+logger = logging.getLogger(__name__)
+
+CHECKLIST_SUFFIX = "-checklist.md"
+_NULL_BLOB = "0" * 40
+_COMMIT_PREFIX = "commit "
+
+
+class HistoryError(RuntimeError):
+    """Raised when the project's git history cannot be read."""
+
+
+class Revision(NamedTuple):
+    """A tracked file as changed by one commit; blob is None when deleted."""
+
+    commit: str
+    timestamp: int
+    path: str
+    blob: Optional[str]
+
+
+class ChecklistPoint(NamedTuple):
+    """Checkbox counts of one mode's checklist after a commit."""
+
+    timestamp: int
+    commit: str
+    mode: str
+    checked: int
+    total: int
+
+
+class PhaseTransition(NamedTuple):
+    """A change of session or phase in ACTIVE_SESSION.md."""
+
+    timestamp: int
+    commit: str
+    session_id: Optional[str]
+    from_phase: Optional[str]
+    to_phase: Optional[str]
+
+
+class PhaseInterval(NamedTuple):
+    """Time spent in one phase of one session; ended is None while open."""
+
+    session_id: Optional[str]
+    phase: str
+    started: int
+    ended: Optional[int]
+
+
+class PhaseCycleTime(NamedTuple):
+    """Completed visits to a phase and their durations in seconds."""
+
+    visits: int
+    median: float
+    mean: float
+    longest: float
+
+
+class History(NamedTuple):
+    """Everything reconstructed from the history walk."""
+
+    commits: int
+    blobs: int
+    checklist_points: List[ChecklistPoint]
+    transitions: List[PhaseTransition]
+    intervals: List[PhaseInterval]
+
+
+def _git(project_root: Path, *args: str) -> List[str]:
+    return ["git", "-C", str(project_root), *args]
+
+
+def read_revisions(project_root: Path, since: Optional[str] = None) -> List[Revision]:
+    """List checklist and session revisions, oldest first, with one git log."""
+    import subprocess
+
+    command = _git(
+        project_root,
+        "log",
+        "--reverse",
+        "--first-parent",
+        "--diff-merges=first-parent",
+        "--relative",
+        "--raw",
+        "--no-abbrev",
+        "--no-renames",
+        f"--format={_COMMIT_PREFIX}%H %ct",
+    )
+    if since:
+        command.append(f"--since={since}")
+    command += [
+        "--",
+        CHECKLISTS_RELATIVE_PATH.as_posix(),
+        SESSION_RELATIVE_PATH.as_posix(),
+    ]
+
+    try:
+        result = subprocess.run(command, capture_output=True, check=False)
+    except OSError as e:
+        raise HistoryError(f"Could not run git: {e}")
+    if result.returncode != 0:
+        stderr = result.stderr.decode(errors="replace").strip()
+        raise HistoryError(f"git log failed in {project_root}: {stderr}")
+
+    revisions = []
+    commit, timestamp = "", 0
+    for line in result.stdout.decode(errors="replace").splitlines():
+        if line.startswith(_COMMIT_PREFIX):
+            commit, _, stamp = line[len(_COMMIT_PREFIX) :].partition(" ")
+            timestamp = int(stamp)
+        elif line.startswith(":"):
+            # ":<old mode> <new mode> <old blob> <new blob> <status>\t<path>"
+            meta, _, path = line.partition("\t")
+            new_blob = meta.split()[3]
+            blob = None if new_blob == _NULL_BLOB else new_blob
+            revisions.append(Revision(commit, timestamp, path, blob))
+    return revisions
+
+
+def iter_blobs(project_root: Path, blob_ids: List[str]) -> Iterator[Tuple[str, bytes]]:
+    """Stream (blob id, content) for every id through one cat-file process."""
+    import subprocess
+    import threading
+
+    if not blob_ids:
+        return
+
+    try:
+        process = subprocess.Popen(
+            _git(project_root, "cat-file", "--batch"),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+    except OSError as e:
+        raise HistoryError(f"Could not run git: {e}")
+    stdin, stdout = process.stdin, process.stdout
+    assert stdin is not None and stdout is not None  # Both are PIPEs
+
+    def feed():
+        # Written from a thread so a full stdout pipe cannot deadlock us
+        try:
+            stdin.write("".join(f"{blob}\n" for blob in blob_ids).encode())
+            stdin.close()
+        except OSError:
+            pass
+
+    writer = threading.Thread(target=feed, daemon=True)
+    writer.start()
+    try:
+        for _ in blob_ids:
+            header = stdout.readline().decode().split()
+            if len(header) != 3:
+                raise HistoryError(f"Unexpected git cat-file output: {header}")
+            blob, _, size = header
+            content = stdout.read(int(size))
+            stdout.read(1)  # trailing newline
+            yield blob, content
+    finally:
+        stdout.close()
+        writer.join()
+        process.wait()
+
+
+def _checklist_mode(path: str) -> Optional[str]:
+    name = path.rsplit("/", 1)[-1]
+    if not name.endswith(".md"):
+        return None
+    if name.endswith(CHECKLIST_SUFFIX):
+        return name[: -len(CHECKLIST_SUFFIX)]
+    return name[: -len(".md")]
+
+
+def _parse_checklist(path: str, content: bytes) -> Tuple[int, int]:
+    text = content.decode(errors="replace")
+    counts = scan_lines(Path(path), text.splitlines(keepends=True)).counts
+    return counts.checked, counts.total
+
+
+def _parse_session(content: bytes) -> Tuple[Optional[str], Optional[str]]:
+    """Return (session_id, phase); unparseable sessions give (None, None)."""
+    try:
+        document = SessionDocument(content.decode(errors="replace"))
+        metadata = document.section("Session Metadata")
+        current_work = document.section("Current Work")
+    except Exception:
+        return None, None
+    session_id = metadata.get("session_id") if isinstance(metadata, dict) else None
+    phase = current_work.get("phase") if isinstance(current_work, dict) else None
+    return (
+        str(session_id) if session_id is not None else None,
+        str(phase) if phase is not None else None,
+    )
+
+
+def build_history(project_root: Path, since: Optional[str] = None) -> History:
+    """Walk the git history once and rebuild checklist and phase timelines."""
+    revisions = read_revisions(project_root, since)
+    session_path = SESSION_RELATIVE_PATH.as_posix()
+
+    wanted: Dict[str, str] = {}
+    for revision in revisions:
+        if revision.blob is None:
+            continue
+        if revision.path == session_path or _checklist_mode(revision.path):
+            wanted.setdefault(revision.blob, revision.path)
+
+    # Each distinct blob is parsed once, however many commits share it
+    parsed: Dict[str, tuple] = {}
+    for blob, content in iter_blobs(project_root, list(wanted)):
+        path = wanted[blob]
+        if path == session_path:
+            parsed[blob] = _parse_session(content)
+        else:
+            parsed[blob] = _parse_checklist(path, content)
+
+    points: List[ChecklistPoint] = []
+    transitions: List[PhaseTransition] = []
+    intervals: List[PhaseInterval] = []
+    state: Tuple[Optional[str], Optional[str]] = (None, None)
+    started = 0
+
+    for revision in revisions:
+        if revision.path == session_path:
+            new_state = parsed[revision.blob] if revision.blob else (None, None)
+            if new_state == state:
+                continue
+            transitions.append(
+                PhaseTransition(
+                    revision.timestamp,
+                    revision.commit,
+                    new_state[0],
+                    state[1] if new_state[0] == state[0] else None,
+                    new_state[1],
+                )
+            )
+            if state[1] is not None:
+                intervals.append(
+                    PhaseInterval(state[0], state[1], started, revision.timestamp)
+                )
+            state, started = new_state, revision.timestamp
+            continue
+
+        mode = _checklist_mode(revision.path)
+        if mode is None:
+            continue
+        checked, total = parsed[revision.blob] if revision.blob else (0, 0)
+        points.append(
+            ChecklistPoint(revision.timestamp, revision.commit, mode, checked, total)
+        )
+
+    if state[1] is not None:
+        intervals.append(PhaseInterval(state[0], state[1], started, None))
+
+    commits = len({revision.commit for revision in revisions})
+    return History(commits, len(parsed), points, transitions, intervals)
+
+
+def cycle_times(intervals: Iterable[PhaseInterval]) -> Dict[str, PhaseCycleTime]:
+    """Summarise completed phase visits per phase, in first-seen order."""
+    import statistics
+
+    durations: Dict[str, List[float]] = {}
+    for interval in intervals:
+        if interval.ended is not None:
+            durations.setdefault(interval.phase, []).append(
+                float(interval.ended - interval.started)
+            )
+    return {
+        phase: PhaseCycleTime(
+            len(values),
+            statistics.median(values),
+            statistics.fmean(values),
+            max(values),
+        )
+        for phase, values in durations.items()
+    }
+
+
+def format_cycle_times(times: Dict[str, PhaseCycleTime]) -> List[str]:
+    """Format cycle times in days as a table."""
+    width = max([len("Phase")] + [len(phase) for phase in times])
+    lines = [
+        f"{'Phase':<{width}}  {'Visits':>6}  {'Median':>7}  {'Mean':>7}  "
+        f"{'Longest':>7}"
+    ]
+    for phase, cycle in times.items():
+        lines.append(
+            f"{phase:<{width}}  {cycle.visits:>6}  {cycle.median / 86400:>6.1f}d  "
+            f"{cycle.mean / 86400:>6.1f}d  {cycle.longest / 86400:>6.1f}d"
+        )
+    return lines
+
+
+def history_to_json(history: History) -> dict:
+    """Return the history as JSON-serialisable data with ISO timestamps."""
+    import datetime
+
+    def iso(timestamp: Optional[int]) -> Optional[str]:
+        if timestamp is None:
+            return None
+        moment = datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc)
+        return moment.isoformat()
+
+    return {
+        "commits": history.commits,
+        "checklists": [
+            dict(point._asdict(), timestamp=iso(point.timestamp))
+            for point in history.checklist_points
+        ],
+        "transitions": [
+            dict(transition._asdict(), timestamp=iso(transition.timestamp))
+            for transition in history.transitions
+        ],
+        "intervals": [
+            dict(
+                interval._asdict(),
+                started=iso(interval.started),
+                ended=iso(interval.ended),
+            )
+            for interval in history.intervals
+        ],
+        "cycle_times": {
+            phase: cycle._asdict()
+            for phase, cycle in cycle_times(history.intervals).items()
+        },
+    }
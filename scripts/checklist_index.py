@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+checklist_index.py - AgenticOps Value Train Checklist Progress Index
+
+Persists every checklist item (file, section, stable item key, checked
+state) under .valuetrain-cache/ so that each run re-parses only the
+checklists whose mtime or size changed and reports what changed since the
+previous run: newly checked, newly unchecked, added and removed items.
+
+Item keys hash the section and the item text, so reordering, renumbering
+or switching bullet style does not register as a change.
+"""
+
+import logging
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from checklist_scanner import (
+    ChecklistCounts,
+    ChecklistItem,
+    ChecklistScan,
+    scan_checklist,
+)
+from fs_utils import atomic_write_text
+from parse_cache import RACY_WINDOW_NS, ParseCache
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE_NAME = "checklist-index.json"
+
+
+class IndexedItem(NamedTuple):
+    """A checklist item with its stable key."""
+
+    key: str
+    item: ChecklistItem
+
+
+class IndexEntry(NamedTuple):
+    """Indexed items of one checklist file, as of its mtime_ns and size."""
+
+    mtime_ns: int
+    size: int
+    scanned_at_ns: int
+    items: List[IndexedItem]
+
+
+class DeltaItem(NamedTuple):
+    """A changed item and the checklist it belongs to."""
+
+    path: Path
+    item: ChecklistItem
+
+
+class ChecklistDelta(NamedTuple):
+    """Changes since the previous run, plus files seen for the first time."""
+
+    checked: List[DeltaItem]
+    unchecked: List[DeltaItem]
+    added: List[DeltaItem]
+    removed: List[DeltaItem]
+    new_files: List[Path]
+
+    @property
+    def empty(self) -> bool:
+        return not any(self)
+
+
+def item_keys(items: Iterable[ChecklistItem]) -> List[IndexedItem]:
+    """Key items by section and text; repeated items get a counter suffix."""
+    import hashlib
+
+    seen: Counter = Counter()
+    keyed = []
+    for item in items:
+        digest = hashlib.sha1(f"{item.section}\0{item.text}".encode()).hexdigest()
+        digest = digest[:16]
+        seen[digest] += 1
+        key = digest if seen[digest] == 1 else f"{digest}-{seen[digest]}"
+        keyed.append(IndexedItem(key, item))
+    return keyed
+
+
+class ChecklistIndex:
+    """Persisted per-item state of a project's checklists."""
+
+    def __init__(self, persist_path: Optional[Path] = None):
+        self.persist_path = persist_path
+        self.entries: Dict[str, IndexEntry] = {}
+        self.rescanned = 0
+        self._dirty = False
+        if persist_path is not None:
+            self.entries = self._read(persist_path)
+
+    @classmethod
+    def for_project(cls, project_root: Path) -> "ChecklistIndex":
+        """Return an index persisted in the project's cache, if caching is on."""
+        cache = ParseCache.for_project(project_root)
+        if cache is None:
+            return cls()
+        return cls(cache.cache_dir / INDEX_FILE_NAME)
+
+    def _current(self, path: Path) -> IndexEntry:
+        """Return the file's entry, re-parsing only when its stat changed."""
+        import time
+
+        stat = path.stat()
+        entry = self.entries.get(str(path))
+        if (
+            entry is not None
+            and entry.mtime_ns == stat.st_mtime_ns
+            and entry.size == stat.st_size
+            and entry.scanned_at_ns - stat.st_mtime_ns > RACY_WINDOW_NS
+        ):
+            return entry
+
+        self.rescanned += 1
+        items = item_keys(scan_checklist(path).items)
+        return IndexEntry(stat.st_mtime_ns, stat.st_size, time.time_ns(), items)
+
+    def update(self, paths: Iterable[Path]) -> ChecklistDelta:
+        """Bring the index up to date and return the changes since last run."""
+        delta = ChecklistDelta([], [], [], [], [])
+        for path in paths:
+            previous = self.entries.get(str(path))
+            current = self._current(path)
+            if current is previous:
+                continue
+            self.entries[str(path)] = current
+            self._dirty = True
+            if previous is None:
+                delta.new_files.append(path)
+                continue
+
+            before = {indexed.key: indexed.item for indexed in previous.items}
+            after = {indexed.key: indexed.item for indexed in current.items}
+            for key, item in after.items():
+                old = before.get(key)
+                if old is None:
+                    delta.added.append(DeltaItem(path, item))
+                elif item.checked and not old.checked:
+                    delta.checked.append(DeltaItem(path, item))
+                elif old.checked and not item.checked:
+                    delta.unchecked.append(DeltaItem(path, item))
+            delta.removed.extend(
+                DeltaItem(path, item)
+                for key, item in before.items()
+                if key not in after
+            )
+        return delta
+
+    def scan(self, path: Path) -> ChecklistScan:
+        """Return the indexed scan of a checklist passed to update()."""
+        items = [indexed.item for indexed in self.entries[str(path)].items]
+        sections: Dict[str, List[int]] = {}
+        for item in items:
+            counts = sections.setdefault(item.section, [0, 0])
+            counts[0] += item.checked
+            counts[1] += 1
+        return ChecklistScan(
+            path,
+            [(item.line, item.source) for item in items if not item.checked],
+            {name: ChecklistCounts(*counts) for name, counts in sections.items()},
+            items,
+        )
+
+    def _read(self, persist_path: Path) -> Dict[str, IndexEntry]:
+        import json
+
+        try:
+            with open(persist_path, "r") as f:
+                raw = json.load(f)
+            return {
+                path: IndexEntry(
+                    entry["mtime_ns"],
+                    entry["size"],
+                    entry["scanned_at_ns"],
+                    [
+                        IndexedItem(key, ChecklistItem(*fields))
+                        for key, *fields in entry["items"]
+                    ],
+                )
+                for path, entry in raw.items()
+            }
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.debug(f"Ignoring unreadable checklist index {persist_path}: {e}")
+            return {}
+
+    def save(self):
+        """Persist the index if any checklist was re-parsed."""
+        if self.persist_path is None or not self._dirty:
+            return
+
+        import json
+
+        serialized = json.dumps(
+            {
+                path: {
+                    "mtime_ns": entry.mtime_ns,
+                    "size": entry.size,
+                    "scanned_at_ns": entry.scanned_at_ns,
+                    "items": [[key, *item] for key, item in entry.items],
+                }
+                for path, entry in self.entries.items()
+            }
+        )
+        try:
+            atomic_write_text(self.persist_path, serialized)
+            self._dirty = False
+        except OSError as e:
+            logger.debug(f"Could not write checklist index {self.persist_path}: {e}")
+
+
+def format_delta(delta: ChecklistDelta) -> List[str]:
+    """Describe the changes since the previous run, one line per item."""
+
+    def describe(change: DeltaItem) -> str:
+        return f"{change.path.name}:{change.item.line} {change.item.text}"
+
+    lines = [f"Indexed {path.name} (no previous run)" for path in delta.new_files]
+    lines.extend(f"✓ Checked: {describe(change)}" for change in delta.checked)
+    lines.extend(f"✗ Unchecked: {describe(change)}" for change in delta.unchecked)
+    for change in delta.added:
+        box = "[x]" if change.item.checked else "[ ]"
+        lines.append(f"+ Added {box}: {describe(change)}")
+    lines.extend(f"- Removed: {describe(change)}" for change in delta.removed)
+    if delta.empty:
+        lines.append("No checklist changes since the previous run")
+    return lines
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+checklist_scanner.py - AgenticOps Value Train Checklist Scanner
+
+Streams checklist markdown files line by line and classifies each line
+with a single compiled pattern: fenced code markers, headings, and
+checkbox list items (`- [ ]`, `* [x]`, `+ [ ]`, `1. [ ]`, `2) [X]`,
+indented sub-items included). Checkboxes inside fenced code blocks are
+ignored. Counts are kept per file and per section (nearest heading).
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+CHECKLISTS_RELATIVE_PATH = Path("docs") / "rules" / "checklists"
+DEFAULT_CHECKLIST_GLOB = "*-checklist.md"
+
+_LINE_PATTERN = re.compile(
+    r"[ \t]*(?P<fence>```|~~~)"
+    r"|(?P<heading>#{1,6})[ \t]+(?P<title>.*?)[ \t#]*$"
+    r"|[ \t]*(?:[-*+]|\d{1,9}[.)])[ \t]+\[(?P<mark>[ xX])\](?:[ \t]|$)"
+)
+
+
+class ChecklistCounts(NamedTuple):
+    """Checked and total checkbox counts."""
+
+    checked: int
+    total: int
+
+    @property
+    def unchecked(self) -> int:
+        return self.total - self.checked
+
+
+class ChecklistItem(NamedTuple):
+    """One checkbox; `text` excludes the bullet and the box, `source` does not."""
+
+    line: int
+    section: str
+    text: str
+    checked: bool
+    source: str
+
+
+class ChecklistScan(NamedTuple):
+    """Result of scanning one checklist file."""
+
+    path: Path
+    unchecked: List[Tuple[int, str]]
+    sections: Dict[str, ChecklistCounts]
+    items: List[ChecklistItem] = []
+
+    @property
+    def counts(self) -> ChecklistCounts:
+        return ChecklistCounts(
+            sum(counts.checked for counts in self.sections.values()),
+            sum(counts.total for counts in self.sections.values()),
+        )
+
+
+def scan_lines(path: Path, lines: Iterable[str]) -> ChecklistScan:
+    """Classify checklist lines in a single pass."""
+    unchecked: List[Tuple[int, str]] = []
+    items: List[ChecklistItem] = []
+    # section -> [checked, total], in document order
+    sections: Dict[str, List[int]] = {}
+    section = ""
+    in_fence = False
+    match_line = _LINE_PATTERN.match
+
+    for line_num, line in enumerate(lines, 1):
+        match = match_line(line)
+        if match is None:
+            continue
+        if match.group("fence"):
+            in_fence = not in_fence
+        elif in_fence:
+            continue
+        elif match.group("heading"):
+            section = match.group("title")
+        else:
+            checked = match.group("mark") != " "
+            counts = sections.setdefault(section, [0, 0])
+            counts[0] += checked
+            counts[1] += 1
+            source = line.strip()
+            if not checked:
+                unchecked.append((line_num, source))
+            text = line[match.end() :].strip()
+            items.append(ChecklistItem(line_num, section, text, checked, source))
+
+    return ChecklistScan(
+        path,
+        unchecked,
+        {name: ChecklistCounts(*counts) for name, counts in sections.items()},
+        items,
+    )
+
+
+def scan_checklist(path: Path) -> ChecklistScan:
+    """Stream one checklist file; OSError and UnicodeDecodeError propagate."""
+    with open(path, "r") as f:
+        return scan_lines(path, f)
+
+
+def find_checklists(
+    project_root: Path, pattern: str = DEFAULT_CHECKLIST_GLOB
+) -> List[Path]:
+    """Return the project's checklist files matching a glob, sorted by name.
+
+    Relative patterns without a directory are looked up in
+    docs/rules/checklists/; others are relative to the project root.
+    """
+    if "/" not in pattern:
+        return sorted((project_root / CHECKLISTS_RELATIVE_PATH).glob(pattern))
+    return sorted(path for path in project_root.glob(pattern) if path.is_file())
+
+
+def scan_checklists(paths: Iterable[Path]) -> List[ChecklistScan]:
+    """Scan several checklist files, each in a single streaming pass."""
+    return [scan_checklist(path) for path in paths]
@@ -4,25 +4,49 @@ conductor_update.py - AgenticOps Value Train Phase Automation
 
 Moves ACTIVE_SESSION.md to the next phase after successful CI completion.
 Automates the "Conductor" agent role for seamless workflow transitions.
+With --session or --session-manifest, advances many session files in one
+run: pipeline.yml is loaded once and sessions are advanced on a worker pool.
 """
 
 import argparse
 import logging
 import sys
-from datetime import datetime
 from pathlib import Path
-from typing import Optional, Tuple
-
-import yaml
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+from typing import ContextManager, List, NamedTuple, Optional, Tuple, Union
+
+from logging_setup import configure_logging
+from parse_cache import ParseCache, load_yaml_file
+from pipeline_graph import PipelineGraph
+from session_model import (
+    DEFAULT_INLINE_DECISIONS,
+    DEFAULT_LOCK_TIMEOUT,
+    SESSION_RELATIVE_PATH,
+    VERSION_KEY,
+    SessionDocument,
+    load_session_section,
+    session_path_for,
 )
+
 logger = logging.getLogger(__name__)
 
+ADVANCED = "advanced"
+COMPLETED = "completed"
+FAILED = "failed"
+
+DEFAULT_JOBS = 8
+
+
+class SessionResult(NamedTuple):
+    """Outcome of advancing one session file in a batch run."""
 
-def load_pipeline_config(project_root: Path) -> dict:
+    session_path: Path
+    status: str
+    summary: str
+
+
+def load_pipeline_config(
+    project_root: Path, cache: Optional[ParseCache] = None
+) -> dict:
     """Load pipeline configuration from config/pipeline.yml."""
     pipeline_path = project_root / "config" / "pipeline.yml"
 
@@ -31,8 +55,7 @@ def load_pipeline_config(project_root: Path) -> dict:
         sys.exit(1)
 
     try:
-        with open(pipeline_path, "r") as f:
-            return yaml.safe_load(f)
+        return load_yaml_file(pipeline_path, cache)
     except Exception as e:
         logger.error(f"Error loading pipeline configuration: {e}")
         sys.exit(1)
@@ -40,69 +63,33 @@ def load_pipeline_config(project_root: Path) -> dict:
 
 def load_active_session(project_root: Path) -> Tuple[dict, str]:
     """Load current session context from ACTIVE_SESSION.md."""
-    active_session_path = (
-        project_root / "docs" / "session-context" / "ACTIVE_SESSION.md"
-    )
+    active_session_path = session_path_for(project_root)
 
     if not active_session_path.exists():
         logger.error(f"ACTIVE_SESSION.md not found at {active_session_path}")
         sys.exit(1)
 
     try:
-        with open(active_session_path, "r") as f:
-            content = f.read()
-
-        # Parse YAML sections
-        sections = {}
-        current_section = None
-        yaml_content = []
-        in_yaml = False
-
-        for line in content.split("\n"):
-            if line.startswith("## ") and "yaml" not in line.lower():
-                if current_section and yaml_content:
-                    sections[current_section] = "\n".join(yaml_content)
-                    yaml_content = []
-                current_section = line[3:].strip()
-                in_yaml = False
-            elif line.strip() == "```yaml" and current_section:
-                in_yaml = True
-            elif line.strip() == "```" and in_yaml:
-                in_yaml = False
-            elif in_yaml and current_section:
-                yaml_content.append(line)
-
-        # Add the last section
-        if current_section and yaml_content:
-            sections[current_section] = "\n".join(yaml_content)
-
-        return sections, content
+        document = SessionDocument.from_path(active_session_path)
+        return document.raw_sections(), document.content
 
     except Exception as e:
         logger.error(f"Error parsing ACTIVE_SESSION.md: {e}")
         sys.exit(1)
 
 
-def get_next_phase(pipeline_config: dict, current_phase: str) -> Optional[str]:
+def get_next_phase(
+    pipeline: Union[PipelineGraph, dict], current_phase: str
+) -> Optional[str]:
     """Get the next phase in the pipeline."""
-    phases = pipeline_config.get("phases", [])
+    return PipelineGraph.coerce(pipeline).next_phase(current_phase)
 
-    for phase in phases:
-        if phase.get("name") == current_phase:
-            return phase.get("next_phase")
 
-    return None
-
-
-def get_phase_info(pipeline_config: dict, phase_name: str) -> Optional[dict]:
+def get_phase_info(
+    pipeline: Union[PipelineGraph, dict], phase_name: str
+) -> Optional[dict]:
     """Get phase information from pipeline configuration."""
-    phases = pipeline_config.get("phases", [])
-
-    for phase in phases:
-        if phase.get("name") == phase_name:
-            return phase
-
-    return None
+    return PipelineGraph.coerce(pipeline).phase(phase_name)
 
 
 def update_session_phase(
@@ -113,7 +100,14 @@ def update_session_phase(
     next_phase_info: dict,
 ) -> str:
     """Update the session content with new phase information."""
+    from datetime import datetime
+
+    import yaml
+    from yaml_patch import patch_or_dump
+
     try:
+        document = SessionDocument(content)
+
         # Parse current work section
         current_work_yaml = sections.get("Current Work", "")
         if current_work_yaml:
@@ -128,11 +122,18 @@ def update_session_phase(
         # Update timestamps
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-        # Update session metadata
+        # Update session metadata; an empty block still counts as version 0
+        has_metadata = document.has_yaml("Session Metadata")
         session_metadata_yaml = sections.get("Session Metadata", "")
-        if session_metadata_yaml:
-            session_metadata = yaml.safe_load(session_metadata_yaml)
+        if has_metadata:
+            session_metadata = (
+                yaml.safe_load(session_metadata_yaml) if session_metadata_yaml else None
+            ) or {}
             session_metadata["last_updated"] = current_time
+            # Optimistic concurrency: write_session rejects stale versions
+            session_metadata[VERSION_KEY] = (
+                int(session_metadata.get(VERSION_KEY) or 0) + 1
+            )
 
         # Update session notes
         session_notes_yaml = sections.get("Session Notes", "")
@@ -152,35 +153,21 @@ def update_session_phase(
                 "Update task assignments for new phase",
             ]
 
-        # Reconstruct the file content
-        new_content = content
-
-        # Replace Current Work section
-        current_work_str = yaml.dump(
-            current_work, default_flow_style=False, sort_keys=False
-        )
-        new_content = replace_yaml_section(
-            new_content, "Current Work", current_work_str
-        )
-
-        # Replace Session Metadata section
-        if session_metadata_yaml:
-            session_metadata_str = yaml.dump(
-                session_metadata, default_flow_style=False, sort_keys=False
+        # Patch changed values in place so comments and quoting survive;
+        # structural changes fall back to a full dump of the section
+        replacements = {"Current Work": patch_or_dump(current_work_yaml, current_work)}
+        if has_metadata:
+            replacements["Session Metadata"] = patch_or_dump(
+                session_metadata_yaml, session_metadata
             )
-            new_content = replace_yaml_section(
-                new_content, "Session Metadata", session_metadata_str
-            )
-
-        # Replace Session Notes section
         if session_notes_yaml:
-            session_notes_str = yaml.dump(
-                session_notes, default_flow_style=False, sort_keys=False
-            )
-            new_content = replace_yaml_section(
-                new_content, "Session Notes", session_notes_str
+            replacements["Session Notes"] = patch_or_dump(
+                session_notes_yaml, session_notes
             )
 
+        # Apply all section replacements in a single pass
+        new_content = document.replace_sections(replacements)
+
         return new_content
 
     except Exception as e:
@@ -190,48 +177,261 @@ def update_session_phase(
 
 def replace_yaml_section(content: str, section_name: str, new_yaml: str) -> str:
     """Replace a YAML section in the content."""
-    lines = content.split("\n")
-    new_lines = []
-    in_section = False
-    in_yaml = False
-
-    for line in lines:
-        if line.strip() == f"## {section_name}":
-            in_section = True
-            new_lines.append(line)
-        elif in_section and line.strip() == "```yaml":
-            in_yaml = True
-            new_lines.append(line)
-            # Add the new YAML content
-            for yaml_line in new_yaml.strip().split("\n"):
-                new_lines.append(yaml_line)
-        elif in_section and in_yaml and line.strip() == "```":
-            in_yaml = False
-            in_section = False
-            new_lines.append(line)
-        elif not (in_section and in_yaml):
-            new_lines.append(line)
-
-    return "\n".join(new_lines)
-
-
-def save_active_session(project_root: Path, content: str):
-    """Save updated session content to ACTIVE_SESSION.md."""
-    active_session_path = (
-        project_root / "docs" / "session-context" / "ACTIVE_SESSION.md"
-    )
+    return SessionDocument(content).replace_sections({section_name: new_yaml})
+
+
+def save_active_session(
+    project_root: Path,
+    content: str,
+    timeout: float = DEFAULT_LOCK_TIMEOUT,
+    transition: Optional[Tuple[str, str]] = None,
+    keep_decisions: int = DEFAULT_INLINE_DECISIONS,
+):
+    """Save updated session content to ACTIVE_SESSION.md.
+
+    The write is atomic and lock-protected; it is rejected if another writer
+    updated the session since `content` was derived from it. The
+    (from, to) phase transition and decisions beyond the newest
+    `keep_decisions` are appended to the session journal.
+    """
+    from session_journal import write_journaled_session
+
+    active_session_path = session_path_for(project_root)
 
     try:
-        # Create directory if it doesn't exist
-        active_session_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(active_session_path, "w") as f:
-            f.write(content)
+        write_journaled_session(
+            active_session_path, content, transition, keep_decisions, timeout
+        )
         logger.info(f"Updated ACTIVE_SESSION.md at {active_session_path}")
     except Exception as e:
         logger.error(f"Error saving ACTIVE_SESSION.md: {e}")
         sys.exit(1)
 
 
+def mark_artifact_baseline(
+    project_root: Path, pipeline: Union[PipelineGraph, dict], completed_phase: str
+):
+    """Record artifact hashes in .valuetrain/artifacts.lock as the new baseline.
+
+    Later --verify-content runs report artifacts changed since this advance.
+    Projects opt in by running --verify-content once, which creates the
+    manifest; without it nothing is fingerprinted.
+    """
+    from artifact_manifest import MANIFEST_RELATIVE_PATH, ArtifactManifest
+
+    if not (project_root / MANIFEST_RELATIVE_PATH).is_file():
+        return
+
+    from check_artifacts import resolve_artifact_paths
+
+    graph = PipelineGraph.coerce(pipeline)
+    artifact_paths = resolve_artifact_paths(
+        project_root, graph.artifacts(completed_phase), graph, completed_phase
+    )
+    try:
+        manifest = ArtifactManifest(project_root)
+        manifest.mark_baseline(artifact_paths)
+        written = manifest.save()
+    except OSError as e:
+        logger.warning(f"Could not update artifact baseline: {e}")
+        return
+    if written:
+        logger.info(f"Recorded artifact baseline in {manifest.path}")
+
+
+def session_project_root(session_path: Path, default_root: Path) -> Path:
+    """Return the project root of a session file.
+
+    Files at docs/session-context/ACTIVE_SESSION.md belong to the directory
+    above docs/; any other session file belongs to `default_root`, the
+    --project-root whose pipeline.yml the batch run loaded.
+    """
+    parts = SESSION_RELATIVE_PATH.parts
+    if session_path.parts[-len(parts) :] == parts:
+        return session_path.parents[len(parts) - 1]
+    return default_root
+
+
+def advance_session(
+    session_path: Path,
+    pipeline: PipelineGraph,
+    force_phase: Optional[str] = None,
+    dry_run: bool = False,
+    timeout: float = DEFAULT_LOCK_TIMEOUT,
+    keep_decisions: int = DEFAULT_INLINE_DECISIONS,
+    project_root: Optional[Path] = None,
+    baseline_lock: Optional[ContextManager] = None,
+) -> SessionResult:
+    """Advance one session file using an already loaded pipeline.
+
+    Sessions outside docs/session-context/ belong to `project_root`, which
+    defaults to the current directory like --project-root. `baseline_lock`
+    is held while the project's artifact baseline is updated.
+    """
+    project_root = session_project_root(session_path, project_root or Path.cwd())
+    document = SessionDocument.from_path(session_path)
+    current_work = document.section("Current Work")
+    current_phase = current_work.get("phase") if current_work else None
+    if not current_phase:
+        return SessionResult(session_path, FAILED, "No current phase found")
+
+    next_phase = force_phase or pipeline.next_phase(current_phase)
+    if not next_phase:
+        return SessionResult(
+            session_path, COMPLETED, f"Pipeline complete at '{current_phase}'"
+        )
+
+    next_phase_info = pipeline.phase(next_phase)
+    if not next_phase_info:
+        return SessionResult(
+            session_path,
+            FAILED,
+            f"Phase '{next_phase}' not found in pipeline configuration",
+        )
+
+    new_content = update_session_phase(
+        project_root,
+        document.content,
+        document.raw_sections(),
+        next_phase,
+        next_phase_info,
+    )
+    if dry_run:
+        return SessionResult(
+            session_path, ADVANCED, f"{current_phase} → {next_phase} (dry run)"
+        )
+
+    from session_journal import write_journaled_session
+
+    write_journaled_session(
+        session_path,
+        new_content,
+        (current_phase, next_phase),
+        keep_decisions,
+        timeout,
+    )
+    if baseline_lock is None:
+        mark_artifact_baseline(project_root, pipeline, current_phase)
+    else:
+        with baseline_lock:
+            mark_artifact_baseline(project_root, pipeline, current_phase)
+    return SessionResult(session_path, ADVANCED, f"{current_phase} → {next_phase}")
+
+
+def advance_sessions(
+    session_paths: List[Path],
+    pipeline: PipelineGraph,
+    force_phase: Optional[str] = None,
+    dry_run: bool = False,
+    jobs: int = DEFAULT_JOBS,
+    timeout: float = DEFAULT_LOCK_TIMEOUT,
+    keep_decisions: int = DEFAULT_INLINE_DECISIONS,
+    project_root: Optional[Path] = None,
+) -> List[SessionResult]:
+    """Advance every session concurrently, preserving order."""
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    default_root = project_root or Path.cwd()
+    roots = {path: session_project_root(path, default_root) for path in session_paths}
+    # Sessions of one project share its artifact baseline manifest
+    root_locks = {root: threading.Lock() for root in set(roots.values())}
+
+    def run_one(session_path: Path) -> SessionResult:
+        try:
+            return advance_session(
+                session_path,
+                pipeline,
+                force_phase,
+                dry_run,
+                timeout,
+                keep_decisions,
+                default_root,
+                root_locks[roots[session_path]],
+            )
+        except SystemExit:
+            # update_session_phase exits on errors it has logged
+            return SessionResult(session_path, FAILED, "Update aborted, see log above")
+        except Exception as e:
+            return SessionResult(session_path, FAILED, f"Error: {e}")
+
+    if not session_paths:
+        return []
+
+    workers = max(1, min(jobs, len(session_paths)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run_one, session_paths))
+
+
+def report_sessions(results: List[SessionResult]) -> int:
+    """Log a per-session summary and return the aggregate exit code."""
+    icons = {ADVANCED: "✅", COMPLETED: "🏁", FAILED: "❌"}
+    logger.info(f"Batch summary ({len(results)} sessions):")
+    for result in results:
+        log = logger.error if result.status == FAILED else logger.info
+        log(f"{icons[result.status]} {result.session_path}: {result.summary}")
+
+    counts = {status: 0 for status in icons}
+    for result in results:
+        counts[result.status] += 1
+    logger.info(
+        f"{counts[ADVANCED]} advanced, {counts[COMPLETED]} completed, "
+        f"{counts[FAILED]} failed"
+    )
+    if counts[FAILED]:
+        logger.error("Some sessions could not be advanced")
+        return 1
+    return 0
+
+
+def compact_sessions(
+    session_paths: List[Path],
+    keep_decisions: int = DEFAULT_INLINE_DECISIONS,
+    timeout: float = DEFAULT_LOCK_TIMEOUT,
+) -> int:
+    """Compact each session's decisions into its journal; return the exit code."""
+    from session_journal import compact_session
+
+    exit_code = 0
+    for session_path in session_paths:
+        try:
+            moved = compact_session(session_path, keep_decisions, timeout)
+        except Exception as e:
+            logger.error(f"Error compacting {session_path}: {e}")
+            exit_code = 1
+            continue
+        if moved:
+            logger.info(f"Moved {moved} decisions from {session_path} to the journal")
+        else:
+            logger.info(f"Nothing to compact in {session_path}")
+    return exit_code
+
+
+def print_session_diff(
+    old_content: str,
+    new_content: str,
+    label: str,
+    json_patch_path: Optional[Path] = None,
+):
+    """Stream a per-section unified diff and optionally write a JSON patch."""
+    import json
+
+    from session_diff import iter_unified_diff, json_patch
+
+    changed = False
+    for line in iter_unified_diff(old_content, new_content, label):
+        print(line)
+        changed = True
+    if not changed:
+        logger.info("No changes to ACTIVE_SESSION.md")
+
+    if json_patch_path is not None:
+        with open(json_patch_path, "w") as f:
+            json.dump(json_patch(old_content, new_content), f, indent=2)
+            f.write("\n")
+        logger.info(f"JSON patch written to {json_patch_path}")
+
+
 def main():
     """Main function to advance session to next phase."""
     parser = argparse.ArgumentParser(description="Advance session to next phase")
@@ -246,18 +446,112 @@ def main():
         action="store_true",
         help="Show what would be updated without making changes",
     )
+    parser.add_argument(
+        "--json-patch",
+        type=Path,
+        help="With --dry-run, also write the changes as an RFC 6902 JSON patch",
+    )
     parser.add_argument(
         "--force-phase",
         type=str,
         help="Force advance to specific phase (bypasses normal progression)",
     )
+    parser.add_argument(
+        "--session",
+        type=Path,
+        action="append",
+        help=(
+            "Session file to advance in a batch run; repeat or use a glob "
+            "pattern to advance several sessions. Sessions outside "
+            "docs/session-context/ belong to --project-root"
+        ),
+    )
+    parser.add_argument(
+        "--session-manifest",
+        type=Path,
+        help="File listing session files to advance, one per line",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Sessions advanced concurrently in a batch run (default: {DEFAULT_JOBS})",
+    )
+    parser.add_argument(
+        "--lock-timeout",
+        type=float,
+        default=DEFAULT_LOCK_TIMEOUT,
+        help=(
+            "Seconds to wait for another writer's session lock "
+            f"(default: {DEFAULT_LOCK_TIMEOUT})"
+        ),
+    )
+    parser.add_argument(
+        "--keep-decisions",
+        type=int,
+        default=DEFAULT_INLINE_DECISIONS,
+        help=(
+            "Session Notes decisions kept inline; older ones move to the "
+            f"session journal (default: {DEFAULT_INLINE_DECISIONS})"
+        ),
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help=(
+            "Roll decisions beyond --keep-decisions into the session journal "
+            "instead of advancing"
+        ),
+    )
 
     args = parser.parse_args()
+    batch = bool(args.session or args.session_manifest)
+    if args.json_patch and not args.dry_run:
+        parser.error("--json-patch requires --dry-run")
+    if args.json_patch and batch:
+        parser.error("--json-patch previews a single session, not a batch run")
+    configure_logging()
+
+    if batch:
+        from fleet import expand_session_paths
+
+        session_paths = expand_session_paths(args.session or [], args.session_manifest)
+        if not session_paths:
+            logger.error("No session files matched")
+            sys.exit(1)
+    else:
+        session_paths = [session_path_for(args.project_root)]
+
+    if args.compact:
+        exit_code = compact_sessions(
+            session_paths, args.keep_decisions, args.lock_timeout
+        )
+        sys.exit(exit_code)
+
+    if batch:
+        logger.info("Starting batch conductor phase advancement...")
+        cache = ParseCache.for_project(args.project_root)
+        pipeline = PipelineGraph(load_pipeline_config(args.project_root, cache))
+        results = advance_sessions(
+            session_paths,
+            pipeline,
+            args.force_phase,
+            args.dry_run,
+            args.jobs,
+            args.lock_timeout,
+            args.keep_decisions,
+            args.project_root,
+        )
+        sys.exit(report_sessions(results))
+
+    import yaml
 
     logger.info("Starting conductor phase advancement...")
 
     # Load pipeline configuration
-    pipeline_config = load_pipeline_config(args.project_root)
+    cache = ParseCache.for_project(args.project_root)
+    pipeline_config = load_pipeline_config(args.project_root, cache)
+    pipeline = PipelineGraph(pipeline_config)
 
     # Load current session
     sections, content = load_active_session(args.project_root)
@@ -269,7 +563,9 @@ def main():
         sys.exit(1)
 
     try:
-        current_work = yaml.safe_load(current_work_yaml)
+        current_work = load_session_section(
+            session_path_for(args.project_root), "Current Work", cache
+        )
     except yaml.YAMLError as e:
         logger.error(f"Invalid YAML in Current Work section: {e}")
         sys.exit(1)
@@ -286,7 +582,7 @@ def main():
         next_phase = args.force_phase
         logger.info(f"Forcing advance to phase: {next_phase}")
     else:
-        next_phase = get_next_phase(pipeline_config, current_phase)
+        next_phase = get_next_phase(pipeline, current_phase)
         if not next_phase:
             logger.info(
                 f"No next phase found for '{current_phase}' - pipeline complete!"
@@ -294,7 +590,7 @@ def main():
             return
 
     # Get next phase information
-    next_phase_info = get_phase_info(pipeline_config, next_phase)
+    next_phase_info = get_phase_info(pipeline, next_phase)
     if not next_phase_info:
         logger.error(f"Phase '{next_phase}' not found in pipeline configuration")
         sys.exit(1)
@@ -309,16 +605,26 @@ def main():
     )
 
     if args.dry_run:
+        from session_journal import offload_decisions
+
         logger.info(
             "DRY RUN - Would update ACTIVE_SESSION.md with new phase information"
         )
-        logger.info("Updated content preview:")
-        print("=" * 50)
-        print(new_content[:1000] + "..." if len(new_content) > 1000 else new_content)
-        print("=" * 50)
+        # Preview exactly what save_active_session would write
+        new_content, _ = offload_decisions(new_content, args.keep_decisions)
+        print_session_diff(
+            content, new_content, SESSION_RELATIVE_PATH.as_posix(), args.json_patch
+        )
     else:
         # Save updated session
-        save_active_session(args.project_root, new_content)
+        save_active_session(
+            args.project_root,
+            new_content,
+            args.lock_timeout,
+            (current_phase, next_phase),
+            args.keep_decisions,
+        )
+        mark_artifact_baseline(args.project_root, pipeline, current_phase)
         logger.info("✅ Session successfully advanced to next phase!")
 
     logger.info("Conductor phase advancement complete.")
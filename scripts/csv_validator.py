@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+csv_validator.py - AgenticOps Value Train CSV Schema Validation
+
+Streams large CSV artifacts (e.g. prepared.csv) in bounded-memory chunks
+and validates them against the schema declared in schema-spec.md. The
+schema is the first fenced YAML block with a `columns` key:
+
+    ```yaml
+    columns:
+      - name: customer_id
+        type: integer
+        nullable: false
+        min: 1
+      - name: segment
+        type: string
+        allowed: ["retail", "wholesale"]
+      - name: signup_date
+        type: date
+    allow_extra_columns: false
+    ```
+
+Supported types are string, integer, float, boolean, date and datetime.
+Columns may also declare `min`, `max`, `allowed` and (strings) `pattern`.
+Empty cells are nulls. Chunks can be validated on a process pool.
+"""
+
+import csv
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Tuple
+
+DEFAULT_CHUNK_ROWS = 50_000
+DEFAULT_MAX_VIOLATIONS = 100
+
+TYPES = ("string", "integer", "float", "boolean", "date", "datetime")
+BOOLEAN_VALUES = {"true", "false", "1", "0", "yes", "no"}
+
+_FENCE_PATTERN = re.compile(r"^```ya?ml[ \t]*\n(.*?)^```", re.MULTILINE | re.DOTALL)
+
+
+class SchemaError(ValueError):
+    """Raised when schema-spec.md has no usable schema block."""
+
+
+class Violation(NamedTuple):
+    """A single cell or header that does not match the schema."""
+
+    row: int
+    column: str
+    message: str
+
+    def __str__(self) -> str:
+        location = f"Row {self.row}" if self.row else "Header"
+        return f"{location}, column '{self.column}': {self.message}"
+
+
+class CsvReport(NamedTuple):
+    """Outcome of validating one CSV file."""
+
+    path: Path
+    rows: int
+    violation_count: int
+    violations: List[Violation]
+
+    @property
+    def passed(self) -> bool:
+        return self.violation_count == 0
+
+
+def load_schema(spec_path: Path) -> dict:
+    """Return the first YAML block of schema-spec.md that declares columns."""
+    import yaml
+
+    content = spec_path.read_text()
+    for match in _FENCE_PATTERN.finditer(content):
+        try:
+            block = yaml.safe_load(match.group(1))
+        except yaml.YAMLError as e:
+            raise SchemaError(f"Invalid YAML schema block in {spec_path}: {e}")
+        if isinstance(block, dict) and "columns" in block:
+            _validate_schema(block, spec_path)
+            return block
+
+    raise SchemaError(f"No YAML block with 'columns' found in {spec_path}")
+
+
+def _validate_schema(schema: dict, spec_path: Path):
+    columns = schema.get("columns")
+    if not isinstance(columns, list) or not columns:
+        raise SchemaError(f"'columns' must be a non-empty list in {spec_path}")
+    for column in columns:
+        if not isinstance(column, dict) or "name" not in column:
+            raise SchemaError(f"Every column needs a name in {spec_path}: {column}")
+        column_type = column.get("type", "string")
+        if column_type not in TYPES:
+            raise SchemaError(
+                f"Unknown type '{column_type}' for column '{column['name']}' "
+                f"in {spec_path}"
+            )
+
+
+def _converter(column_type: str):
+    import datetime
+
+    def to_boolean(value: str) -> str:
+        if value.strip().lower() not in BOOLEAN_VALUES:
+            raise ValueError(value)
+        return value.strip().lower()
+
+    return {
+        "string": str,
+        "integer": int,
+        "float": float,
+        "boolean": to_boolean,
+        "date": datetime.date.fromisoformat,
+        "datetime": datetime.datetime.fromisoformat,
+    }[column_type]
+
+
+def _compile_column(column: dict) -> Dict[str, Any]:
+    """Turn a schema column into picklable checks with parsed bounds."""
+    column_type = column.get("type", "string")
+    convert = _converter(column_type)
+
+    def bound(value):
+        # YAML already parses unquoted dates and numbers
+        return convert(value) if isinstance(value, str) else value
+
+    return {
+        "name": column["name"],
+        "type": column_type,
+        "nullable": column.get("nullable", True),
+        "min": bound(column["min"]) if "min" in column else None,
+        "max": bound(column["max"]) if "max" in column else None,
+        "allowed": (
+            {str(value) for value in column["allowed"]} if "allowed" in column else None
+        ),
+        "pattern": column.get("pattern"),
+    }
+
+
+def validate_rows(
+    columns: List[Tuple[int, Dict[str, Any]]],
+    first_row: int,
+    rows: List[List[str]],
+    max_violations: int = DEFAULT_MAX_VIOLATIONS,
+) -> Tuple[int, List[Violation]]:
+    """Validate a chunk of rows; return the violation count and the first few.
+
+    `columns` pairs each schema column with its index in the CSV header.
+    `first_row` is the row number of `rows[0]`, counting the header as row 1.
+    """
+    checks = []
+    for index, column in columns:
+        pattern = re.compile(column["pattern"]) if column["pattern"] else None
+        checks.append((index, column, _converter(column["type"]), pattern))
+
+    count = 0
+    violations: List[Violation] = []
+
+    def report(row_number: int, name: str, message: str):
+        nonlocal count
+        count += 1
+        if len(violations) < max_violations:
+            violations.append(Violation(row_number, name, message))
+
+    for offset, row in enumerate(rows):
+        row_number = first_row + offset
+        for index, column, convert, pattern in checks:
+            name = column["name"]
+            value = row[index] if index < len(row) else ""
+            if value == "":
+                if not column["nullable"]:
+                    report(row_number, name, "null value in non-nullable column")
+                continue
+
+            try:
+                converted = convert(value)
+            except ValueError:
+                report(row_number, name, f"'{value}' is not a valid {column['type']}")
+                continue
+
+            if column["allowed"] is not None and value not in column["allowed"]:
+                report(row_number, name, f"'{value}' is not an allowed value")
+            if pattern is not None and not pattern.fullmatch(value):
+                report(row_number, name, f"'{value}' does not match {pattern.pattern}")
+            minimum, maximum = column["min"], column["max"]
+            try:
+                if minimum is not None and converted < minimum:
+                    report(row_number, name, f"{value} is below minimum {minimum}")
+                if maximum is not None and converted > maximum:
+                    report(row_number, name, f"{value} is above maximum {maximum}")
+            except TypeError:
+                report(row_number, name, f"'{value}' cannot be compared to its bounds")
+
+    return count, violations
+
+
+def _chunks(
+    reader: Iterator[List[str]], chunk_rows: int
+) -> Iterator[Tuple[int, List[List[str]]]]:
+    """Yield (first row number, rows) batches; data starts at row 2."""
+    row_number = 2
+    chunk: List[List[str]] = []
+    for row in reader:
+        chunk.append(row)
+        if len(chunk) >= chunk_rows:
+            yield row_number, chunk
+            row_number += len(chunk)
+            chunk = []
+    if chunk:
+        yield row_number, chunk
+
+
+def validate_csv(
+    csv_path: Path,
+    schema: dict,
+    workers: int = 0,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    max_violations: int = DEFAULT_MAX_VIOLATIONS,
+) -> CsvReport:
+    """Stream a CSV file and validate it against a schema.
+
+    Only `chunk_rows` rows are held per chunk. With `workers` > 0 chunks
+    are validated on a process pool with at most two chunks per worker in
+    flight, so memory stays bounded however large the file is.
+    """
+    compiled = [_compile_column(column) for column in schema["columns"]]
+    violations: List[Violation] = []
+    count = 0
+    rows = 0
+
+    def collect(chunk_count: int, chunk_violations: List[Violation]):
+        nonlocal count
+        count += chunk_count
+        violations.extend(chunk_violations[: max_violations - len(violations)])
+
+    with open(csv_path, "r", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return CsvReport(csv_path, 0, 1, [Violation(0, "*", "file is empty")])
+
+        positions = {name: index for index, name in enumerate(header)}
+        columns = []
+        for column in compiled:
+            if column["name"] in positions:
+                columns.append((positions[column["name"]], column))
+            else:
+                collect(1, [Violation(0, column["name"], "missing column")])
+        if not schema.get("allow_extra_columns", True):
+            declared = {column["name"] for column in compiled}
+            for name in header:
+                if name not in declared:
+                    collect(1, [Violation(0, name, "unexpected column")])
+
+        if workers <= 0:
+            for first_row, chunk in _chunks(reader, chunk_rows):
+                rows += len(chunk)
+                collect(*validate_rows(columns, first_row, chunk, max_violations))
+        else:
+            rows = _validate_on_pool(
+                reader, columns, workers, chunk_rows, max_violations, collect
+            )
+
+    return CsvReport(csv_path, rows, count, violations)
+
+
+def _validate_on_pool(
+    reader, columns, workers, chunk_rows, max_violations, collect
+) -> int:
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+
+    rows = 0
+    pending: deque = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for first_row, chunk in _chunks(reader, chunk_rows):
+            rows += len(chunk)
+            pending.append(
+                executor.submit(
+                    validate_rows, columns, first_row, chunk, max_violations
+                )
+            )
+            # Results are collected in order, which keeps row order stable
+            while len(pending) >= workers * 2:
+                collect(*pending.popleft().result())
+        while pending:
+            collect(*pending.popleft().result())
+    return rows
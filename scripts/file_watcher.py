@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+file_watcher.py - AgenticOps Value Train File Watcher
+
+Watches a set of files and directories and reports which of them changed.
+Uses inotify on Linux to sleep until something happens and falls back to
+mtime polling elsewhere. Either way, changes are confirmed by comparing
+stat snapshots, so a directory is reported when entries are added to or
+removed from it and a file when its content or metadata changes.
+"""
+
+import logging
+import os
+import select
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL = 0.5
+
+# inotify(7) event masks
+_IN_MODIFY = 0x002
+_IN_ATTRIB = 0x004
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_DELETE_SELF = 0x400
+_IN_MOVE_SELF = 0x800
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+)
+
+Snapshot = Dict[Path, Optional[Tuple[int, int, int]]]
+
+
+def _stat_key(path: Path) -> Optional[Tuple[int, int, int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+class _Inotify:
+    """Minimal ctypes binding used only as a wake-up signal."""
+
+    def __init__(self):
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+    def watch(self, directory: Path):
+        self._add_watch(self.fd, os.fsencode(str(directory)), _WATCH_MASK)
+
+    def wait(self, timeout: float) -> bool:
+        """Block until events arrive or the timeout expires, then drain them."""
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return False
+        try:
+            while os.read(self.fd, 65536):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def close(self):
+        os.close(self.fd)
+
+
+class FileWatcher:
+    """Report changed targets between successive calls to wait()."""
+
+    def __init__(
+        self,
+        targets: Iterable[Path],
+        interval: float = DEFAULT_INTERVAL,
+        use_inotify: bool = True,
+    ):
+        self.interval = interval
+        self._inotify: Optional[_Inotify] = None
+        if use_inotify and sys.platform.startswith("linux"):
+            try:
+                self._inotify = _Inotify()
+            except (OSError, AttributeError) as e:
+                logger.debug(f"inotify unavailable, polling instead: {e}")
+        self.set_targets(targets)
+
+    @property
+    def backend(self) -> str:
+        """Return the wake-up mechanism in use."""
+        return "inotify" if self._inotify else "polling"
+
+    def set_targets(self, targets: Iterable[Path]):
+        """Replace the watched targets and take a fresh baseline snapshot."""
+        self.targets: List[Path] = list(dict.fromkeys(targets))
+        self._arm()
+        self._snapshot = self._take_snapshot()
+
+    def _take_snapshot(self) -> Snapshot:
+        return {target: _stat_key(target) for target in self.targets}
+
+    def _arm(self):
+        """Watch the nearest existing directory of every target."""
+        if not self._inotify:
+            return
+        directories: Set[Path] = set()
+        for target in self.targets:
+            candidate = target if target.is_dir() else target.parent
+            while not candidate.exists() and candidate != candidate.parent:
+                candidate = candidate.parent
+            directories.add(candidate)
+        for directory in directories:
+            self._inotify.watch(directory)
+
+    def poll(self) -> Set[Path]:
+        """Return targets changed since the previous snapshot, without blocking."""
+        snapshot = self._take_snapshot()
+        changed = {
+            target
+            for target in self.targets
+            if snapshot[target] != self._snapshot.get(target)
+        }
+        self._snapshot = snapshot
+        return changed
+
+    def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        """Block until at least one target changes or the timeout expires."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = self.poll()
+            if changed:
+                return changed
+
+            remaining = self.interval
+            if deadline is not None:
+                remaining = min(remaining, deadline - time.monotonic())
+                if remaining <= 0:
+                    return set()
+
+            if self._inotify:
+                # Directories may have appeared since the last wake-up
+                self._arm()
+                self._inotify.wait(remaining if deadline is not None else 5.0)
+            else:
+                time.sleep(remaining)
+
+    def close(self):
+        """Release the inotify descriptor, if any."""
+        if self._inotify:
+            self._inotify.close()
+            self._inotify = None
+
+
+def run_watch(evaluator, interval: float = DEFAULT_INTERVAL):
+    """Drive an incremental evaluator until interrupted.
+
+    The evaluator provides `targets()` (paths to watch), `start()` (initial
+    report lines) and `update(changed)` (delta report lines for the changed
+    targets). Targets are read once the initial evaluation has decided what
+    to watch, and re-read after every update so evaluators can follow a
+    switch of checklist or phase.
+    """
+    lines = evaluator.start()
+    watcher = FileWatcher(evaluator.targets(), interval=interval)
+    logger.info(f"Watching {len(watcher.targets)} paths ({watcher.backend})")
+    for line in lines:
+        logger.info(line)
+
+    try:
+        while True:
+            changed = watcher.wait()
+            for line in evaluator.update(changed):
+                logger.info(line)
+            targets = list(dict.fromkeys(evaluator.targets()))
+            if targets != watcher.targets:
+                watcher.set_targets(targets)
+    except KeyboardInterrupt:
+        logger.info("Watch stopped.")
+    finally:
+        watcher.close()
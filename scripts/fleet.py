@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+fleet.py - AgenticOps Value Train Fleet Validation
+
+Runs a per-project check over many project roots on a bounded thread pool
+and summarises the results. Project roots can be given explicitly, as glob
+patterns or in a manifest file; roots with identical pipeline.yml content
+share one parsed pipeline.
+"""
+
+import glob
+import logging
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from pipeline_graph import PipelineGraph
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOBS = 8
+
+_GLOB_CHARS = set("*?[")
+
+
+class ProjectResult(NamedTuple):
+    """Outcome of a check for one project root."""
+
+    project_root: Path
+    passed: bool
+    summary: str
+    messages: List[str] = []
+    error: bool = False
+
+
+def _is_glob(root: Path) -> bool:
+    return bool(_GLOB_CHARS & set(str(root)))
+
+
+def is_fleet_request(roots: Optional[List[Path]], manifest: Optional[Path]) -> bool:
+    """Return True when the arguments name more than a single project root."""
+    roots = roots or []
+    return manifest is not None or len(roots) > 1 or any(map(_is_glob, roots))
+
+
+def read_manifest(manifest: Path) -> List[Path]:
+    """Read project roots from a manifest, one per line.
+
+    Blank lines and `#` comments are ignored; relative entries and patterns
+    are resolved against the manifest's directory.
+    """
+    roots = []
+    with open(manifest, "r") as f:
+        for line in f:
+            entry = line.split("#", 1)[0].strip()
+            if entry:
+                roots.append(manifest.parent / entry)
+    return roots
+
+
+def _expand(candidates: Iterable[Path], keep: Callable[[Path], bool]) -> List[Path]:
+    """Expand glob candidates to matches accepted by `keep` and de-duplicate."""
+    expanded: List[Path] = []
+    for candidate in candidates:
+        if _is_glob(candidate):
+            matches = sorted(glob.glob(str(candidate)))
+            expanded.extend(Path(match) for match in matches if keep(Path(match)))
+        else:
+            expanded.append(candidate)
+
+    seen = set()
+    unique = []
+    for path in expanded:
+        key = path.resolve()
+        if key not in seen:
+            seen.add(key)
+            unique.append(path)
+    return unique
+
+
+def expand_project_roots(
+    roots: Iterable[Path], manifest: Optional[Path] = None
+) -> List[Path]:
+    """Expand globs and manifest entries into a de-duplicated list of roots."""
+    candidates = list(roots)
+    if manifest is not None:
+        candidates.extend(read_manifest(manifest))
+    return _expand(candidates, Path.is_dir)
+
+
+def expand_session_paths(
+    sessions: Iterable[Path], manifest: Optional[Path] = None
+) -> List[Path]:
+    """Expand globs and manifest entries into a de-duplicated list of files."""
+    candidates = list(sessions)
+    if manifest is not None:
+        candidates.extend(read_manifest(manifest))
+    return _expand(candidates, Path.is_file)
+
+
+class SharedPipelineLoader:
+    """Thread-safe pipeline.yml loader sharing graphs between projects.
+
+    Graphs are keyed by content hash, so projects that symlink or copy the
+    same pipeline.yml parse it once per run.
+    """
+
+    def __init__(self):
+        self._graphs: Dict[str, PipelineGraph] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def load(self, project_root: Path) -> PipelineGraph:
+        """Return the compiled pipeline of a project."""
+        import hashlib
+
+        pipeline_path = project_root / "config" / "pipeline.yml"
+        if not pipeline_path.exists():
+            raise FileNotFoundError(
+                f"Pipeline configuration not found at {pipeline_path}"
+            )
+
+        content = pipeline_path.read_bytes()
+        digest = hashlib.sha256(content).hexdigest()
+        with self._lock:
+            graph = self._graphs.get(digest)
+            if graph is not None:
+                return graph
+            parse_lock = self._locks.setdefault(digest, threading.Lock())
+
+        with parse_lock:
+            graph = self._graphs.get(digest)
+            if graph is None:
+                import yaml
+
+                graph = PipelineGraph(yaml.safe_load(content))
+                with self._lock:
+                    self._graphs[digest] = graph
+        return graph
+
+    @property
+    def parsed(self) -> int:
+        """Return the number of distinct pipelines parsed."""
+        return len(self._graphs)
+
+
+def run_fleet(
+    project_roots: List[Path],
+    check: Callable[[Path], ProjectResult],
+    jobs: int = DEFAULT_JOBS,
+) -> List[ProjectResult]:
+    """Run `check` for every project root concurrently, preserving order."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    def run_one(project_root: Path) -> ProjectResult:
+        try:
+            return check(project_root)
+        except SystemExit:
+            # The shared script helpers exit on errors they have logged
+            return ProjectResult(
+                project_root, False, "Check aborted, see log above", error=True
+            )
+        except Exception as e:
+            return ProjectResult(project_root, False, f"Error: {e}", error=True)
+
+    if not project_roots:
+        return []
+
+    workers = max(1, min(jobs, len(project_roots)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run_one, project_roots))
+
+
+def report_fleet(results: List[ProjectResult], strict: bool) -> int:
+    """Log a per-project summary and return the aggregate exit code."""
+    logger.info(f"Fleet summary ({len(results)} projects):")
+    for result in results:
+        if result.error:
+            status, log = "⚠️", logger.error
+        elif result.passed:
+            status, log = "✅", logger.info
+        else:
+            status, log = "❌", logger.error
+        log(f"{status} {result.project_root}: {result.summary}")
+        for message in result.messages:
+            log(f"    {message}")
+
+    errors = sum(1 for result in results if result.error)
+    failed = sum(1 for result in results if not result.passed and not result.error)
+    passed = len(results) - errors - failed
+    logger.info(f"{passed} passed, {failed} failed, {errors} errors")
+
+    if errors:
+        logger.error("Failing CI because some projects could not be checked")
+        return 1
+    if failed and strict:
+        logger.error("Failing CI due to failed projects (--strict mode)")
+        return 1
+    if failed:
+        logger.warning(
+            "Failed projects found but not failing CI (use --strict to fail)"
+        )
+    return 0
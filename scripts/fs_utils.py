@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+fs_utils.py - AgenticOps Value Train File System Helpers
+
+Small file system helpers shared by the automation scripts.
+"""
+
+import contextlib
+import os
+import stat
+import sys
+from pathlib import Path
+from typing import Iterator
+
+LOCK_POLL_INTERVAL = 0.05
+
+
+class LockTimeout(TimeoutError):
+    """Raised when a file lock cannot be acquired in time."""
+
+
+def atomic_write_text(path: Path, content: str, fsync: bool = False):
+    """Write text to a file atomically via a temp file and os.replace.
+
+    The file keeps its permissions; new files get the usual umask defaults
+    rather than the private mode of the temp file. With fsync, the data and
+    the directory entry are flushed to disk before returning, so the new
+    content survives a crash.
+    """
+    import tempfile
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(
+        dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.chmod(temp_name, _file_mode(path))
+        os.replace(temp_name, path)
+        if fsync:
+            _fsync_directory(path.parent)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
+
+
+def _file_mode(path: Path) -> int:
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        # The umask can only be read by setting it
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def _fsync_directory(directory: Path):
+    try:
+        fd = os.open(str(directory), os.O_RDONLY)
+    except OSError:
+        # Directories cannot be opened on some platforms
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def lock_path_for(path: Path) -> Path:
+    """Return the lock file guarding writes to a file."""
+    return path.with_name(f".{path.name}.lock")
+
+
+@contextlib.contextmanager
+def file_lock(path: Path, timeout: float) -> Iterator[None]:
+    """Hold an exclusive advisory lock on a file's lock file.
+
+    Raises LockTimeout if another process holds the lock for longer than
+    `timeout` seconds. The lock file is left in place for later writers.
+    """
+    import time
+
+    lock_path = lock_path_for(path)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    deadline = time.monotonic() + timeout
+    with open(lock_path, "a+b") as lock_file:
+        while not _try_lock(lock_file):
+            if time.monotonic() >= deadline:
+                raise LockTimeout(
+                    f"Timed out after {timeout}s waiting for lock {lock_path}"
+                )
+            time.sleep(LOCK_POLL_INTERVAL)
+        try:
+            yield
+        finally:
+            _unlock(lock_file)
+
+
+def _try_lock(lock_file) -> bool:
+    if sys.platform == "win32":
+        import msvcrt
+
+        try:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+
+    import fcntl
+
+    try:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except BlockingIOError:
+        return False
+
+
+def _unlock(lock_file):
+    if sys.platform == "win32":
+        import msvcrt
+
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        return
+
+    import fcntl
+
+    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
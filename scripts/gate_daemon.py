@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+gate_daemon.py - AgenticOps Value Train Gate Daemon
+
+Optional long-lived process that keeps pipeline.yml, the asset registry,
+checklists and ACTIVE_SESSION.md loaded and answers gate queries over a
+Unix domain socket. Inputs are re-stat'ed on every query and reloaded only
+when they change, so answers always match the CLI scripts.
+"""
+
+import argparse
+import logging
+import os
+import socket
+import socketserver
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from logging_setup import configure_logging
+from parse_cache import CACHE_DIR_NAME
+from pipeline_graph import PipelineGraph
+from session_model import SessionDocument, session_path_for
+
+logger = logging.getLogger(__name__)
+
+SOCKET_NAME = "gate.sock"
+
+QUERIES = [
+    "ping",
+    "current-phase",
+    "current-mode",
+    "unchecked-items",
+    "missing-artifacts",
+    "next-phase",
+    "assets",
+    "shutdown",
+]
+
+
+class GateError(Exception):
+    """Raised when a query cannot be answered."""
+
+
+def default_socket_path(project_root: Path) -> Path:
+    """Return the default daemon socket path for a project."""
+    return project_root / CACHE_DIR_NAME / SOCKET_NAME
+
+
+def _fingerprint(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class GateState:
+    """Loaded gate inputs, reloaded individually when their files change."""
+
+    def __init__(self, project_root: Path):
+        self.project_root = project_root
+        self.pipeline_path = project_root / "config" / "pipeline.yml"
+        self.registry_path = project_root / "docs" / "rules" / "asset-registry.yaml"
+        self.session_path = session_path_for(project_root)
+        self._loaded: Dict[Path, Tuple[Optional[Tuple[int, int]], Any]] = {}
+        self._lock = threading.Lock()
+
+    def _load(self, path: Path, loader: Callable[[Path], Any]) -> Any:
+        """Return the loaded value for a file, reloading it if it changed."""
+        fingerprint = _fingerprint(path)
+        if fingerprint is None:
+            raise GateError(f"File not found: {path}")
+
+        cached = self._loaded.get(path)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        logger.info(f"Loading {path}")
+        value = loader(path)
+        self._loaded[path] = (fingerprint, value)
+        return value
+
+    def pipeline(self) -> PipelineGraph:
+        """Return the compiled pipeline graph."""
+        return self._load(self.pipeline_path, _load_pipeline)
+
+    def current_work(self) -> dict:
+        """Return the parsed Current Work section."""
+        return self._load(
+            self.session_path,
+            lambda path: SessionDocument.from_path(path).section("Current Work"),
+        )
+
+    def assets(self) -> dict:
+        """Return the parsed asset registry."""
+        return self._load(self.registry_path, _load_yaml) or {}
+
+    def unchecked_items(self) -> list:
+        """Return unchecked items of the current mode's checklist."""
+        from check_todo import check_unchecked_items, find_active_checklist
+
+        mode = self.current_work().get("mode")
+        if not mode:
+            raise GateError("No current mode found in ACTIVE_SESSION.md")
+        checklist_path = find_active_checklist(self.project_root, mode)
+        items = self._load(checklist_path, check_unchecked_items)
+        return [{"line": line_num, "item": item} for line_num, item in items]
+
+    def missing_artifacts(self) -> list:
+        """Return missing artifact paths for the current phase."""
+        from check_artifacts import check_artifacts_exist, resolve_artifact_paths
+
+        pipeline = self.pipeline()
+        phase = self.current_phase()
+        artifact_paths = resolve_artifact_paths(
+            self.project_root, pipeline.artifacts(phase), pipeline, phase
+        )
+        return [str(path) for path in check_artifacts_exist(artifact_paths)]
+
+    def current_phase(self) -> str:
+        """Return the current phase name."""
+        phase = self.current_work().get("phase")
+        if not phase:
+            raise GateError("No current phase found in ACTIVE_SESSION.md")
+        return phase
+
+    def answer(self, query: str) -> Any:
+        """Answer a single query, serialising access to the loaded state."""
+        handlers: Dict[str, Callable[[], Any]] = {
+            "ping": lambda: "pong",
+            "current-phase": self.current_phase,
+            "current-mode": lambda: self.current_work().get("mode"),
+            "unchecked-items": self.unchecked_items,
+            "missing-artifacts": self.missing_artifacts,
+            "next-phase": lambda: self.pipeline().next_phase(self.current_phase()),
+            "assets": self.assets,
+        }
+        if query not in handlers:
+            raise GateError(f"Unknown query '{query}'")
+
+        with self._lock:
+            try:
+                return handlers[query]()
+            except SystemExit:
+                # The shared script helpers exit on errors they have logged
+                raise GateError(f"Query '{query}' failed, see daemon log")
+
+
+def _load_yaml(path: Path) -> Any:
+    import yaml
+
+    with open(path, "r") as f:
+        return yaml.safe_load(f)
+
+
+def _load_pipeline(path: Path) -> PipelineGraph:
+    return PipelineGraph(_load_yaml(path))
+
+
+class _GateRequestHandler(socketserver.StreamRequestHandler):
+    """Handle newline-delimited JSON queries."""
+
+    def handle(self):
+        import json
+
+        for line in self.rfile:
+            try:
+                query = json.loads(line).get("query")
+                if query == "shutdown":
+                    response = {"ok": True, "result": "shutting down"}
+                    threading.Thread(target=self.server.shutdown).start()
+                else:
+                    result = self.server.state.answer(query)
+                    response = {"ok": True, "result": result}
+            except GateError as e:
+                response = {"ok": False, "error": str(e)}
+            except Exception as e:
+                logger.exception("Unexpected error answering query")
+                response = {"ok": False, "error": f"Internal error: {e}"}
+
+            self.wfile.write((json.dumps(response) + "\n").encode())
+            self.wfile.flush()
+
+
+class GateServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server holding a shared GateState."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, state: GateState):
+        self.state = state
+        self.socket_path = socket_path
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if socket_path.exists():
+            socket_path.unlink()
+        super().__init__(str(socket_path), _GateRequestHandler)
+
+    def server_close(self):
+        super().server_close()
+        try:
+            os.unlink(self.socket_path)
+        except OSError:
+            pass
+
+
+def query_daemon(socket_path: Path, query: str, timeout: float = 5.0) -> dict:
+    """Send one query to a running daemon and return its JSON response."""
+    import json
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(str(socket_path))
+        client.sendall((json.dumps({"query": query}) + "\n").encode())
+        with client.makefile("rb") as stream:
+            return json.loads(stream.readline())
+
+
+def main():
+    """Main function to serve or query the gate daemon."""
+    parser = argparse.ArgumentParser(description="Serve gate queries over a socket")
+    parser.add_argument(
+        "--project-root",
+        type=Path,
+        default=Path.cwd(),
+        help="Root directory of the project (default: current directory)",
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        help="Socket path (default: .valuetrain-cache/gate.sock)",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("serve", help="Run the daemon in the foreground")
+    query_parser = subparsers.add_parser("query", help="Query a running daemon")
+    query_parser.add_argument("query", choices=QUERIES)
+
+    args = parser.parse_args()
+    configure_logging()
+
+    socket_path = args.socket or default_socket_path(args.project_root)
+
+    if args.command == "serve":
+        server = GateServer(socket_path, GateState(args.project_root))
+        logger.info(f"Gate daemon listening on {socket_path}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+        logger.info("Gate daemon stopped.")
+        return
+
+    import json
+
+    try:
+        response = query_daemon(socket_path, args.query)
+    except OSError as e:
+        logger.error(f"Could not reach gate daemon at {socket_path}: {e}")
+        sys.exit(1)
+
+    if not response.get("ok"):
+        logger.error(response.get("error"))
+        sys.exit(1)
+    print(json.dumps(response["result"], indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+git_index.py - AgenticOps Value Train Git Index Presence
+
+Answers "is this artifact tracked by git" for any number of artifacts from
+a single `git ls-files -z` listing of the project, which is what CI and
+reviewers see. Artifacts that are on disk but not in the index are
+reported as untracked.
+"""
+
+import os
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from artifact_index import ArtifactIndex
+
+
+class GitIndexError(RuntimeError):
+    """Raised when the project's git index cannot be listed."""
+
+
+class GitIndex:
+    """Set-membership view of the files tracked in a project's git index."""
+
+    def __init__(self, project_root: Path, tracked: Iterable[str]):
+        self.project_root = project_root
+        self.tracked = frozenset(tracked)
+
+    @classmethod
+    def load(cls, project_root: Path) -> "GitIndex":
+        """List the tracked files under a project root with one git call."""
+        import subprocess
+
+        try:
+            result = subprocess.run(
+                ["git", "-C", str(project_root), "ls-files", "-z"],
+                capture_output=True,
+                check=False,
+            )
+        except OSError as e:
+            raise GitIndexError(f"Could not run git: {e}")
+        if result.returncode != 0:
+            stderr = result.stderr.decode(errors="replace").strip()
+            raise GitIndexError(f"git ls-files failed in {project_root}: {stderr}")
+
+        # Paths are relative to project_root since git runs from there
+        names = result.stdout.split(b"\0")
+        return cls(project_root, (os.fsdecode(name) for name in names if name))
+
+    def _relative(self, path: Path) -> Optional[str]:
+        try:
+            return path.relative_to(self.project_root).as_posix()
+        except ValueError:
+            return None
+
+    def exists(self, path: Path) -> bool:
+        """Return whether the path is tracked in the git index."""
+        return self._relative(path) in self.tracked
+
+    def missing(self, paths: Iterable[Path]) -> List[Path]:
+        """Return the paths that are not tracked, in their original order."""
+        return [path for path in paths if not self.exists(path)]
+
+    def untracked(self, paths: Iterable[Path]) -> List[Path]:
+        """Return the paths that exist on disk but are not tracked."""
+        on_disk = ArtifactIndex()
+        return [path for path in self.missing(paths) if on_disk.exists(path)]
+
+    def save(self):
+        """Nothing to persist; git maintains the index."""
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+logging_setup.py - AgenticOps Value Train Logging Setup
+
+Logging configuration shared by the script entry points.
+Called from each main() so importing a script never touches logging.
+"""
+
+import logging
+
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+
+
+def configure_logging(level: int = logging.INFO):
+    """Configure root logging for a script entry point."""
+    logging.basicConfig(level=level, format=LOG_FORMAT)
@@ -7,24 +7,20 @@ Converts old session formats to the current ACTIVE_SESSION.md schema.
 """
 
 import argparse
-import json
 import logging
 import sys
-from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict
 
-import yaml
+from logging_setup import configure_logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 
 def detect_legacy_format(content: str) -> str:
     """Detect the format of legacy session context."""
+    import json
+
     content = content.strip()
 
     if content.startswith("{") and content.endswith("}"):
@@ -48,6 +44,8 @@ def detect_legacy_format(content: str) -> str:
 
 def parse_json_format(content: str) -> Dict[str, Any]:
     """Parse JSON format legacy session."""
+    import json
+
     try:
         data = json.loads(content)
         return {
@@ -65,6 +63,8 @@ def parse_json_format(content: str) -> Dict[str, Any]:
 
 def parse_yaml_frontmatter(content: str) -> Dict[str, Any]:
     """Parse YAML frontmatter format legacy session."""
+    import yaml
+
     try:
         # Split on first --- boundary
         parts = content.split("---", 2)
@@ -161,6 +161,8 @@ def parse_key_value_format(content: str) -> Dict[str, Any]:
 
 def generate_new_session_content(legacy_data: Dict, project_root: Path) -> str:
     """Generate new ACTIVE_SESSION.md content from legacy data."""
+    from datetime import datetime
+
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     session_id = datetime.now().strftime("%Y-%m-%d-%H%M%S")
 
@@ -363,6 +365,7 @@ def main():
     )
 
     args = parser.parse_args()
+    configure_logging()
 
     logger.info("Starting legacy session migration...")
 
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+notebook_inspector.py - AgenticOps Value Train Notebook Inspection
+
+Checks that Jupyter notebook artifacts (e.g. train.ipynb) have been
+executed: every code cell with source has an execution count and no cell
+has an error output. Notebooks are read with an incremental JSON tokenizer
+in fixed-size chunks; only short strings are decoded, so embedded base64
+plots and large outputs are skipped without ever being held in memory.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, NamedTuple, Tuple
+
+CHUNK_SIZE = 256 * 1024
+# Strings longer than this (raw bytes) are skipped instead of decoded
+MAX_CAPTURE_BYTES = 4096
+
+_WHITESPACE = re.compile(rb"[ \t\n\r]*")
+_STRING_BODY = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+_SCALAR = re.compile(rb"-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?|true|false|null")
+_SCALAR_END = re.compile(rb"[ \t\n\r,\]}]")
+_LITERALS = {b"true": True, b"false": False, b"null": None}
+_PUNCTUATION = frozenset(b"{}[]:,")
+_QUOTE = ord('"')
+
+STRING = "string"
+SCALAR = "scalar"
+
+
+class _Skipped:
+    """Stands in for a string too long to be worth decoding."""
+
+    def __repr__(self) -> str:
+        return "SKIPPED"
+
+
+SKIPPED = _Skipped()
+
+
+class NotebookError(ValueError):
+    """Raised when a notebook is not valid JSON or not nbformat 4."""
+
+
+class _Lexer:
+    """Tokenize a JSON byte stream one chunk at a time."""
+
+    def __init__(self, stream: BinaryIO, chunk_size: int):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buf = b""
+        self.pos = 0
+        self.offset = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """Drop consumed bytes and append the next chunk; False at EOF."""
+        if self.eof:
+            return False
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.offset += self.pos
+        self.buf = self.buf[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def _error(self, message: str) -> NotebookError:
+        return NotebookError(f"{message} at byte {self.offset + self.pos}")
+
+    def tokens(self) -> Iterator[Tuple[str, Any]]:
+        while True:
+            whitespace = _WHITESPACE.match(self.buf, self.pos)
+            assert whitespace is not None  # The pattern matches the empty string
+            self.pos = whitespace.end()
+            if self.pos >= len(self.buf):
+                if not self._fill():
+                    return
+                continue
+
+            char = self.buf[self.pos]
+            if char in _PUNCTUATION:
+                self.pos += 1
+                yield chr(char), None
+            elif char == _QUOTE:
+                self.pos += 1
+                yield STRING, self._string()
+            else:
+                yield SCALAR, self._scalar()
+
+    def _string(self) -> Any:
+        parts: List[bytes] = []
+        size = 0
+        capture = True
+        while True:
+            quote = self.buf.find(b'"', self.pos)
+            end = len(self.buf) if quote == -1 else quote
+            if self.buf.find(b"\\", self.pos, end) != -1:
+                # Escapes present: let the regex find the closing quote
+                body = _STRING_BODY.match(self.buf, self.pos)
+                assert body is not None  # The pattern matches the empty string
+                end = body.end()
+            if capture:
+                size += end - self.pos
+                if size <= MAX_CAPTURE_BYTES:
+                    parts.append(self.buf[self.pos : end])
+                else:
+                    capture = False
+                    parts = []
+            if end < len(self.buf) and self.buf[end] == _QUOTE:
+                self.pos = end + 1
+                break
+            # Chunk ended inside the string (possibly mid-escape)
+            self.pos = end
+            if not self._fill():
+                raise self._error("Unterminated string")
+
+        if not capture:
+            return SKIPPED
+        raw = b"".join(parts)
+        try:
+            if b"\\" in raw:
+                return json.loads(b'"' + raw + b'"')
+            return raw.decode("utf-8")
+        except ValueError as e:
+            raise self._error(f"Invalid string ({e})")
+
+    def _scalar(self) -> Any:
+        # Numbers and literals run until the next delimiter
+        while True:
+            delimiter = _SCALAR_END.search(self.buf, self.pos)
+            if delimiter is not None or len(self.buf) - self.pos > 64:
+                break
+            if not self._fill():
+                break
+        end = delimiter.start() if delimiter is not None else len(self.buf)
+        match = _SCALAR.fullmatch(self.buf, self.pos, end)
+        if match is None:
+            raise self._error("Unexpected character")
+
+        self.pos = match.end()
+        raw = match.group()
+        if raw in _LITERALS:
+            return _LITERALS[raw]
+        if b"." in raw or b"e" in raw or b"E" in raw:
+            return float(raw)
+        return int(raw)
+
+
+def iter_values(
+    stream: BinaryIO, chunk_size: int = CHUNK_SIZE
+) -> Iterator[Tuple[tuple, Any]]:
+    """Yield (path, value) for every scalar in a JSON document.
+
+    `path` holds the object keys and array indices leading to the value.
+    Strings longer than MAX_CAPTURE_BYTES are yielded as SKIPPED.
+    """
+    lexer = _Lexer(stream, chunk_size)
+    # One frame per open container: [is_object, key or index, expecting]
+    stack: List[list] = []
+    done = False
+
+    for token, value in lexer.tokens():
+        if done:
+            raise lexer._error("Trailing data")
+        frame: list = stack[-1] if stack else []
+        expecting = frame[2] if frame else "value"
+
+        if token == STRING and expecting == "key":
+            frame[1] = value
+            frame[2] = "colon"
+        elif token == ":" and expecting == "colon":
+            frame[2] = "value"
+        elif token == "," and expecting == "comma":
+            frame[2] = "key" if frame[0] else "value"
+        elif token in "}]" and frame and frame[0] == (token == "}"):
+            if expecting not in ("comma", "key" if frame[0] else "value"):
+                raise lexer._error(f"Unexpected '{token}'")
+            stack.pop()
+            if stack:
+                stack[-1][2] = "comma"
+            else:
+                done = True
+        elif expecting == "value" and token in (STRING, SCALAR, "{", "["):
+            if frame and not frame[0]:
+                frame[1] += 1
+            if token == "{":
+                stack.append([True, None, "key"])
+            elif token == "[":
+                stack.append([False, -1, "value"])
+            else:
+                yield tuple(open_frame[1] for open_frame in stack), value
+                if stack:
+                    stack[-1][2] = "comma"
+                else:
+                    done = True
+        else:
+            raise lexer._error(f"Unexpected {token}")
+
+    if not done:
+        raise lexer._error("Unexpected end of file")
+
+
+class NotebookReport(NamedTuple):
+    """Execution state of one notebook."""
+
+    path: Path
+    code_cells: int
+    unexecuted: List[int]
+    errors: List[Tuple[int, str]]
+
+    @property
+    def passed(self) -> bool:
+        return not self.unexecuted and not self.errors
+
+    def problems(self) -> List[str]:
+        """Describe what is wrong with the notebook, cells numbered from 1."""
+        problems = []
+        if self.unexecuted:
+            cells = ", ".join(str(number) for number in self.unexecuted)
+            problems.append(
+                f"{len(self.unexecuted)} of {self.code_cells} code cells "
+                f"have not been executed (cells {cells})"
+            )
+        for number, error in self.errors:
+            problems.append(f"cell {number} raised {error}")
+        return problems
+
+
+def _has_text(value: Any) -> bool:
+    return value is SKIPPED or (isinstance(value, str) and bool(value.strip()))
+
+
+def inspect_notebook(path: Path, chunk_size: int = CHUNK_SIZE) -> NotebookReport:
+    """Stream a notebook and report unexecuted cells and error outputs."""
+    nbformat = None
+    cells: Dict[int, Dict[str, Any]] = {}
+
+    with open(path, "rb") as f:
+        for location, value in iter_values(f, chunk_size):
+            if location == ("nbformat",):
+                nbformat = value
+            if len(location) < 3 or location[0] != "cells":
+                continue
+
+            cell = cells.setdefault(
+                location[1],
+                {"type": None, "executed": False, "source": False, "outputs": {}},
+            )
+            field = location[2]
+            if field == "cell_type" and len(location) == 3:
+                cell["type"] = value
+            elif field == "execution_count" and len(location) == 3:
+                cell["executed"] = value is not None
+            elif field == "source" and len(location) <= 4:
+                cell["source"] = cell["source"] or _has_text(value)
+            elif field == "outputs" and len(location) == 5:
+                output = cell["outputs"].setdefault(location[3], {})
+                output[location[4]] = value
+
+    if not isinstance(nbformat, int) or nbformat < 4:
+        raise NotebookError(f"Unsupported notebook format (nbformat {nbformat})")
+
+    code_cells = 0
+    unexecuted: List[int] = []
+    errors: List[Tuple[int, str]] = []
+    for index in sorted(cells):
+        cell = cells[index]
+        if cell["type"] != "code":
+            continue
+        code_cells += 1
+        if cell["source"] and not cell["executed"]:
+            unexecuted.append(index + 1)
+        for output in cell["outputs"].values():
+            if output.get("output_type") == "error":
+                errors.append((index + 1, _describe_error(output)))
+
+    return NotebookReport(path, code_cells, unexecuted, errors)
+
+
+def _describe_error(output: Dict[str, Any]) -> str:
+    name = output.get("ename")
+    name = name if isinstance(name, str) and name else "an error"
+    message = output.get("evalue")
+    if isinstance(message, str) and message:
+        return f"{name}: {message.splitlines()[0]}"
+    return name
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+parse_cache.py - AgenticOps Value Train Parse Cache
+
+Persistent on-disk cache of parsed YAML (pipeline.yml, ACTIVE_SESSION.md
+sections) keyed by file path, size, mtime_ns and content hash.
+Set VALUETRAIN_NO_CACHE=1 to bypass the cache entirely.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from fs_utils import atomic_write_text
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_NAME = ".valuetrain-cache"
+CACHE_DISABLE_ENV = "VALUETRAIN_NO_CACHE"
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+
+# Files modified this close to the time their entry was written may change
+# again without a visible mtime change on coarse-grained file systems, so
+# their content hash is always re-verified.
+RACY_WINDOW_NS = 2_000_000_000
+
+
+class ParseCache:
+    """Size-bounded cache of parsed file contents with automatic invalidation."""
+
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    @classmethod
+    def for_project(cls, project_root: Path) -> Optional["ParseCache"]:
+        """Return the project's cache, or None when caching is disabled."""
+        if os.environ.get(CACHE_DISABLE_ENV, "").lower() in ("1", "true", "yes"):
+            return None
+        return cls(project_root / CACHE_DIR_NAME)
+
+    def _entry_path(self, path: Path, key: str) -> Path:
+        import hashlib
+
+        digest = hashlib.sha256(f"{path}\0{key}".encode()).hexdigest()
+        return self.cache_dir / f"{digest[:32]}.json"
+
+    def load(self, path: Path, key: str, parse: Callable[[str], Any]) -> Any:
+        """Return `parse(file content)`, served from the cache when unchanged.
+
+        Parse errors propagate and are never cached. Cache read/write failures
+        are logged and fall back to parsing the file directly.
+        """
+        import hashlib
+        import time
+
+        path = path.resolve()
+        entry_path = self._entry_path(path, key)
+        stat = path.stat()
+        entry = self._read_entry(entry_path, path, key)
+
+        if (
+            entry is not None
+            and entry["size"] == stat.st_size
+            and entry["mtime_ns"] == stat.st_mtime_ns
+            and entry["cached_at_ns"] - stat.st_mtime_ns > RACY_WINDOW_NS
+        ):
+            self._touch(entry_path)
+            return entry["value"]
+
+        with open(path, "r") as f:
+            content = f.read()
+        content_hash = hashlib.sha256(content.encode()).hexdigest()
+
+        if entry is not None and entry["sha256"] == content_hash:
+            value = entry["value"]
+        else:
+            value = parse(content)
+
+        self._write_entry(
+            entry_path,
+            {
+                "path": str(path),
+                "key": key,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": content_hash,
+                "cached_at_ns": time.time_ns(),
+                "value": value,
+            },
+        )
+        return value
+
+    def _read_entry(self, entry_path: Path, path: Path, key: str) -> Optional[dict]:
+        import json
+
+        try:
+            with open(entry_path, "r") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable cache entry {entry_path}: {e}")
+            return None
+
+        if entry.get("path") != str(path) or entry.get("key") != key:
+            return None
+        return entry
+
+    def _write_entry(self, entry_path: Path, entry: dict):
+        import json
+
+        try:
+            serialized = json.dumps(entry)
+        except (TypeError, ValueError):
+            # Values YAML parsed into non-JSON types (e.g. dates) stay uncached
+            return
+
+        try:
+            atomic_write_text(entry_path, serialized)
+            self._evict()
+        except OSError as e:
+            logger.debug(f"Could not write cache entry {entry_path}: {e}")
+
+    def _touch(self, entry_path: Path):
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+    def _evict(self):
+        """Remove least recently used entries until the cache fits its budget."""
+        entries = []
+        total = 0
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith(".json"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                    total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+
+        for _, size, entry_path in sorted(entries):
+            try:
+                os.unlink(entry_path)
+            except OSError:
+                continue
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+
+def load_yaml_file(path: Path, cache: Optional[ParseCache] = None) -> Any:
+    """Load a YAML file, consulting the parse cache when one is given."""
+    import yaml
+
+    if cache is None:
+        with open(path, "r") as f:
+            return yaml.safe_load(f)
+    return cache.load(path, "yaml", yaml.safe_load)
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+pipeline_graph.py - AgenticOps Value Train Pipeline Graph
+
+Compiles config/pipeline.yml into an indexed phase graph.
+Provides O(1) phase, mode, owner and artifact lookups, successor and
+predecessor tables, cycle detection and reachability queries.
+"""
+
+from typing import Dict, FrozenSet, List, Optional, Tuple, Union
+
+
+class PipelineGraph:
+    """Indexed, compiled view of a pipeline configuration."""
+
+    def __init__(self, pipeline_config: Optional[dict]):
+        self.config = pipeline_config or {}
+        self.phases: Dict[str, dict] = {}
+        self.modes: Dict[str, dict] = {}
+        self.agents: Dict[str, dict] = {}
+        self.successors: Dict[str, Tuple[str, ...]] = {}
+        self.predecessors: Dict[str, Tuple[str, ...]] = {}
+        self.phases_by_mode: Dict[str, List[str]] = {}
+        self.phases_by_owner: Dict[str, List[str]] = {}
+        self.artifact_phases: Dict[str, List[str]] = {}
+        self._reachable: Dict[str, FrozenSet[str]] = {}
+        self._router = None
+
+        for phase in self.config.get("phases", []) or []:
+            name = phase.get("name")
+            # The first definition wins, matching a linear scan of the list
+            if name is not None and name not in self.phases:
+                self.phases[name] = phase
+        for mode in self.config.get("modes", []) or []:
+            if mode.get("name") is not None:
+                self.modes.setdefault(mode["name"], mode)
+        for agent in self.config.get("agents", []) or []:
+            if agent.get("name") is not None:
+                self.agents.setdefault(agent["name"], agent)
+
+        predecessors: Dict[str, List[str]] = {name: [] for name in self.phases}
+        for name, phase in self.phases.items():
+            targets = _as_list(phase.get("next_phase"))
+            self.successors[name] = tuple(targets)
+            for target in targets:
+                predecessors.setdefault(target, []).append(name)
+
+            if phase.get("mode") is not None:
+                self.phases_by_mode.setdefault(phase["mode"], []).append(name)
+            if phase.get("owner") is not None:
+                self.phases_by_owner.setdefault(phase["owner"], []).append(name)
+            for artifact in phase.get("artifacts", []) or []:
+                self.artifact_phases.setdefault(artifact, []).append(name)
+        self.predecessors = {name: tuple(p) for name, p in predecessors.items()}
+
+        self.cycles = self._find_cycles()
+        self._cycle_index = {
+            name: index for index, cycle in enumerate(self.cycles) for name in cycle
+        }
+
+    @classmethod
+    def coerce(cls, pipeline: Union["PipelineGraph", dict]) -> "PipelineGraph":
+        """Return `pipeline` as a compiled graph, compiling a raw config."""
+        if isinstance(pipeline, PipelineGraph):
+            return pipeline
+        return cls(pipeline)
+
+    def phase(self, name: str) -> Optional[dict]:
+        """Return the phase definition, or None if undefined."""
+        return self.phases.get(name)
+
+    def next_phase(self, name: str) -> Optional[str]:
+        """Return the configured next_phase of a phase."""
+        phase = self.phases.get(name)
+        return phase.get("next_phase") if phase else None
+
+    def artifacts(self, name: str) -> List[str]:
+        """Return the artifacts required by a phase."""
+        phase = self.phases.get(name)
+        return (phase.get("artifacts") or []) if phase else []
+
+    def mode_of(self, name: str) -> Optional[dict]:
+        """Return the mode definition a phase runs in."""
+        phase = self.phases.get(name)
+        mode = phase.get("mode") if phase else None
+        return self.modes.get(mode) if mode is not None else None
+
+    def owner_of(self, name: str) -> Optional[dict]:
+        """Return the agent definition that owns a phase."""
+        phase = self.phases.get(name)
+        owner = phase.get("owner") if phase else None
+        return self.agents.get(owner) if owner is not None else None
+
+    def undefined_targets(self) -> List[Tuple[str, str]]:
+        """Return (phase, target) edges whose target phase is not defined."""
+        return [
+            (name, target)
+            for name, targets in self.successors.items()
+            for target in targets
+            if target not in self.phases
+        ]
+
+    def is_cyclic(self) -> bool:
+        """Return True if the pipeline contains at least one loop."""
+        return bool(self.cycles)
+
+    def cycle_of(self, name: str) -> Optional[List[str]]:
+        """Return the loop a phase belongs to, in pipeline order, if any."""
+        index = self._cycle_index.get(name)
+        return self.cycles[index] if index is not None else None
+
+    @property
+    def router(self):
+        """Return the compiled artifact router, built on first use."""
+        if self._router is None:
+            from artifact_router import ArtifactRouter
+
+            self._router = ArtifactRouter(self.config, self.artifact_phases)
+        return self._router
+
+    def reachable_from(self, name: str) -> FrozenSet[str]:
+        """Return every phase reachable from `name` in one or more steps."""
+        if name not in self._reachable:
+            seen = set()
+            stack = list(self.successors.get(name, ()))
+            while stack:
+                current = stack.pop()
+                if current in seen:
+                    continue
+                seen.add(current)
+                stack.extend(self.successors.get(current, ()))
+            self._reachable[name] = frozenset(seen)
+        return self._reachable[name]
+
+    def can_reach(self, source: str, target: str) -> bool:
+        """Return True if `target` is reachable from `source`."""
+        return target in self.reachable_from(source)
+
+    def _find_cycles(self) -> List[List[str]]:
+        """Find loops with an iterative Tarjan strongly-connected-components pass."""
+        index_of: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack = set()
+        stack: List[str] = []
+        cycles: List[List[str]] = []
+        order = {name: position for position, name in enumerate(self.phases)}
+
+        for root in self.phases:
+            if root in index_of:
+                continue
+            work = [(root, iter(self.successors.get(root, ())))]
+            index_of[root] = lowlink[root] = len(index_of)
+            stack.append(root)
+            on_stack.add(root)
+
+            while work:
+                node, children = work[-1]
+                advanced = False
+                for child in children:
+                    if child not in self.phases:
+                        continue
+                    if child not in index_of:
+                        index_of[child] = lowlink[child] = len(index_of)
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(self.successors.get(child, ()))))
+                        advanced = True
+                        break
+                    if child in on_stack:
+                        lowlink[node] = min(lowlink[node], index_of[child])
+                if advanced:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index_of[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or node in self.successors.get(node, ()):
+                        cycles.append(sorted(component, key=order.__getitem__))
+
+        return sorted(cycles, key=lambda cycle: order[cycle[0]])
+
+
+def _as_list(value) -> List[str]:
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        return [item for item in value if item is not None]
+    return [value]
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+session_diff.py - AgenticOps Value Train Session Diff
+
+Describes a session update section by section instead of diffing the
+whole document: only `## Section` YAML blocks whose text changed are
+compared. Produces a streaming unified diff with hunk line numbers relative
+to the full file, and an RFC 6902 JSON patch over the parsed sections.
+"""
+
+from difflib import SequenceMatcher
+from typing import Any, Iterator, List, NamedTuple
+
+from session_model import SessionDocument
+
+DIFF_CONTEXT_LINES = 3
+
+
+class SectionChange(NamedTuple):
+    """A section whose YAML differs; start lines are 0-based file lines."""
+
+    name: str
+    old_yaml: str
+    new_yaml: str
+    old_start: int
+    new_start: int
+
+
+def _yaml_start(document: SessionDocument, name: str) -> int:
+    span = document.sections.get(name)
+    if span is None:
+        return document.content.count("\n") + 1
+    if span.yaml_start_line is None:
+        return span.heading_line + 1
+    return span.yaml_start_line
+
+
+def section_changes(old_content: str, new_content: str) -> Iterator[SectionChange]:
+    """Yield the sections whose YAML text changed, in new-document order."""
+    old = SessionDocument(old_content)
+    new = SessionDocument(new_content)
+    names = list(new.sections) + [
+        name for name in old.sections if name not in new.sections
+    ]
+    for name in names:
+        old_yaml, new_yaml = old.section_yaml(name), new.section_yaml(name)
+        if old_yaml != new_yaml:
+            yield SectionChange(
+                name, old_yaml, new_yaml, _yaml_start(old, name), _yaml_start(new, name)
+            )
+
+
+def _format_range(start: int, stop: int) -> str:
+    """Format a 0-based [start, stop) line range for a unified diff header."""
+    length = stop - start
+    if length == 1:
+        return f"{start + 1}"
+    return f"{start + 1 if length else start},{length}"
+
+
+def iter_unified_diff(
+    old_content: str,
+    new_content: str,
+    path: str = "ACTIVE_SESSION.md",
+    context: int = DIFF_CONTEXT_LINES,
+) -> Iterator[str]:
+    """Yield unified diff lines for the changed sections, one hunk at a time.
+
+    Hunk headers carry file line numbers and name the section, like git's
+    function context.
+    """
+    header_written = False
+    for change in section_changes(old_content, new_content):
+        if not header_written:
+            yield f"--- a/{path}"
+            yield f"+++ b/{path}"
+            header_written = True
+
+        old_lines = change.old_yaml.split("\n") if change.old_yaml else []
+        new_lines = change.new_yaml.split("\n") if change.new_yaml else []
+        matcher = SequenceMatcher(a=old_lines, b=new_lines, autojunk=False)
+        for group in matcher.get_grouped_opcodes(context):
+            first, last = group[0], group[-1]
+            old_range = _format_range(
+                change.old_start + first[1], change.old_start + last[2]
+            )
+            new_range = _format_range(
+                change.new_start + first[3], change.new_start + last[4]
+            )
+            yield f"@@ -{old_range} +{new_range} @@ ## {change.name}"
+            for tag, a_start, a_end, b_start, b_end in group:
+                if tag == "equal":
+                    for line in old_lines[a_start:a_end]:
+                        yield f" {line}"
+                    continue
+                for line in old_lines[a_start:a_end]:
+                    yield f"-{line}"
+                for line in new_lines[b_start:b_end]:
+                    yield f"+{line}"
+
+
+def _pointer(parts: List[Any]) -> str:
+    return "".join(
+        "/" + str(part).replace("~", "~0").replace("/", "~1") for part in parts
+    )
+
+
+def _diff_values(old: Any, new: Any, parts: List[Any], ops: List[dict]):
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": _pointer(parts + [key])})
+        for key, value in new.items():
+            if key not in old:
+                ops.append(
+                    {"op": "add", "path": _pointer(parts + [key]), "value": value}
+                )
+            else:
+                _diff_values(old[key], value, parts + [key], ops)
+    elif isinstance(old, list) and isinstance(new, list):
+        common = min(len(old), len(new))
+        for index in range(common):
+            _diff_values(old[index], new[index], parts + [index], ops)
+        for index in range(common, len(new)):
+            ops.append(
+                {"op": "add", "path": _pointer(parts + [index]), "value": new[index]}
+            )
+        # Remove from the end so earlier indexes stay valid
+        for index in range(len(old) - 1, common - 1, -1):
+            ops.append({"op": "remove", "path": _pointer(parts + [index])})
+    elif old != new or type(old) is not type(new):
+        ops.append({"op": "replace", "path": _pointer(parts), "value": new})
+
+
+def json_patch(old_content: str, new_content: str) -> List[dict]:
+    """Return an RFC 6902 patch from the old to the new parsed sections.
+
+    Paths start with the section name, e.g. `/Current Work/phase`. Only
+    sections whose YAML text changed are parsed.
+    """
+    import yaml
+
+    ops: List[dict] = []
+    for change in section_changes(old_content, new_content):
+        old = yaml.safe_load(change.old_yaml) if change.old_yaml else None
+        new = yaml.safe_load(change.new_yaml) if change.new_yaml else None
+        if old is None:
+            ops.append({"op": "add", "path": _pointer([change.name]), "value": new})
+        elif new is None:
+            ops.append({"op": "remove", "path": _pointer([change.name])})
+        else:
+            _diff_values(old, new, [change.name], ops)
+    return ops
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+session_journal.py - AgenticOps Value Train Session Journal
+
+Keeps ACTIVE_SESSION.md a constant size however many cycles an engagement
+runs. Phase transitions are appended to an append-only JSON Lines journal
+next to the session (ACTIVE_SESSION.journal.jsonl), and only the newest
+Session Notes decisions stay inline; older ones are rolled into the
+journal on every conductor write or by an explicit compaction.
+"""
+
+import logging
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+from session_model import DEFAULT_INLINE_DECISIONS, SessionDocument
+from session_store import DEFAULT_LOCK_TIMEOUT, bump_version, write_session
+from yaml_patch import patch_or_dump
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_SUFFIX = ".journal.jsonl"
+
+
+def journal_path_for(session_path: Path) -> Path:
+    """Return the journal file of a session file."""
+    return session_path.with_name(session_path.stem + JOURNAL_SUFFIX)
+
+
+def append_journal(journal_path: Path, entries: List[dict]):
+    """Append entries as JSON lines in a single write and fsync."""
+    import json
+    import os
+
+    if not entries:
+        return
+    lines = "".join(json.dumps(entry, sort_keys=True) + "\n" for entry in entries)
+    journal_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(journal_path, "a") as f:
+        f.write(lines)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def read_journal(journal_path: Path) -> Iterator[dict]:
+    """Yield journal entries in the order they were recorded."""
+    import json
+
+    try:
+        with open(journal_path, "r") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    except FileNotFoundError:
+        return
+
+
+def offload_decisions(content: str, keep: int) -> Tuple[str, List]:
+    """Keep the newest `keep` Session Notes decisions inline.
+
+    Returns the new content and the older decisions that were removed.
+    """
+    document = SessionDocument(content)
+    notes = document.section("Session Notes")
+    decisions = notes.get("decisions") if isinstance(notes, dict) else None
+    if not isinstance(decisions, list) or len(decisions) <= keep:
+        return content, []
+
+    split = len(decisions) - max(keep, 0)
+    overflow, notes["decisions"] = decisions[:split], decisions[split:]
+    raw = document.section_yaml("Session Notes")
+    new_content = document.replace_sections(
+        {"Session Notes": patch_or_dump(raw, notes)}
+    )
+    return new_content, overflow
+
+
+def _entries(
+    content: str, overflow: List, transition: Optional[Tuple[str, str]]
+) -> List[dict]:
+    from datetime import datetime
+
+    document = SessionDocument(content)
+    metadata = document.section("Session Metadata")
+    current_work = document.section("Current Work")
+    base = {
+        "recorded_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "session_id": metadata.get("session_id"),
+        "version": metadata.get("version"),
+    }
+    entries = [dict(base, type="decision", decision=item) for item in overflow]
+    if transition is not None:
+        from_phase, to_phase = transition
+        entries.append(
+            dict(
+                base,
+                type="transition",
+                from_phase=from_phase,
+                to_phase=to_phase,
+                mode=current_work.get("mode"),
+            )
+        )
+    return entries
+
+
+def write_journaled_session(
+    session_path: Path,
+    content: str,
+    transition: Optional[Tuple[str, str]] = None,
+    keep: int = DEFAULT_INLINE_DECISIONS,
+    timeout: float = DEFAULT_LOCK_TIMEOUT,
+) -> int:
+    """Write a session, moving old decisions and the transition to the journal.
+
+    The journal is appended under the session lock before the session is
+    replaced, so a failed append never loses the offloaded decisions; a
+    replace that fails afterwards at worst leaves entries that are recorded
+    again by the retry. Returns the number of decisions offloaded.
+    """
+    content, overflow = offload_decisions(content, keep)
+    entries = _entries(content, overflow, transition)
+    write_session(
+        session_path,
+        content,
+        timeout,
+        before_replace=lambda: append_journal(journal_path_for(session_path), entries),
+    )
+    return len(overflow)
+
+
+def compact_session(
+    session_path: Path,
+    keep: int = DEFAULT_INLINE_DECISIONS,
+    timeout: float = DEFAULT_LOCK_TIMEOUT,
+) -> int:
+    """Roll all but the newest `keep` decisions into the journal.
+
+    Returns the number of decisions moved; the session is only rewritten
+    when there is something to move.
+    """
+    with open(session_path, "r") as f:
+        content = f.read()
+    _, overflow = offload_decisions(content, keep)
+    if not overflow:
+        return 0
+    return write_journaled_session(
+        session_path, bump_version(content), keep=keep, timeout=timeout
+    )
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+session_model.py - AgenticOps Value Train Session Model
+
+Shared single-pass parser for ACTIVE_SESSION.md.
+Indexes every `## Section` and its fenced YAML block once, then parses
+section YAML lazily so callers only pay for the sections they read.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+
+SESSION_RELATIVE_PATH = Path("docs") / "session-context" / "ACTIVE_SESSION.md"
+
+# Session Metadata version key and default lock wait used by session_store
+VERSION_KEY = "version"
+DEFAULT_LOCK_TIMEOUT = 10.0
+# Session Notes decisions kept inline by session_journal
+DEFAULT_INLINE_DECISIONS = 20
+
+
+class SectionSpan(NamedTuple):
+    """Location of a `## Section` heading and its first fenced YAML block.
+
+    Line numbers are 0-based indexes into the document's lines. Offsets are
+    character offsets into the document text. `yaml_start`/`yaml_end` bound
+    the YAML body (exclusive of the fences) and are None when the section has
+    no fenced YAML block.
+    """
+
+    name: str
+    heading_line: int
+    heading_offset: int
+    yaml_start_line: Optional[int]
+    yaml_end_line: Optional[int]
+    yaml_start: Optional[int]
+    yaml_end: Optional[int]
+
+
+def session_path_for(project_root: Path) -> Path:
+    """Return the ACTIVE_SESSION.md path for a project root."""
+    return project_root / SESSION_RELATIVE_PATH
+
+
+def load_session_section(path: Path, name: str, cache=None) -> Any:
+    """Load one parsed section of a session file, via the parse cache if given."""
+    if cache is None:
+        return SessionDocument.from_path(path).section(name)
+    return cache.load(
+        path, f"section:{name}", lambda text: SessionDocument(text).section(name)
+    )
+
+
+class SessionDocument:
+    """Single-pass index over an ACTIVE_SESSION.md document."""
+
+    def __init__(self, content: str):
+        self.content = content
+        self.sections: Dict[str, SectionSpan] = {}
+        self._parsed: Dict[str, Any] = {}
+        self._scan()
+
+    @classmethod
+    def from_path(cls, path: Path) -> "SessionDocument":
+        """Read and index a session file."""
+        with open(path, "r") as f:
+            return cls(f.read())
+
+    def _scan(self):
+        """Record heading and fenced YAML offsets for every section."""
+        offset = 0
+        name: Optional[str] = None
+        heading_line = heading_offset = 0
+        yaml_start_line: Optional[int] = None
+        yaml_start: Optional[int] = None
+        done = False
+
+        for line_num, line in enumerate(self.content.split("\n")):
+            stripped = line.strip()
+            if line.startswith("## "):
+                if name is not None and name not in self.sections:
+                    self._record_without_yaml(name, heading_line, heading_offset)
+                name = line[3:].strip()
+                heading_line, heading_offset = line_num, offset
+                yaml_start_line = yaml_start = None
+                done = name in self.sections
+            elif name is not None and not done:
+                if yaml_start_line is None and stripped == "```yaml":
+                    yaml_start_line = line_num + 1
+                    yaml_start = offset + len(line) + 1
+                elif yaml_start_line is not None and stripped == "```":
+                    self.sections[name] = SectionSpan(
+                        name,
+                        heading_line,
+                        heading_offset,
+                        yaml_start_line,
+                        line_num,
+                        yaml_start,
+                        offset,
+                    )
+                    done = True
+            offset += len(line) + 1
+
+        if name is not None and name not in self.sections:
+            if yaml_start_line is not None:
+                # Unterminated fence: the block runs to the end of the document
+                self.sections[name] = SectionSpan(
+                    name,
+                    heading_line,
+                    heading_offset,
+                    yaml_start_line,
+                    self.content.count("\n") + 1,
+                    min(yaml_start, len(self.content)),
+                    len(self.content),
+                )
+            else:
+                self._record_without_yaml(name, heading_line, heading_offset)
+
+    def _record_without_yaml(self, name: str, heading_line: int, heading_offset: int):
+        self.sections[name] = SectionSpan(
+            name, heading_line, heading_offset, None, None, None, None
+        )
+
+    def section_names(self) -> List[str]:
+        """Return section names in document order."""
+        return list(self.sections)
+
+    def has_yaml(self, name: str) -> bool:
+        """Return True if the section exists and has a fenced YAML block."""
+        span = self.sections.get(name)
+        return span is not None and span.yaml_start is not None
+
+    def section_yaml(self, name: str) -> str:
+        """Return the raw YAML text of a section, or "" if absent."""
+        span = self.sections.get(name)
+        if span is None or span.yaml_start is None or span.yaml_end is None:
+            return ""
+        body = self.content[span.yaml_start : span.yaml_end]
+        return body[:-1] if body.endswith("\n") else body
+
+    def section(self, name: str) -> Any:
+        """Return the parsed YAML of a section, parsing it on first access.
+
+        Missing sections parse to an empty dict. YAML errors propagate.
+        """
+        if name not in self._parsed:
+            import yaml
+
+            raw = self.section_yaml(name)
+            self._parsed[name] = (yaml.safe_load(raw) if raw else None) or {}
+        return self._parsed[name]
+
+    def raw_sections(self) -> Dict[str, str]:
+        """Return raw YAML text for every section that has a YAML block."""
+        return {
+            name: self.section_yaml(name)
+            for name in self.sections
+            if self.has_yaml(name) and self.section_yaml(name)
+        }
+
+    def replace_sections(self, replacements: Dict[str, str]) -> str:
+        """Return the document with the YAML bodies of several sections replaced.
+
+        All replacements are applied in one pass over the recorded offsets and
+        the result is produced with a single join. Sections that are missing or
+        have no fenced YAML block are left untouched.
+        """
+        bounds = []
+        for name in replacements:
+            span = self.sections.get(name)
+            if span and span.yaml_start is not None and span.yaml_end is not None:
+                bounds.append((span.yaml_start, span.yaml_end, name))
+        if not bounds:
+            return self.content
+
+        chunks = []
+        cursor = 0
+        for start, end, name in sorted(bounds):
+            chunks.append(self.content[cursor:start])
+            chunks.append(replacements[name].strip() + "\n")
+            cursor = end
+        chunks.append(self.content[cursor:])
+        return "".join(chunks)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+session_store.py - AgenticOps Value Train Session Store
+
+Safe writes of ACTIVE_SESSION.md for concurrent gate and conductor runs.
+Each write holds an advisory lock on the session, replaces the file
+atomically with fsync, and checks the optimistic `version` counter in
+Session Metadata: a writer must bump the version it read by one, so a
+writer working from a stale copy is rejected instead of clobbering.
+"""
+
+import logging
+from pathlib import Path
+from typing import Callable, Optional
+
+from fs_utils import atomic_write_text, file_lock
+from session_model import DEFAULT_LOCK_TIMEOUT, VERSION_KEY, SessionDocument
+from yaml_patch import patch_or_dump
+
+logger = logging.getLogger(__name__)
+
+
+class StaleSessionError(RuntimeError):
+    """Raised when the session changed since the writer read it."""
+
+
+def session_version(content: str) -> Optional[int]:
+    """Return the Session Metadata version, 0 if unset, None without metadata."""
+    document = SessionDocument(content)
+    if not document.has_yaml("Session Metadata"):
+        return None
+    metadata = document.section("Session Metadata") or {}
+    return int(metadata.get(VERSION_KEY) or 0)
+
+
+def bump_version(content: str) -> str:
+    """Return session content with its Session Metadata version incremented."""
+    document = SessionDocument(content)
+    if not document.has_yaml("Session Metadata"):
+        return content
+    metadata = document.section("Session Metadata") or {}
+    metadata[VERSION_KEY] = int(metadata.get(VERSION_KEY) or 0) + 1
+    raw = document.section_yaml("Session Metadata")
+    return document.replace_sections({"Session Metadata": patch_or_dump(raw, metadata)})
+
+
+def write_session(
+    path: Path,
+    content: str,
+    timeout: float = DEFAULT_LOCK_TIMEOUT,
+    before_replace: Optional[Callable[[], None]] = None,
+) -> Optional[int]:
+    """Atomically replace a session file if its version is still current.
+
+    `content` must carry the version read from disk plus one. Sessions
+    without Session Metadata are written without a version check.
+    `before_replace` runs under the lock once the version check passed and
+    before the file is replaced; if it raises, the session is left as it
+    was. Returns the version written; raises StaleSessionError or
+    LockTimeout.
+    """
+    new_version = session_version(content)
+    with file_lock(path, timeout):
+        if new_version is not None and path.exists():
+            with open(path, "r") as f:
+                current_version = session_version(f.read()) or 0
+            if new_version != current_version + 1:
+                raise StaleSessionError(
+                    f"{path} is at version {current_version} but the update "
+                    f"is for version {new_version - 1}; reload and retry"
+                )
+        if before_replace is not None:
+            before_replace()
+        atomic_write_text(path, content, fsync=True)
+    return new_version
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+startup_benchmark.py - AgenticOps Value Train Startup Benchmark
+
+Measures the import cost of each script entry point with `python -X importtime`
+and fails when any entry point exceeds its startup budget.
+"""
+
+import argparse
+import logging
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from logging_setup import configure_logging
+
+logger = logging.getLogger(__name__)
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+ENTRY_POINTS = [
+    "check_todo",
+    "check_artifacts",
+    "conductor_update",
+    "migrate_session",
+    "valuetrain",
+    "gate_daemon",
+]
+
+# Modules that must stay out of an entry point's import graph
+DEFERRED_MODULES = ["yaml", "json", "datetime", "concurrent.futures"]
+
+DEFAULT_BUDGET_MS = 40.0
+
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    """Parse `-X importtime` output into cumulative microseconds per module."""
+    cumulative = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        cumulative[parts[2].strip()] = int(parts[1])
+    return cumulative
+
+
+def measure_entry_point(
+    module: str, python: str = sys.executable, repeat: int = 3
+) -> Dict[str, object]:
+    """Import an entry point in fresh interpreters and report its best timing."""
+    best: Optional[int] = None
+    imported: List[str] = []
+
+    for _ in range(repeat):
+        result = subprocess.run(
+            [python, "-X", "importtime", "-c", f"import {module}"],
+            cwd=SCRIPTS_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        timings = parse_importtime(result.stderr)
+        total = timings.get(module, 0)
+        if best is None or total < best:
+            best = total
+            imported = list(timings)
+
+    return {
+        "module": module,
+        "cumulative_ms": (best or 0) / 1000,
+        "deferred_violations": [m for m in DEFERRED_MODULES if m in imported],
+    }
+
+
+def main():
+    """Main function to benchmark script startup time."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark entry point import time against a budget"
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=DEFAULT_BUDGET_MS,
+        help=f"Per entry point import budget in ms (default: {DEFAULT_BUDGET_MS})",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Fresh interpreter runs per entry point; the best is kept",
+    )
+    parser.add_argument(
+        "--entry-point",
+        action="append",
+        choices=ENTRY_POINTS,
+        help="Entry point to measure (repeatable, default: all)",
+    )
+
+    args = parser.parse_args()
+    configure_logging()
+
+    failures = 0
+    for module in args.entry_point or ENTRY_POINTS:
+        report = measure_entry_point(module, repeat=args.repeat)
+        cumulative_ms = report["cumulative_ms"]
+        violations = report["deferred_violations"]
+
+        status = "✅"
+        if cumulative_ms > args.budget_ms or violations:
+            status = "❌"
+            failures += 1
+        logger.info(
+            f"{status} {module}: {cumulative_ms:.1f} ms (budget {args.budget_ms} ms)"
+        )
+        if violations:
+            logger.error(f"  Eagerly imports deferred modules: {violations}")
+
+    if failures:
+        logger.error(f"{failures} entry point(s) exceeded the startup budget")
+        sys.exit(1)
+
+    logger.info("Startup benchmark complete.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+valuetrain.py - AgenticOps Value Train Combined CLI
+
+Runs the CI gates in a single process.
+`gate` loads pipeline.yml and ACTIVE_SESSION.md once, runs the todo and
+artifact gates concurrently, then optionally advances the conductor.
+`history` rebuilds checklist progress and phase cycle times from git.
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+from typing import List, NamedTuple
+
+from logging_setup import configure_logging
+from parse_cache import ParseCache, load_yaml_file
+from pipeline_graph import PipelineGraph
+from session_model import SessionDocument, session_path_for
+
+logger = logging.getLogger(__name__)
+
+
+class GateResult(NamedTuple):
+    """Outcome of a single gate."""
+
+    name: str
+    passed: bool
+    messages: List[str]
+    error: bool = False
+
+
+def run_todo_gate(project_root: Path, current_work: dict) -> GateResult:
+    """Check the active mode's checklist for unchecked items."""
+    from check_todo import check_unchecked_items, find_active_checklist
+
+    current_mode = current_work.get("mode")
+    if not current_mode:
+        return GateResult("todo", False, ["No current mode found"], error=True)
+
+    checklist_path = find_active_checklist(project_root, current_mode)
+    unchecked_items = check_unchecked_items(checklist_path)
+    messages = [f"Line {line_num}: {item}" for line_num, item in unchecked_items]
+    if unchecked_items:
+        messages.insert(
+            0, f"{len(unchecked_items)} unchecked items in {checklist_path.name}"
+        )
+    return GateResult("todo", not unchecked_items, messages)
+
+
+def run_artifact_gate(
+    project_root: Path, pipeline: PipelineGraph, current_phase: str
+) -> GateResult:
+    """Check that the current phase's artifacts exist."""
+    from artifact_index import ArtifactIndex
+    from check_artifacts import check_artifacts_exist, resolve_artifact_paths
+
+    if pipeline.phase(current_phase) is None:
+        return GateResult(
+            "artifacts", True, [f"Phase '{current_phase}' not in pipeline"]
+        )
+
+    artifact_paths = resolve_artifact_paths(
+        project_root, pipeline.artifacts(current_phase), pipeline, current_phase
+    )
+    index = ArtifactIndex.for_project(project_root)
+    missing_artifacts = check_artifacts_exist(artifact_paths, index)
+    index.save()
+    messages = [f"Missing: {path}" for path in missing_artifacts]
+    return GateResult("artifacts", not missing_artifacts, messages)
+
+
+def _collect(future, name: str) -> GateResult:
+    """Return a gate's result, converting script-level exits into errors."""
+    try:
+        return future.result()
+    except SystemExit:
+        return GateResult(name, False, ["Gate aborted, see log above"], error=True)
+
+
+def advance_phase(
+    project_root: Path,
+    document: SessionDocument,
+    pipeline: PipelineGraph,
+    current_phase: str,
+    dry_run: bool,
+) -> bool:
+    """Advance the session to the next phase. Return False on failure."""
+    from conductor_update import (
+        mark_artifact_baseline,
+        save_active_session,
+        update_session_phase,
+    )
+
+    next_phase = pipeline.next_phase(current_phase)
+    if not next_phase:
+        logger.info(f"No next phase found for '{current_phase}' - pipeline complete!")
+        return True
+
+    next_phase_info = pipeline.phase(next_phase)
+    if not next_phase_info:
+        logger.error(f"Phase '{next_phase}' not found in pipeline configuration")
+        return False
+
+    logger.info(f"Advancing to phase: {next_phase}")
+    new_content = update_session_phase(
+        project_root,
+        document.content,
+        document.raw_sections(),
+        next_phase,
+        next_phase_info,
+    )
+    if dry_run:
+        logger.info(f"DRY RUN - Would advance ACTIVE_SESSION.md to {next_phase}")
+    else:
+        save_active_session(
+            project_root, new_content, transition=(current_phase, next_phase)
+        )
+        mark_artifact_baseline(project_root, pipeline, current_phase)
+    return True
+
+
+def gate(args) -> int:
+    """Run all CI gates in one process and return the exit code."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    project_root = args.project_root
+    cache = ParseCache.for_project(project_root)
+
+    pipeline_path = project_root / "config" / "pipeline.yml"
+    session_path = session_path_for(project_root)
+    for path in (pipeline_path, session_path):
+        if not path.exists():
+            logger.error(f"Required file not found: {path}")
+            return 1
+
+    try:
+        pipeline = PipelineGraph(load_yaml_file(pipeline_path, cache))
+        document = SessionDocument.from_path(session_path)
+        current_work = document.section("Current Work")
+    except Exception as e:
+        logger.error(f"Error loading pipeline or session: {e}")
+        return 1
+
+    current_phase = current_work.get("phase")
+    if not current_phase:
+        logger.error("No current phase found in ACTIVE_SESSION.md")
+        return 1
+    logger.info(f"Current mode: {current_work.get('mode')}")
+    logger.info(f"Current phase: {current_phase}")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        todo_future = executor.submit(run_todo_gate, project_root, current_work)
+        artifact_future = executor.submit(
+            run_artifact_gate, project_root, pipeline, current_phase
+        )
+        results = [
+            _collect(todo_future, "todo"),
+            _collect(artifact_future, "artifacts"),
+        ]
+
+    for result in results:
+        status = "✅ passed" if result.passed else "❌ failed"
+        logger.info(f"Gate '{result.name}': {status}")
+        for message in result.messages:
+            log = logger.info if result.passed else logger.error
+            log(f"  {message}")
+
+    all_passed = all(result.passed for result in results)
+    exit_code = 0
+    if any(result.error for result in results):
+        exit_code = 1
+    elif not all_passed and args.strict:
+        logger.error("Failing CI due to failed gates (--strict mode)")
+        exit_code = 1
+
+    if args.advance:
+        if all_passed:
+            if not advance_phase(
+                project_root, document, pipeline, current_phase, args.dry_run
+            ):
+                exit_code = 1
+        else:
+            logger.warning("Skipping conductor advance because a gate failed")
+
+    logger.info("Gate run complete.")
+    return exit_code
+
+
+def history(args) -> int:
+    """Report checklist progress and phase cycle times from git history."""
+    import json
+
+    from checklist_history import (
+        HistoryError,
+        build_history,
+        cycle_times,
+        format_cycle_times,
+        history_to_json,
+    )
+
+    try:
+        result = build_history(args.project_root, args.since)
+    except HistoryError as e:
+        logger.error(str(e))
+        return 1
+
+    logger.info(f"Scanned {result.commits} commits ({result.blobs} distinct revisions)")
+    latest = {point.mode: point for point in result.checklist_points}
+    for mode, point in sorted(latest.items()):
+        logger.info(f"  {mode}: {point.checked}/{point.total} checked")
+    for transition in result.transitions:
+        logger.info(
+            f"  {transition.commit[:8]} {transition.session_id}: "
+            f"{transition.from_phase or '-'} -> {transition.to_phase or '-'}"
+        )
+
+    times = cycle_times(result.intervals)
+    if times:
+        logger.info("Phase cycle times:")
+        for line in format_cycle_times(times):
+            logger.info(f"  {line}")
+    else:
+        logger.info("No completed phases in history")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(history_to_json(result), f, indent=2)
+        logger.info(f"Wrote history to {args.output}")
+    return 0
+
+
+def main():
+    """Main entry point for the combined CLI."""
+    parser = argparse.ArgumentParser(description="AgenticOps Value Train CLI")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    gate_parser = subparsers.add_parser(
+        "gate", help="Run todo and artifact gates, then optionally advance"
+    )
+    gate_parser.add_argument(
+        "--project-root",
+        type=Path,
+        default=Path.cwd(),
+        help="Root directory of the project (default: current directory)",
+    )
+    gate_parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Exit with error code 1 if any gate fails",
+    )
+    gate_parser.add_argument(
+        "--advance",
+        action="store_true",
+        help="Advance to the next phase when all gates pass",
+    )
+    gate_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="With --advance, show the advance without writing the session",
+    )
+    gate_parser.set_defaults(handler=gate)
+
+    history_parser = subparsers.add_parser(
+        "history", help="Report checklist progress and phase cycle times from git"
+    )
+    history_parser.add_argument(
+        "--project-root",
+        type=Path,
+        default=Path.cwd(),
+        help="Root directory of the project (default: current directory)",
+    )
+    history_parser.add_argument(
+        "--since",
+        help="Only walk commits after this date (any git --since value)",
+    )
+    history_parser.add_argument(
+        "--output",
+        type=Path,
+        help="Write the full time series and cycle times as JSON to this file",
+    )
+    history_parser.set_defaults(handler=history)
+
+    args = parser.parse_args()
+    configure_logging()
+    sys.exit(args.handler(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+yaml_patch.py - AgenticOps Value Train Minimal YAML Patching
+
+Applies an updated mapping to the YAML text it was parsed from by editing
+only what changed, so comments, quoting, key order and untouched lines
+survive a conductor write and the resulting diff stays small.
+
+Only top-level keys are patched: single-line scalars are rewritten in place
+keeping their quote style and trailing comment, block sequences of
+single-line scalars keep every unchanged item line verbatim, and new keys
+are appended. Anything else (changed nested mappings, removed keys,
+multi-line scalars) is a structural change and falls back to a full dump.
+A patch is only used if it parses back to exactly the updated mapping.
+"""
+
+import re
+from difflib import SequenceMatcher
+from typing import Any, List, Optional
+
+_KEY_LINE = re.compile(r"(?P<key>[A-Za-z_][\w.-]*):(?P<rest>[ \t].*|)$")
+_VALUE = re.compile(
+    r"(?P<value>\[\]|\"(?:[^\"\\]|\\.)*\"|'(?:[^']|'')*'"
+    r"|[^\s\"'#&*!|>\[{%@`][^\n]*?)?"
+    r"(?P<comment>[ \t]+#.*)?[ \t]*$"
+)
+_ITEM_LINE = re.compile(r"(?P<indent>[ \t]*)- (?P<rest>.*)$")
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+class _Unpatchable(Exception):
+    """Raised internally when a change cannot be applied in place."""
+
+
+def _dump(value: Any) -> str:
+    import yaml
+
+    return yaml.dump(value, default_flow_style=False, sort_keys=False)
+
+
+def _render_scalar(value: Any, style: Optional[str]) -> str:
+    """Render a scalar on one line, keeping the original quote style."""
+    import json
+
+    import yaml
+
+    if isinstance(value, str) and "\n" not in value:
+        if style == '"':
+            return json.dumps(value, ensure_ascii=False)
+        if style == "'":
+            return "'" + value.replace("'", "''") + "'"
+    rendered = yaml.safe_dump(value, width=float("inf"), allow_unicode=True)
+    rendered = rendered.rstrip("\n")
+    if rendered.endswith("\n..."):
+        rendered = rendered[: -len("\n...")]
+    if "\n" in rendered:
+        raise _Unpatchable("multi-line scalar")
+    return rendered
+
+
+def _split_value(rest: str):
+    """Split the text after `key:` or `- ` into (value, comment)."""
+    match = _VALUE.match(rest.lstrip(" \t"))
+    if match is None:
+        raise _Unpatchable(f"unsupported value: {rest}")
+    return match.group("value") or "", match.group("comment") or ""
+
+
+def _style(value_text: str) -> Optional[str]:
+    return value_text[0] if value_text[:1] in ('"', "'") else None
+
+
+def _key_value(line: str):
+    """Split a top-level `key: value` line into (value, comment)."""
+    match = _KEY_LINE.match(line)
+    assert match is not None  # Patched lines are found by _index_keys
+    return _split_value(match.group("rest"))
+
+
+def _index_keys(lines: List[str]) -> dict:
+    """Map top-level keys to their line numbers."""
+    keys = {}
+    for number, line in enumerate(lines):
+        match = _KEY_LINE.match(line)
+        if match:
+            keys[match.group("key")] = number
+    return keys
+
+
+def _block_end(lines: List[str], start: int) -> int:
+    """Return the line after the block owned by the key on line `start`."""
+    end = start + 1
+    while end < len(lines):
+        line = lines[end]
+        if line.strip() and not line[0].isspace() and not line.startswith("-"):
+            break
+        end += 1
+    while end > start + 1 and not lines[end - 1].strip():
+        end -= 1
+    return end
+
+
+def _patch_scalar(lines: List[str], start: int, key: str, value: Any):
+    if _block_end(lines, start) != start + 1:
+        raise _Unpatchable(f"'{key}' spans several lines")
+    value_text, comment = _key_value(lines[start])
+    if not value_text:
+        raise _Unpatchable(f"'{key}' has no inline value")
+    rendered = _render_scalar(value, _style(value_text))
+    lines[start] = f"{key}: {rendered}{comment}"
+
+
+def _patch_sequence(lines: List[str], start: int, key: str, old: list, new: list):
+    end = _block_end(lines, start)
+    value_text, comment = _key_value(lines[start])
+    if value_text not in ("", "[]"):
+        raise _Unpatchable(f"'{key}' is a flow sequence")
+
+    item_lines = lines[start + 1 : end]
+    if len(item_lines) != len(old):
+        raise _Unpatchable(f"'{key}' items are not one per line")
+    indent = "  "
+    style: Optional[str] = '"'
+    for line in item_lines:
+        match = _ITEM_LINE.match(line)
+        if match is None:
+            raise _Unpatchable(f"'{key}' has a complex item")
+        indent = match.group("indent")
+        style = _style(_split_value(match.group("rest"))[0])
+
+    def render(item: Any) -> str:
+        return f"{indent}- {_render_scalar(item, style)}"
+
+    patched = []
+    matcher = SequenceMatcher(a=old, b=new, autojunk=False)
+    for tag, a_start, a_end, b_start, b_end in matcher.get_opcodes():
+        if tag == "equal":
+            patched.extend(item_lines[a_start:a_end])
+        else:
+            patched.extend(render(item) for item in new[b_start:b_end])
+
+    key_line = f"{key}:{comment}" if new else f"{key}: []{comment}"
+    lines[start:end] = [key_line] + patched
+
+
+def patch_yaml(text: str, updated: Any, original: Any = None) -> Optional[str]:
+    """Return `text` edited in place to parse as `updated`, or None.
+
+    `original` is the parsed `text`; it is parsed here when not given.
+    None means the change is structural and the caller should dump instead.
+    """
+    import yaml
+
+    if original is None:
+        original = yaml.safe_load(text) if text.strip() else {}
+    if not isinstance(original, dict) or not isinstance(updated, dict):
+        return None
+    if any(key not in updated for key in original):
+        return None
+
+    lines = text.split("\n")
+    while lines and not lines[-1].strip():
+        lines.pop()
+    try:
+        # Patch from the bottom up so earlier line numbers stay valid
+        keys = _index_keys(lines)
+        changed = [key for key in original if original[key] != updated[key]]
+        for key in sorted(changed, key=lambda key: keys.get(key, -1), reverse=True):
+            old, new = original[key], updated[key]
+            if key not in keys:
+                return None
+            if isinstance(old, _SCALAR_TYPES) and isinstance(new, _SCALAR_TYPES):
+                _patch_scalar(lines, keys[key], key, new)
+            elif (
+                isinstance(old, list)
+                and isinstance(new, list)
+                and all(isinstance(item, _SCALAR_TYPES) for item in old + new)
+            ):
+                _patch_sequence(lines, keys[key], key, old, new)
+            else:
+                return None
+    except _Unpatchable:
+        return None
+
+    added = {key: value for key, value in updated.items() if key not in original}
+    patched = "\n".join(lines) + "\n"
+    if added:
+        patched += _dump(added)
+
+    try:
+        if yaml.safe_load(patched) != updated:
+            return None
+    except yaml.YAMLError:
+        return None
+    return patched
+
+
+def patch_or_dump(text: str, updated: Any, original: Any = None) -> str:
+    """Patch `text` in place when possible, otherwise dump `updated` in full."""
+    patched = patch_yaml(text, updated, original)
+    return patched if patched is not None else _dump(updated)
@@ -0,0 +1,129 @@
+"""
+Tests for artifact_index.py script.
+"""
+
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+# Import scripts after path modification
+from artifact_index import INDEX_FILE_NAME  # noqa: E402
+from artifact_index import ArtifactIndex  # noqa: E402
+from parse_cache import CACHE_DIR_NAME  # noqa: E402
+
+
+def age_path(path: Path, seconds: int = 60):
+    """Move a path's mtime into the past so persisted listings are not racy."""
+    stat = path.stat()
+    past = stat.st_mtime_ns - seconds * 1_000_000_000
+    os.utime(path, ns=(past, past))
+
+
+@pytest.mark.unit
+class TestArtifactIndex:
+    """Test directory-listing based existence checks."""
+
+    def test_matches_path_exists(self, temp_project_root):
+        """Test answers match Path.exists for files, dirs and missing paths."""
+        from tests.conftest import create_test_artifacts
+
+        create_test_artifacts(temp_project_root, ["delivery/setup.md"])
+        (temp_project_root / "delivery" / "reports").mkdir()
+        (temp_project_root / "delivery" / "dangling.md").symlink_to("nowhere.md")
+        (temp_project_root / "delivery" / "linked.md").symlink_to("setup.md")
+        paths = [
+            temp_project_root / "delivery" / name
+            for name in [
+                "setup.md",
+                "reports",
+                "missing.md",
+                "dangling.md",
+                "linked.md",
+            ]
+        ]
+        paths.append(temp_project_root / "absent" / "file.md")
+        paths.append(temp_project_root / "delivery" / "setup.md" / "child.md")
+        index = ArtifactIndex()
+
+        assert [index.exists(path) for path in paths] == [
+            path.exists() for path in paths
+        ]
+
+    def test_each_directory_listed_once(self, temp_project_root):
+        """Test a directory is scanned once however many artifacts it holds."""
+        from tests.conftest import create_test_artifacts
+
+        create_test_artifacts(temp_project_root, ["delivery/a.md", "delivery/b.md"])
+        paths = [temp_project_root / "delivery" / f"{name}.md" for name in "abcd"]
+        index = ArtifactIndex()
+
+        with patch("artifact_index.os.scandir", wraps=os.scandir) as mock_scandir:
+            missing = index.missing(paths)
+
+        assert missing == paths[2:]
+        assert mock_scandir.call_count == 1
+
+    def test_persisted_listing_reused(self, temp_project_root):
+        """Test an unchanged directory is not rescanned across runs."""
+        from tests.conftest import create_test_artifacts
+
+        create_test_artifacts(temp_project_root, ["delivery/setup.md"])
+        delivery = temp_project_root / "delivery"
+        age_path(delivery)
+        persist_path = temp_project_root / CACHE_DIR_NAME / INDEX_FILE_NAME
+        first = ArtifactIndex(persist_path)
+        assert first.exists(delivery / "setup.md")
+        first.save()
+
+        second = ArtifactIndex(persist_path)
+        with patch("artifact_index.os.scandir") as mock_scandir:
+            assert second.exists(delivery / "setup.md")
+            assert not second.exists(delivery / "other.md")
+
+        mock_scandir.assert_not_called()
+
+    def test_persisted_listing_invalidated(self, temp_project_root):
+        """Test a new entry in a directory invalidates its persisted listing."""
+        from tests.conftest import create_test_artifacts
+
+        create_test_artifacts(temp_project_root, ["delivery/setup.md"])
+        delivery = temp_project_root / "delivery"
+        age_path(delivery)
+        persist_path = temp_project_root / CACHE_DIR_NAME / INDEX_FILE_NAME
+        first = ArtifactIndex(persist_path)
+        assert not first.exists(delivery / "scope.md")
+        first.save()
+
+        create_test_artifacts(temp_project_root, ["delivery/scope.md"])
+
+        assert ArtifactIndex(persist_path).exists(delivery / "scope.md")
+
+    def test_corrupt_index_ignored(self, temp_project_root):
+        """Test an unreadable persisted index falls back to scanning."""
+        from tests.conftest import create_test_artifacts
+
+        create_test_artifacts(temp_project_root, ["delivery/setup.md"])
+        persist_path = temp_project_root / CACHE_DIR_NAME / INDEX_FILE_NAME
+        persist_path.parent.mkdir()
+        persist_path.write_text("{not json")
+
+        index = ArtifactIndex(persist_path)
+
+        assert index.exists(temp_project_root / "delivery" / "setup.md")
+
+    def test_for_project_respects_disable(self, temp_project_root, monkeypatch):
+        """Test VALUETRAIN_NO_CACHE disables persistence."""
+        monkeypatch.setenv("VALUETRAIN_NO_CACHE", "1")
+
+        index = ArtifactIndex.for_project(temp_project_root)
+        index.exists(temp_project_root / "config" / "pipeline.yml")
+        index.save()
+
+        assert index.persist_path is None
+        assert not (temp_project_root / CACHE_DIR_NAME).exists()
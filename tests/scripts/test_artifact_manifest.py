@@ -0,0 +1,168 @@
+"""
+Tests for artifact_manifest.py script.
+"""
+
+import hashlib
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+# Import scripts after path modification
+from artifact_manifest import CHANGED  # noqa: E402
+from artifact_manifest import EMPTY  # noqa: E402
+from artifact_manifest import MANIFEST_RELATIVE_PATH  # noqa: E402
+from artifact_manifest import MISSING  # noqa: E402
+from artifact_manifest import NEW  # noqa: E402
+from artifact_manifest import PLACEHOLDER  # noqa: E402
+from artifact_manifest import UNCHANGED  # noqa: E402
+from artifact_manifest import ArtifactManifest  # noqa: E402
+from artifact_manifest import hash_file  # noqa: E402
+
+
+def age_file(path: Path, seconds: int = 60):
+    """Move a file's mtime into the past so its hash is not racy."""
+    stat = path.stat()
+    past = stat.st_mtime_ns - seconds * 1_000_000_000
+    os.utime(path, ns=(past, past))
+
+
+@pytest.mark.unit
+class TestHashFile:
+    """Test content hashing."""
+
+    def test_small_file(self, temp_project_root):
+        """Test small files hash to their sha256."""
+        path = temp_project_root / "setup.md"
+        path.write_bytes(b"# Setup\n")
+
+        assert hash_file(path) == hashlib.sha256(b"# Setup\n").hexdigest()
+
+    def test_memory_mapped_file(self, temp_project_root):
+        """Test files above the mmap threshold hash identically in chunks."""
+        path = temp_project_root / "prepared.csv"
+        content = b"id,value\n" + b"1,2\n" * 5000
+        path.write_bytes(content)
+
+        with patch("artifact_manifest.MMAP_THRESHOLD", 1024), patch(
+            "artifact_manifest.CHUNK_SIZE", 4096
+        ):
+            digest = hash_file(path)
+
+        assert digest == hashlib.sha256(content).hexdigest()
+
+
+@pytest.mark.unit
+class TestArtifactManifest:
+    """Test the incremental artifact manifest."""
+
+    def test_classifies_content(self, temp_project_root):
+        """Test missing, empty, placeholder and new artifacts are told apart."""
+        delivery = temp_project_root / "delivery"
+        delivery.mkdir()
+        (delivery / "empty.md").write_text("")
+        (delivery / "placeholder.md").write_text(
+            "# placeholder.md\n\n"
+            "<!-- Placeholder file created by check_artifacts.py -->\n"
+        )
+        (delivery / "real.md").write_text("# Real content\n")
+        paths = [
+            delivery / name
+            for name in ["missing.md", "empty.md", "placeholder.md", "real.md"]
+        ]
+
+        statuses = ArtifactManifest(temp_project_root).inspect(paths)
+
+        assert [status.status for status in statuses] == [
+            MISSING,
+            EMPTY,
+            PLACEHOLDER,
+            NEW,
+        ]
+
+    def test_unchanged_file_not_rehashed(self, temp_project_root):
+        """Test a file with an unchanged stat is served from the manifest."""
+        path = temp_project_root / "prepared.csv"
+        path.write_text("id,value\n1,2\n")
+        age_file(path)
+        manifest = ArtifactManifest(temp_project_root)
+        manifest.inspect([path])
+        manifest.save()
+
+        reloaded = ArtifactManifest(temp_project_root)
+        with patch("artifact_manifest.hash_file") as mock_hash:
+            reloaded.inspect([path])
+
+        mock_hash.assert_not_called()
+        assert reloaded.rehashed == 0
+
+    def test_changed_stat_rehashed(self, temp_project_root):
+        """Test a modified file is re-hashed."""
+        path = temp_project_root / "prepared.csv"
+        path.write_text("id,value\n1,2\n")
+        age_file(path)
+        manifest = ArtifactManifest(temp_project_root)
+        manifest.inspect([path])
+        manifest.save()
+
+        path.write_text("id,value\n1,3\n")
+        reloaded = ArtifactManifest(temp_project_root)
+        entry = reloaded.fingerprint(path)
+
+        assert entry["sha256"] == hashlib.sha256(b"id,value\n1,3\n").hexdigest()
+        assert reloaded.rehashed == 1
+
+    def test_changes_since_baseline(self, temp_project_root):
+        """Test content changes after a baseline are reported."""
+        first = temp_project_root / "requirements.md"
+        second = temp_project_root / "scope.md"
+        first.write_text("# Requirements\n")
+        second.write_text("# Scope\n")
+        manifest = ArtifactManifest(temp_project_root)
+        manifest.mark_baseline([first, second])
+        manifest.save()
+
+        first.write_text("# Requirements v2\n")
+        statuses = ArtifactManifest(temp_project_root).inspect([first, second])
+
+        assert [status.status for status in statuses] == [CHANGED, UNCHANGED]
+
+    def test_baseline_drops_deleted_artifacts(self, temp_project_root):
+        """Test re-baselining forgets artifacts that no longer exist."""
+        path = temp_project_root / "old.md"
+        path.write_text("# Old\n")
+        manifest = ArtifactManifest(temp_project_root)
+        manifest.mark_baseline([path])
+        path.unlink()
+
+        manifest.mark_baseline()
+        manifest.save()
+
+        assert ArtifactManifest(temp_project_root).entries == {}
+
+    def test_manifest_location_and_keys(self, temp_project_root):
+        """Test entries are keyed by project-relative POSIX paths."""
+        path = temp_project_root / "delivery" / "setup.md"
+        path.parent.mkdir()
+        path.write_text("# Setup\n")
+        manifest = ArtifactManifest(temp_project_root)
+        manifest.inspect([path])
+        manifest.save()
+
+        assert (temp_project_root / MANIFEST_RELATIVE_PATH).exists()
+        assert list(ArtifactManifest(temp_project_root).entries) == [
+            "delivery/setup.md"
+        ]
+
+    def test_corrupt_manifest_ignored(self, temp_project_root):
+        """Test an unreadable manifest starts empty instead of failing."""
+        manifest_path = temp_project_root / MANIFEST_RELATIVE_PATH
+        manifest_path.parent.mkdir()
+        manifest_path.write_text("{not json")
+
+        assert ArtifactManifest(temp_project_root).entries == {}
@@ -0,0 +1,159 @@
+"""
+Tests for artifact_router.py script.
+"""
+
+import sys
+from pathlib import Path, PurePosixPath
+
+import pytest
+import yaml
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+# Import scripts after path modification
+from artifact_router import ArtifactRouter  # noqa: E402
+from pipeline_graph import PipelineGraph  # noqa: E402
+
+REPO_PIPELINE = Path(__file__).parent.parent.parent / "config" / "pipeline.yml"
+
+
+@pytest.mark.unit
+class TestDefaultRouting:
+    """Test the built-in routing used without artifact_routing rules."""
+
+    @pytest.mark.parametrize(
+        "artifact, expected",
+        [
+            ("/docs/test.md", "docs/test.md"),
+            ("opportunity-brief.md", "preengagement/opportunity-brief.md"),
+            ("use-case-one-pager.md", "preengagement/use-case-one-pager.md"),
+            ("requirements.md", "delivery/requirements.md"),
+            ("extract.py", "delivery/extract.py"),
+            ("profile.ipynb", "delivery/profile.ipynb"),
+            ("prepared.csv", "delivery/data/prepared.csv"),
+            ("settings.yaml", "config/settings.yaml"),
+            ("config.yml", "config/config.yml"),
+            ("README.txt", "README.txt"),
+        ],
+    )
+    def test_matches_legacy_routing(self, sample_pipeline_config, artifact, expected):
+        """Test each legacy branch routes to the same place."""
+        router = ArtifactRouter(sample_pipeline_config)
+
+        assert router.route(artifact) == PurePosixPath(expected)
+
+    def test_configured_base_paths_used(self):
+        """Test artifact_paths overrides apply to the built-in rules."""
+        router = ArtifactRouter(
+            {"artifact_paths": {"delivery": {"base_path": "/work", "data": "/raw"}}}
+        )
+
+        assert router.route("notes.md") == PurePosixPath("work/notes.md")
+        assert router.route("prepared.csv") == PurePosixPath("raw/prepared.csv")
+
+
+@pytest.mark.unit
+class TestConfiguredRouting:
+    """Test artifact_routing rules from pipeline.yml."""
+
+    def make_router(self, rules, default="/"):
+        config = {
+            "phases": [
+                {"name": "opportunity", "artifacts": ["brief.md"]},
+                {"name": "training", "artifacts": ["train.ipynb"]},
+            ],
+            "artifact_paths": {
+                "preengagement": {"framing": "/preengagement/framing"},
+                "delivery": {"features": "/delivery/features"},
+            },
+            "artifact_routing": {"rules": rules, "default": default},
+        }
+        graph = PipelineGraph(config)
+        return graph.router
+
+    def test_patterns_before_extensions(self):
+        """Test glob rules win over extension rules regardless of order."""
+        router = self.make_router(
+            [
+                {"suffix": ".yaml", "path": "/config"},
+                {"glob": "feature-*.yaml", "path": "delivery.features"},
+            ]
+        )
+
+        assert router.route("feature-config.yaml") == PurePosixPath(
+            "delivery/features/feature-config.yaml"
+        )
+        assert router.route("settings.yaml") == PurePosixPath("config/settings.yaml")
+
+    def test_longest_extension_wins(self):
+        """Test multi-part extensions beat shorter ones."""
+        router = self.make_router(
+            [
+                {"suffix": ".gz", "path": "/archive"},
+                {"suffix": ".tar.gz", "path": "/bundles"},
+            ]
+        )
+
+        assert router.route("model.tar.gz") == PurePosixPath("bundles/model.tar.gz")
+        assert router.route("log.gz") == PurePosixPath("archive/log.gz")
+
+    def test_phase_group_rule(self):
+        """Test phase rules use the declaring phase or an explicit one."""
+        router = self.make_router(
+            [
+                {
+                    "phases": ["opportunity"],
+                    "suffix": ".md",
+                    "path": "preengagement.framing",
+                }
+            ]
+        )
+
+        assert router.route("brief.md") == PurePosixPath(
+            "preengagement/framing/brief.md"
+        )
+        assert router.route("brief.md", "training") == PurePosixPath("brief.md")
+
+    def test_regex_rule_and_default(self):
+        """Test regex rules and the configured default path."""
+        router = self.make_router(
+            [{"regex": "^train", "path": "/notebooks"}], default="/misc"
+        )
+
+        assert router.route("train.ipynb") == PurePosixPath("notebooks/train.ipynb")
+        assert router.route("notes.txt") == PurePosixPath("misc/notes.txt")
+
+    def test_results_memoized(self):
+        """Test repeated lookups are served from the memo."""
+        router = self.make_router([{"glob": "*.md", "path": "/docs"}])
+
+        first = router.route("brief.md")
+        router.patterns.clear()
+
+        assert router.route("brief.md") is first
+
+    @pytest.mark.parametrize(
+        "rule",
+        [
+            {"suffix": ".md"},
+            {"path": "/docs"},
+            {"suffix": ".md", "path": "delivery.unknown"},
+        ],
+    )
+    def test_invalid_rules_rejected(self, rule):
+        """Test rules without a target, condition or known path are errors."""
+        with pytest.raises(ValueError):
+            self.make_router([rule])
+
+    def test_repo_pipeline_routes_config_artifacts(self):
+        """Test the shipped pipeline.yml keeps feature configs in delivery."""
+        with open(REPO_PIPELINE, "r") as f:
+            router = PipelineGraph(yaml.safe_load(f)).router
+
+        assert router.route("feature-config.yaml") == PurePosixPath(
+            "delivery/features/feature-config.yaml"
+        )
+        assert router.route("prepared.csv") == PurePosixPath(
+            "delivery/data/prepared.csv"
+        )
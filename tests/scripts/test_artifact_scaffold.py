@@ -0,0 +1,126 @@
+"""
+Tests for artifact_scaffold.py script.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+# Import scripts after path modification
+from artifact_manifest import PLACEHOLDER  # noqa: E402
+from artifact_manifest import ArtifactManifest  # noqa: E402
+from artifact_scaffold import CompiledTemplate  # noqa: E402
+from artifact_scaffold import Scaffolder  # noqa: E402
+from artifact_scaffold import placeholder_content  # noqa: E402
+
+TEMPLATE = """# Opportunity Brief
+
+## Executive Summary
+[Replace with concise opportunity overview]
+
+Engagement: {{ task.title }} ({{ phase }}, {{ unknown.field }})
+
+---
+
+*Document prepared by: [Agent Name]*
+*Date: [YYYY-MM-DD]*
+"""
+
+SESSION = {
+    "session_id": "2025-01-18-140000",
+    "phase": "enablement",
+    "agent": "onboarder",
+    "task": {"title": "Churn model", "issue_number": None},
+}
+
+
+@pytest.fixture
+def templates(temp_project_root):
+    """Write a template into docs/templates."""
+    templates_dir = temp_project_root / "docs" / "templates"
+    templates_dir.mkdir(parents=True)
+    (templates_dir / "opportunity-brief.md").write_text(TEMPLATE)
+    return templates_dir
+
+
+@pytest.mark.unit
+class TestCompiledTemplate:
+    """Test template compilation and rendering."""
+
+    def test_render_fills_known_fields(self):
+        """Test dotted and footer placeholders are filled, others kept."""
+        template = CompiledTemplate("{{ a.b }} by [Agent Name] on {{ c }}")
+
+        assert template.render({"a.b": "X", "agent": "lab"}) == "X by lab on {{ c }}"
+
+
+@pytest.mark.unit
+class TestScaffolder:
+    """Test rendering and writing missing artifacts."""
+
+    def test_render_from_template(self, temp_project_root, templates):
+        """Test the template is filled from the session and marked."""
+        scaffolder = Scaffolder(temp_project_root, {}, SESSION, today="2025-02-01")
+
+        content = scaffolder.render(
+            temp_project_root / "opportunity-brief.md", "opportunity"
+        )
+
+        assert content.startswith(
+            "# Opportunity Brief\n"
+            "<!-- Placeholder file created by check_artifacts.py -->\n"
+        )
+        assert "Engagement: Churn model (opportunity, {{ unknown.field }})" in content
+        assert "*Document prepared by: onboarder*" in content
+        assert "*Date: 2025-02-01*" in content
+
+    def test_configured_template_name(self, temp_project_root, templates):
+        """Test artifact_templates maps artifacts to differently named templates."""
+        config = {"artifact_templates": {"pitch.md": "opportunity-brief.md"}}
+        scaffolder = Scaffolder(temp_project_root, config, SESSION)
+
+        assert scaffolder.template_path("pitch.md") == (
+            templates / "opportunity-brief.md"
+        )
+        assert scaffolder.template_path("extract.py") is None
+
+    def test_scaffold_writes_missing_files_only(self, temp_project_root, templates):
+        """Test existing files are kept and the rest are created."""
+        existing = temp_project_root / "delivery" / "extract.py"
+        existing.parent.mkdir()
+        existing.write_text("print('done')\n")
+        brief = temp_project_root / "preengagement" / "opportunity-brief.md"
+        script = temp_project_root / "delivery" / "clean.py"
+
+        created = Scaffolder(temp_project_root, {}, SESSION).scaffold(
+            {brief: "opportunity", existing: "extraction", script: "extraction"}
+        )
+
+        assert created == [brief, script]
+        assert existing.read_text() == "print('done')\n"
+        assert script.read_text() == placeholder_content(script)
+        statuses = ArtifactManifest(temp_project_root).inspect([brief, script])
+        assert [status.status for status in statuses] == [PLACEHOLDER, PLACEHOLDER]
+
+    def test_each_template_compiled_once(self, temp_project_root, templates):
+        """Test many artifacts sharing a template compile it a single time."""
+        config = {
+            "artifact_templates": {
+                f"brief-{i}.md": "opportunity-brief.md" for i in range(20)
+            }
+        }
+        paths = [temp_project_root / f"brief-{i}.md" for i in range(20)]
+
+        with patch(
+            "artifact_scaffold.CompiledTemplate", wraps=CompiledTemplate
+        ) as compile_template:
+            created = Scaffolder(temp_project_root, config, SESSION).scaffold(paths)
+
+        assert created == paths
+        assert compile_template.call_count == 1
+        assert all("Churn model" in path.read_text() for path in paths)
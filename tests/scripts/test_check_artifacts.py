@@ -13,12 +13,17 @@ import yaml
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
 
 # Import scripts after path modification
+from check_artifacts import ArtifactWatch  # noqa: E402
+from check_artifacts import audit_all_phases  # noqa: E402
 from check_artifacts import check_artifacts_exist  # noqa: E402
+from check_artifacts import check_project_artifacts  # noqa: E402
+from check_artifacts import format_audit_matrix  # noqa: E402
 from check_artifacts import get_phase_artifacts  # noqa: E402
 from check_artifacts import load_active_session  # noqa: E402
 from check_artifacts import load_pipeline_config  # noqa: E402
 from check_artifacts import main  # noqa: E402
 from check_artifacts import resolve_artifact_paths  # noqa: E402
+from fleet import SharedPipelineLoader  # noqa: E402
 
 
 @pytest.mark.unit
@@ -175,6 +180,46 @@ class TestResolveArtifactPaths:
         assert result[0] == temp_project_root / "config" / "settings.yaml"
         assert result[1] == temp_project_root / "config" / "config.yml"
 
+    def test_resolve_with_routing_rules(
+        self, temp_project_root, sample_pipeline_config
+    ):
+        """Test artifact_routing rules from pipeline.yml are applied."""
+        sample_pipeline_config["artifact_paths"]["delivery"][
+            "features"
+        ] = "/delivery/features"
+        sample_pipeline_config["artifact_routing"] = {
+            "rules": [
+                {"glob": "feature-*.yaml", "path": "delivery.features"},
+                {"suffix": ".yaml", "path": "/config"},
+            ]
+        }
+
+        result = resolve_artifact_paths(
+            temp_project_root,
+            ["feature-config.yaml", "settings.yaml"],
+            sample_pipeline_config,
+        )
+
+        assert result == [
+            temp_project_root / "delivery" / "features" / "feature-config.yaml",
+            temp_project_root / "config" / "settings.yaml",
+        ]
+
+    def test_resolve_invalid_routing_exits(
+        self, temp_project_root, sample_pipeline_config
+    ):
+        """Test an invalid routing rule is reported as a config error."""
+        sample_pipeline_config["artifact_routing"] = {
+            "rules": [{"regex": "[unclosed", "path": "/docs"}]
+        }
+
+        with pytest.raises(SystemExit) as exc_info:
+            resolve_artifact_paths(
+                temp_project_root, ["notes.md"], sample_pipeline_config
+            )
+
+        assert exc_info.value.code == 1
+
     def test_resolve_default_files(self, temp_project_root, sample_pipeline_config):
         """Test resolving files with default path."""
         artifacts = ["README.txt", "notes.txt"]
@@ -409,6 +454,300 @@ agent: "conductor"
 
             assert exc_info.value.code == 1
 
+    def test_main_all_phases_strict(
+        self, temp_project_root, sample_pipeline_config, sample_active_session
+    ):
+        """Test --all-phases --strict fails when any phase is incomplete."""
+        from tests.conftest import create_test_artifacts, create_test_files
+
+        create_test_files(
+            temp_project_root, sample_pipeline_config, sample_active_session
+        )
+        create_test_artifacts(temp_project_root, ["delivery/setup.md"])
+
+        with patch(
+            "sys.argv",
+            [
+                "check_artifacts.py",
+                "--project-root",
+                str(temp_project_root),
+                "--all-phases",
+                "--strict",
+            ],
+        ):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 1
+
+    def test_main_all_phases_create_missing(
+        self, temp_project_root, sample_pipeline_config, sample_active_session
+    ):
+        """Test --all-phases --create-missing scaffolds every phase from templates."""
+        from tests.conftest import create_test_files
+
+        create_test_files(
+            temp_project_root, sample_pipeline_config, sample_active_session
+        )
+        templates_dir = temp_project_root / "docs" / "templates"
+        templates_dir.mkdir(parents=True)
+        (templates_dir / "requirements.md").write_text(
+            "# Requirements\n\nPhase: {{ phase }}\n\n*By: [Agent Name]*\n"
+        )
+
+        with patch(
+            "sys.argv",
+            [
+                "check_artifacts.py",
+                "--project-root",
+                str(temp_project_root),
+                "--all-phases",
+                "--create-missing",
+                "--strict",
+            ],
+        ):
+            with patch("sys.exit") as mock_exit:
+                main()
+                mock_exit.assert_not_called()
+
+        for artifact in ["delivery/setup.md", "preengagement/use-case.md"]:
+            assert (temp_project_root / artifact).exists()
+        requirements = (temp_project_root / "delivery" / "requirements.md").read_text()
+        assert "Phase: discovery" in requirements
+        assert "*By: conductor*" in requirements
+
+    def test_main_all_phases_complete(
+        self, temp_project_root, sample_pipeline_config, sample_active_session
+    ):
+        """Test --all-phases passes when every artifact exists."""
+        from tests.conftest import create_test_artifacts, create_test_files
+
+        create_test_files(
+            temp_project_root, sample_pipeline_config, sample_active_session
+        )
+        create_test_artifacts(
+            temp_project_root,
+            [
+                "delivery/setup.md",
+                "config/config.yml",
+                "preengagement/use-case.md",
+                "delivery/requirements.md",
+                "delivery/scope.md",
+            ],
+        )
+
+        with patch(
+            "sys.argv",
+            [
+                "check_artifacts.py",
+                "--project-root",
+                str(temp_project_root),
+                "--all-phases",
+                "--strict",
+            ],
+        ):
+            with patch("sys.exit") as mock_exit:
+                main()
+                mock_exit.assert_not_called()
+
+    def test_main_verify_content_flags_placeholders(
+        self, temp_project_root, sample_pipeline_config, sample_active_session
+    ):
+        """Test --verify-content --strict fails on placeholder artifacts."""
+        from tests.conftest import create_test_files
+
+        create_test_files(
+            temp_project_root, sample_pipeline_config, sample_active_session
+        )
+        argv = ["check_artifacts.py", "--project-root", str(temp_project_root)]
+        with patch("sys.argv", argv + ["--create-missing"]):
+            main()
+
+        with patch("sys.argv", argv + ["--verify-content", "--strict"]):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 1
+        assert (temp_project_root / ".valuetrain" / "artifacts.lock").exists()
+
+    def test_main_verify_content_passes_real_artifacts(
+        self, temp_project_root, sample_pipeline_config, sample_active_session
+    ):
+        """Test --verify-content --strict passes artifacts with real content."""
+        from tests.conftest import create_test_artifacts, create_test_files
+
+        create_test_files(
+            temp_project_root, sample_pipeline_config, sample_active_session
+        )
+        create_test_artifacts(
+            temp_project_root, ["delivery/setup.md", "config/config.yml"]
+        )
+
+        with patch(
+            "sys.argv",
+            [
+                "check_artifacts.py",
+                "--project-root",
+                str(temp_project_root),
+                "--verify-content",
+                "--strict",
+            ],
+        ):
+            with patch("sys.exit") as mock_exit:
+                main()
+                mock_exit.assert_not_called()
+
+    def test_main_deep_validates_csv_against_schema(
+        self, temp_project_root, sample_pipeline_config, sample_active_session
+    ):
+        """Test --deep --strict fails when prepared.csv violates schema-spec.md."""
+        from tests.conftest import create_test_files
+
+        sample_pipeline_config["phases"].append(
+            {"name": "preparation", "artifacts": ["prepared.csv", "schema-spec.md"]}
+        )
+        create_test_files(
+            temp_project_root, sample_pipeline_config, sample_active_session
+        )
+        (temp_project_root / "delivery" / "data").mkdir(parents=True)
+        (temp_project_root / "delivery" / "schema-spec.md").write_text(
+            "```yaml\ncolumns:\n  - name: id\n    type: integer\n```\n"
+        )
+        csv_path = temp_project_root / "delivery" / "data" / "prepared.csv"
+        argv = [
+            "check_artifacts.py",
+            "--project-root",
+            str(temp_project_root),
+            "--phase",
+            "preparation",
+            "--deep",
+            "--strict",
+        ]
+
+        csv_path.write_text("id\n1\n2\n")
+        with patch("sys.argv", argv):
+            with patch("sys.exit") as mock_exit:
+                main()
+                mock_exit.assert_not_called()
+
+        csv_path.write_text("id\n1\nabc\n")
+        with patch("sys.argv", argv):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+        assert exc_info.value.code == 1
+
+    def test_main_deep_rejects_unexecuted_notebook(
+        self, temp_project_root, sample_pipeline_config, sample_active_session
+    ):
+        """Test --deep --strict fails when a notebook artifact was never run."""
+        import json
+
+        from tests.conftest import create_test_files
+
+        sample_pipeline_config["phases"].append(
+            {"name": "training", "artifacts": ["train.ipynb"]}
+        )
+        create_test_files(
+            temp_project_root, sample_pipeline_config, sample_active_session
+        )
+        notebook = {
+            "cells": [
+                {
+                    "cell_type": "code",
+                    "execution_count": None,
+                    "metadata": {},
+                    "outputs": [],
+                    "source": ["model.fit(X, y)\n"],
+                }
+            ],
+            "metadata": {},
+            "nbformat": 4,
+            "nbformat_minor": 5,
+        }
+        (temp_project_root / "delivery").mkdir(exist_ok=True)
+        (temp_project_root / "delivery" / "train.ipynb").write_text(
+            json.dumps(notebook)
+        )
+
+        with patch(
+            "sys.argv",
+            [
+                "check_artifacts.py",
+                "--project-root",
+                str(temp_project_root),
+                "--phase",
+                "training",
+                "--deep",
+                "--strict",
+            ],
+        ):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+        assert exc_info.value.code == 1
+
+    @pytest.mark.parametrize(
+        "flags",
+        [
+            ["--all-phases", "--deep"],
+            ["--all-phases", "--verify-content"],
+            ["--project-root", "a", "--project-root", "b", "--deep"],
+            ["--project-root", "a", "--project-root", "b", "--verify-content"],
+        ],
+    )
+    def test_main_rejects_content_checks_across_phases_or_projects(
+        self, temp_project_root, flags
+    ):
+        """Test --deep and --verify-content are rejected where they do not apply."""
+        argv = ["check_artifacts.py", "--project-root", str(temp_project_root)]
+        with patch("sys.argv", argv + flags):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 2
+
+    def test_main_git_index_reports_untracked_artifacts(
+        self,
+        temp_project_root,
+        sample_pipeline_config,
+        sample_active_session,
+        monkeypatch,
+        caplog,
+    ):
+        """Test --git-index fails on artifacts that exist but are not tracked."""
+        import subprocess
+
+        from tests.conftest import create_test_artifacts, create_test_files
+
+        monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(temp_project_root.parent))
+        create_test_files(
+            temp_project_root, sample_pipeline_config, sample_active_session
+        )
+        create_test_artifacts(
+            temp_project_root, ["delivery/setup.md", "config/config.yml"]
+        )
+        git = ["git", "-C", str(temp_project_root)]
+        subprocess.run(git + ["init", "-q"], check=True)
+        subprocess.run(git + ["add", "delivery/setup.md"], check=True)
+
+        with patch(
+            "sys.argv",
+            [
+                "check_artifacts.py",
+                "--project-root",
+                str(temp_project_root),
+                "--git-index",
+                "--strict",
+            ],
+        ):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 1
+        assert "1 artifacts not tracked by git" in caplog.text
+        assert f"Untracked: {temp_project_root / 'config' / 'config.yml'}" in (
+            caplog.text
+        )
+
 
 @pytest.mark.unit
 class TestErrorHandling:
@@ -446,5 +785,229 @@ class TestErrorHandling:
         assert result[0] == temp_project_root / "delivery" / "test.md"
 
 
+@pytest.mark.unit
+class TestAuditAllPhases:
+    """Test the all-phases artifact audit."""
+
+    def test_audit_every_phase(self, temp_project_root, sample_pipeline_config):
+        """Test every phase is audited in pipeline order."""
+        from tests.conftest import create_test_artifacts
+
+        create_test_artifacts(
+            temp_project_root, ["delivery/setup.md", "delivery/requirements.md"]
+        )
+
+        audits = audit_all_phases(temp_project_root, sample_pipeline_config)
+
+        assert [audit.phase for audit in audits] == ["enablement", "discovery", "scope"]
+        assert [audit.required for audit in audits] == [2, 2, 1]
+        assert audits[0].missing == [temp_project_root / "config" / "config.yml"]
+        assert audits[1].missing == [
+            temp_project_root / "preengagement" / "use-case.md"
+        ]
+        assert audits[2].missing == [temp_project_root / "delivery" / "scope.md"]
+
+    def test_shared_directories_scanned_once(
+        self, temp_project_root, sample_pipeline_config
+    ):
+        """Test each artifact directory is listed once across all phases."""
+        import os
+
+        from tests.conftest import create_test_artifacts
+
+        create_test_artifacts(
+            temp_project_root, ["delivery/setup.md", "preengagement/use-case.md"]
+        )
+
+        with patch("artifact_index.os.scandir", wraps=os.scandir) as mock_scandir:
+            audit_all_phases(temp_project_root, sample_pipeline_config)
+
+        scanned = [call.args[0] for call in mock_scandir.call_args_list]
+        assert sorted(scanned) == [
+            temp_project_root / "config",
+            temp_project_root / "delivery",
+            temp_project_root / "preengagement",
+        ]
+
+    def test_format_matrix_with_totals(self, temp_project_root):
+        """Test the matrix has one row per phase and a totals row."""
+        audits = audit_all_phases(
+            temp_project_root,
+            {
+                "phases": [
+                    {"name": "enablement", "artifacts": ["config.yml"]},
+                    {"name": "wrapup"},
+                ]
+            },
+        )
+        (temp_project_root / "config" / "config.yml").write_text("a: 1\n")
+
+        lines = format_audit_matrix(audits)
+
+        assert lines == [
+            "Phase       Required  Present  Missing  Complete",
+            "enablement         1        0        1        0%",
+            "wrapup             0        0        0         -",
+            "TOTAL              1        0        1        0%",
+        ]
+
+
+@pytest.mark.unit
+class TestArtifactWatch:
+    """Test incremental artifact re-validation for --watch."""
+
+    def test_start_reports_missing(
+        self, temp_project_root, sample_pipeline_config, sample_active_session
+    ):
+        """Test the initial evaluation reports missing artifacts."""
+        from tests.conftest import create_test_files
+
+        create_test_files(
+            temp_project_root, sample_pipeline_config, sample_active_session
+        )
+        watch = ArtifactWatch(temp_project_root)
+
+        lines = watch.start()
+
+        assert lines[0] == "Phase: enablement, watching 2 artifacts"
+        assert lines[-1] == "2 of 2 artifacts missing"
+        assert temp_project_root / "delivery" in watch.targets()
+
+    def test_new_file_rechecks_only_its_directory(
+        self, temp_project_root, sample_pipeline_config, sample_active_session
+    ):
+        """Test a directory change re-checks only artifacts in that directory."""
+        from tests.conftest import create_test_artifacts, create_test_files
+
+        create_test_files(
+            temp_project_root, sample_pipeline_config, sample_active_session
+        )
+        watch = ArtifactWatch(temp_project_root)
+        watch.start()
+        create_test_artifacts(temp_project_root, ["delivery/setup.md"])
+
+        with patch("check_artifacts.check_artifacts_exist") as mock_check:
+            mock_check.return_value = []
+            lines = watch.update({temp_project_root / "delivery"})
+
+        mock_check.assert_called_once_with(
+            [temp_project_root / "delivery" / "setup.md"]
+        )
+        assert lines == [
+            f"✅ Now present: {temp_project_root / 'delivery' / 'setup.md'}",
+            "1 of 2 artifacts missing",
+        ]
+
+    def test_unrelated_change_is_ignored(
+        self, temp_project_root, sample_pipeline_config, sample_active_session
+    ):
+        """Test changes outside watched directories produce no output."""
+        from tests.conftest import create_test_files
+
+        create_test_files(
+            temp_project_root, sample_pipeline_config, sample_active_session
+        )
+        watch = ArtifactWatch(temp_project_root)
+        watch.start()
+
+        assert watch.update({temp_project_root / "elsewhere"}) == []
+
+    def test_session_change_reresolves_phase(
+        self, temp_project_root, sample_pipeline_config, sample_active_session
+    ):
+        """Test a phase change re-resolves the required artifacts."""
+        from tests.conftest import create_test_files
+
+        create_test_files(
+            temp_project_root, sample_pipeline_config, sample_active_session
+        )
+        watch = ArtifactWatch(temp_project_root)
+        watch.start()
+        watch.session_path.write_text(
+            sample_active_session.replace('phase: "enablement"', 'phase: "scope"')
+        )
+
+        lines = watch.update({watch.session_path})
+
+        assert lines == [
+            "Phase: scope, watching 1 artifacts",
+            f"❌ Missing: {temp_project_root / 'delivery' / 'scope.md'}",
+            "1 of 1 artifacts missing",
+        ]
+
+    def test_fixed_phase_does_not_watch_session(
+        self, temp_project_root, sample_pipeline_config, sample_active_session
+    ):
+        """Test --phase skips watching ACTIVE_SESSION.md."""
+        from tests.conftest import create_test_files
+
+        create_test_files(
+            temp_project_root, sample_pipeline_config, sample_active_session
+        )
+        watch = ArtifactWatch(temp_project_root, phase="scope")
+        watch.start()
+
+        assert watch.session_path not in watch.targets()
+
+
+@pytest.mark.integration
+class TestFleetMode:
+    """Integration tests for checking several project roots."""
+
+    def make_project(self, parent, name, pipeline_config, session):
+        from tests.conftest import create_test_files
+
+        project_root = parent / name
+        (project_root / "docs" / "session-context").mkdir(parents=True)
+        (project_root / "config").mkdir()
+        create_test_files(project_root, pipeline_config, session)
+        return project_root
+
+    def test_check_project_artifacts(
+        self, temp_project_root, sample_pipeline_config, sample_active_session
+    ):
+        """Test the per-project check reports the current phase's artifacts."""
+        from tests.conftest import create_test_artifacts
+
+        project_root = self.make_project(
+            temp_project_root, "proj-a", sample_pipeline_config, sample_active_session
+        )
+        create_test_artifacts(project_root, ["delivery/setup.md"])
+
+        result = check_project_artifacts(project_root, SharedPipelineLoader())
+
+        assert not result.passed
+        assert result.summary == "phase 'enablement': 1 of 2 artifacts present"
+        assert result.messages == [f"Missing: {project_root / 'config' / 'config.yml'}"]
+
+    def test_fleet_from_manifest(
+        self, temp_project_root, sample_pipeline_config, sample_active_session, caplog
+    ):
+        """Test a manifest sweep shares the pipeline and fails in strict mode."""
+        caplog.set_level("INFO")
+        from tests.conftest import create_test_artifacts
+
+        for name in ["proj-a", "proj-b"]:
+            self.make_project(
+                temp_project_root, name, sample_pipeline_config, sample_active_session
+            )
+        create_test_artifacts(
+            temp_project_root / "proj-a", ["delivery/setup.md", "config/config.yml"]
+        )
+        manifest = temp_project_root / "projects.txt"
+        manifest.write_text("proj-a\nproj-b\n")
+
+        with patch(
+            "sys.argv",
+            ["check_artifacts.py", "--manifest", str(manifest), "--strict"],
+        ):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 1
+        assert "Parsed 1 distinct pipeline configurations" in caplog.text
+        assert "1 passed, 1 failed, 0 errors" in caplog.text
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
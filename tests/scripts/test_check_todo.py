@@ -12,11 +12,15 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
 
 # Import scripts after path modification
+from check_todo import ChecklistWatch  # noqa: E402
 from check_todo import check_unchecked_items  # noqa: E402
 from check_todo import find_active_checklist  # noqa: E402
 from check_todo import find_active_session_file  # noqa: E402
+from check_todo import format_checklist_summary  # noqa: E402
 from check_todo import main  # noqa: E402
 from check_todo import parse_active_session  # noqa: E402
+from checklist_scanner import ChecklistCounts  # noqa: E402
+from checklist_scanner import ChecklistScan  # noqa: E402
 
 
 @pytest.mark.unit
@@ -287,6 +291,106 @@ agent: "conductor"
                 main()
                 mock_exit.assert_not_called()
 
+    def test_main_all_checklists(
+        self,
+        temp_project_root,
+        sample_checklist_with_unchecked,
+        sample_checklist_all_checked,
+        caplog,
+    ):
+        """Test --all-checklists reports every checklist and fails in strict mode."""
+        caplog.set_level("INFO")
+        from tests.conftest import create_test_checklist
+
+        create_test_checklist(temp_project_root, "build", sample_checklist_all_checked)
+        create_test_checklist(
+            temp_project_root, "scope", sample_checklist_with_unchecked
+        )
+
+        with patch(
+            "sys.argv",
+            [
+                "check_todo.py",
+                "--project-root",
+                str(temp_project_root),
+                "--all-checklists",
+                "--strict",
+            ],
+        ):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 1
+        assert "build-checklist.md" in caplog.text
+        assert "8 unchecked items across 2 checklists" in caplog.text
+
+    def test_main_delta_reports_only_changes(
+        self,
+        temp_project_root,
+        sample_active_session,
+        sample_checklist_with_unchecked,
+        caplog,
+    ):
+        """Test --delta logs changed items instead of the full unchecked list."""
+        caplog.set_level("INFO")
+        import os
+
+        from tests.conftest import create_test_checklist, create_test_files
+
+        create_test_files(temp_project_root, {}, sample_active_session)
+        create_test_checklist(
+            temp_project_root, "build", sample_checklist_with_unchecked
+        )
+        checklist_path = (
+            temp_project_root / "docs" / "rules" / "checklists" / "build-checklist.md"
+        )
+        argv = ["check_todo.py", "--project-root", str(temp_project_root), "--delta"]
+
+        with patch("sys.argv", argv):
+            main()
+        checklist_path.write_text(
+            sample_checklist_with_unchecked.replace(
+                "- [ ] Team ready", "- [x] Team ready"
+            )
+        )
+        past = checklist_path.stat().st_mtime_ns - 60_000_000_000
+        os.utime(checklist_path, ns=(past, past))
+        caplog.clear()
+        with patch("sys.argv", argv):
+            main()
+
+        assert "✓ Checked: build-checklist.md:6 Team ready" in caplog.text
+        assert "7 unchecked items remain in build-checklist.md" in caplog.text
+        assert "Line 5" not in caplog.text
+
+
+@pytest.mark.unit
+class TestFormatChecklistSummary:
+    """Test the per-file and per-section completion table."""
+
+    def test_format(self):
+        """Test sections are indented under their file with a totals row."""
+        scans = [
+            ChecklistScan(
+                Path("build-checklist.md"),
+                [],
+                {
+                    "Entry Criteria": ChecklistCounts(1, 2),
+                    "Exit Criteria": ChecklistCounts(0, 2),
+                },
+            ),
+            ChecklistScan(Path("notes-checklist.md"), [], {}),
+        ]
+
+        assert format_checklist_summary(scans) == [
+            "Checklist           Checked  Unchecked  Total  Complete",
+            "build-checklist.md        1          3      4       25%",
+            "  Entry Criteria          1          1      2       50%",
+            "  Exit Criteria           0          2      2        0%",
+            "notes-checklist.md        0          0      0         -",
+            "TOTAL                     1          3      4       25%",
+        ]
+
 
 @pytest.mark.unit
 class TestErrorHandling:
@@ -327,5 +431,215 @@ task:
         assert "Multi-line description" in result["task"]["description"]
 
 
+@pytest.mark.unit
+class TestChecklistWatch:
+    """Test incremental re-validation for --watch."""
+
+    def setup_watch(self, root, session, checklist):
+        from tests.conftest import create_test_checklist, create_test_files
+
+        create_test_files(root, {}, session)
+        create_test_checklist(root, "build", checklist)
+        watch = ChecklistWatch(root)
+        return watch, watch.start()
+
+    def test_start_reports_all_unchecked(
+        self, temp_project_root, sample_active_session, sample_checklist_with_unchecked
+    ):
+        """Test the initial evaluation lists every unchecked item."""
+        watch, lines = self.setup_watch(
+            temp_project_root, sample_active_session, sample_checklist_with_unchecked
+        )
+
+        assert lines[0] == "Mode: build, watching build-checklist.md"
+        assert "+ Line 5: - [ ] Data access confirmed" in lines
+        assert lines[-1] == "8 unchecked items remaining"
+        assert watch.targets()[-1].name == "build-checklist.md"
+
+    def test_checklist_edit_reports_delta(
+        self, temp_project_root, sample_active_session, sample_checklist_with_unchecked
+    ):
+        """Test only the resolved and new items are reported."""
+        watch, _ = self.setup_watch(
+            temp_project_root, sample_active_session, sample_checklist_with_unchecked
+        )
+        checklist_path = watch.checklist_path
+        checklist_path.write_text(
+            sample_checklist_with_unchecked.replace(
+                "- [ ] Team ready", "- [x] Team ready"
+            )
+            + "- [ ] New item\n"
+        )
+
+        lines = watch.update({checklist_path})
+
+        assert lines == [
+            "+ Line 18: - [ ] New item",
+            "✓ Resolved: - [ ] Team ready",
+            "8 unchecked items remaining",
+        ]
+
+    def test_session_edit_without_mode_change(
+        self, temp_project_root, sample_active_session, sample_checklist_with_unchecked
+    ):
+        """Test a session edit that keeps the mode does not rescan."""
+        watch, _ = self.setup_watch(
+            temp_project_root, sample_active_session, sample_checklist_with_unchecked
+        )
+
+        assert watch.update({watch.session_path}) == []
+
+    def test_mode_switch_changes_checklist(
+        self,
+        temp_project_root,
+        sample_active_session,
+        sample_checklist_with_unchecked,
+        sample_checklist_all_checked,
+    ):
+        """Test a mode change switches to the new mode's checklist."""
+        from tests.conftest import create_test_checklist
+
+        watch, _ = self.setup_watch(
+            temp_project_root, sample_active_session, sample_checklist_with_unchecked
+        )
+        create_test_checklist(temp_project_root, "design", sample_checklist_all_checked)
+        watch.session_path.write_text(
+            sample_active_session.replace('mode: "build"', 'mode: "design"')
+        )
+
+        lines = watch.update({watch.session_path})
+
+        assert lines == [
+            "Mode: design, watching design-checklist.md",
+            "0 unchecked items remaining",
+        ]
+
+    def test_run_watch_revalidates_checklist_edit(
+        self,
+        temp_project_root,
+        sample_active_session,
+        sample_checklist_with_unchecked,
+        caplog,
+    ):
+        """Test run_watch watches the checklist chosen by the initial evaluation."""
+        import logging
+        import os
+
+        from file_watcher import FileWatcher, run_watch
+
+        from tests.conftest import create_test_checklist, create_test_files
+
+        create_test_files(temp_project_root, {}, sample_active_session)
+        create_test_checklist(
+            temp_project_root, "build", sample_checklist_with_unchecked
+        )
+        checklist_path = (
+            temp_project_root / "docs" / "rules" / "checklists" / "build-checklist.md"
+        )
+        real_wait = FileWatcher.wait
+        watched = []
+
+        def wait_once(watcher, timeout=None):
+            if watched:
+                raise KeyboardInterrupt
+            watched.append(list(watcher.targets))
+            checklist_path.write_text(
+                sample_checklist_with_unchecked.replace(
+                    "- [ ] Team ready", "- [x] Team ready"
+                )
+            )
+            stat = checklist_path.stat()
+            os.utime(checklist_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            return real_wait(watcher, timeout=2)
+
+        caplog.set_level(logging.INFO)
+        with patch.object(FileWatcher, "wait", wait_once):
+            run_watch(ChecklistWatch(temp_project_root), interval=0.01)
+
+        assert checklist_path in watched[0]
+        assert "Watching 2 paths" in caplog.text
+        assert "✓ Resolved: - [ ] Team ready" in caplog.text
+        assert "7 unchecked items remaining" in caplog.text
+
+
+@pytest.mark.integration
+class TestFleetMode:
+    """Integration tests for checking several project roots."""
+
+    def make_project(self, parent, name, session, checklist):
+        from tests.conftest import create_test_checklist, create_test_files
+
+        project_root = parent / name
+        (project_root / "docs" / "session-context").mkdir(parents=True)
+        (project_root / "docs" / "rules" / "checklists").mkdir(parents=True)
+        (project_root / "config").mkdir()
+        create_test_files(project_root, {}, session)
+        create_test_checklist(project_root, "build", checklist)
+        return project_root
+
+    def test_fleet_strict_fails_on_any_project(
+        self,
+        temp_project_root,
+        sample_active_session,
+        sample_checklist_with_unchecked,
+        sample_checklist_all_checked,
+        caplog,
+    ):
+        """Test one incomplete project fails the aggregate in strict mode."""
+        caplog.set_level("INFO")
+        self.make_project(
+            temp_project_root,
+            "proj-a",
+            sample_active_session,
+            sample_checklist_all_checked,
+        )
+        self.make_project(
+            temp_project_root,
+            "proj-b",
+            sample_active_session,
+            sample_checklist_with_unchecked,
+        )
+
+        with patch(
+            "sys.argv",
+            [
+                "check_todo.py",
+                "--project-root",
+                str(temp_project_root / "proj-*"),
+                "--strict",
+            ],
+        ):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 1
+        assert "✅ " + str(temp_project_root / "proj-a") in caplog.text
+        assert "❌ " + str(temp_project_root / "proj-b") in caplog.text
+        assert "1 passed, 1 failed, 0 errors" in caplog.text
+
+    def test_fleet_passes_when_all_complete(
+        self, temp_project_root, sample_active_session, sample_checklist_all_checked
+    ):
+        """Test repeated --project-root values all pass."""
+        roots = [
+            self.make_project(
+                temp_project_root,
+                name,
+                sample_active_session,
+                sample_checklist_all_checked,
+            )
+            for name in ["proj-a", "proj-b"]
+        ]
+
+        argv = ["check_todo.py", "--strict"]
+        for root in roots:
+            argv.extend(["--project-root", str(root)])
+        with patch("sys.argv", argv):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 0
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
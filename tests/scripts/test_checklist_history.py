@@ -0,0 +1,221 @@
+"""
+Tests for checklist_history.py script.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+# Import scripts after path modification
+import checklist_scanner  # noqa: E402
+from checklist_history import HistoryError  # noqa: E402
+from checklist_history import PhaseCycleTime  # noqa: E402
+from checklist_history import build_history  # noqa: E402
+from checklist_history import cycle_times  # noqa: E402
+from checklist_history import format_cycle_times  # noqa: E402
+from valuetrain import main  # noqa: E402
+
+DAY = 86400
+START = 1_700_000_000
+
+SESSION = """# Active Session Context
+
+## Session Metadata
+```yaml
+session_id: "{session_id}"
+```
+
+## Current Work
+```yaml
+mode: "build"
+phase: "{phase}"
+```
+"""
+
+
+def git(project_root: Path, *args: str, timestamp: int = START):
+    """Run a git command in the project with a fixed commit date."""
+    date = f"@{timestamp} +0000"
+    subprocess.run(
+        [
+            "git",
+            "-C",
+            str(project_root),
+            "-c",
+            "user.name=Test",
+            "-c",
+            "user.email=test@example.com",
+            *args,
+        ],
+        check=True,
+        env={**os.environ, "GIT_AUTHOR_DATE": date, "GIT_COMMITTER_DATE": date},
+    )
+
+
+def commit(project_root: Path, day: int, files: dict):
+    """Write files and commit them on the given day after START."""
+    for relative, content in files.items():
+        path = project_root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    git(project_root, "add", "-A")
+    git(project_root, "commit", "-q", "-m", f"day {day}", timestamp=START + day * DAY)
+
+
+@pytest.fixture
+def git_project(temp_project_root, monkeypatch):
+    """Turn the temporary project into a git repository."""
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(temp_project_root.parent))
+    git(temp_project_root, "init", "-q")
+    return temp_project_root
+
+
+def session(session_id: str, phase: str) -> dict:
+    """Return the session file with the given session and phase."""
+    return {
+        "docs/session-context/ACTIVE_SESSION.md": SESSION.format(
+            session_id=session_id, phase=phase
+        )
+    }
+
+
+def checklist(mode: str, content: str) -> dict:
+    """Return the mode's checklist file with the given content."""
+    return {f"docs/rules/checklists/{mode}-checklist.md": content}
+
+
+@pytest.fixture
+def project_history(git_project):
+    """Commit two sessions' worth of checklist and phase changes."""
+    commit(
+        git_project,
+        0,
+        {**session("s1", "enablement"), **checklist("build", "- [ ] A\n- [ ] B\n")},
+    )
+    commit(git_project, 1, checklist("build", "- [x] A\n- [ ] B\n"))
+    commit(git_project, 2, {"README.md": "unrelated\n"})
+    commit(
+        git_project,
+        3,
+        {**session("s1", "discovery"), **checklist("build", "- [x] A\n- [x] B\n")},
+    )
+    commit(git_project, 7, session("s2", "enablement"))
+    commit(git_project, 9, session("s2", "discovery"))
+    return git_project
+
+
+@pytest.mark.unit
+class TestBuildHistory:
+    """Test rebuilding timelines from git history."""
+
+    def test_checklist_time_series(self, project_history):
+        """Test each checklist revision yields its checked and total counts."""
+        history = build_history(project_history)
+
+        assert history.commits == 5
+        assert [
+            (point.timestamp, point.mode, point.checked, point.total)
+            for point in history.checklist_points
+        ] == [
+            (START, "build", 0, 2),
+            (START + DAY, "build", 1, 2),
+            (START + 3 * DAY, "build", 2, 2),
+        ]
+
+    def test_phase_transitions_and_intervals(self, project_history):
+        """Test phase changes are tracked per session with their durations."""
+        history = build_history(project_history)
+
+        assert [
+            (t.session_id, t.from_phase, t.to_phase) for t in history.transitions
+        ] == [
+            ("s1", None, "enablement"),
+            ("s1", "enablement", "discovery"),
+            ("s2", None, "enablement"),
+            ("s2", "enablement", "discovery"),
+        ]
+        assert [
+            (i.session_id, i.phase, i.ended and (i.ended - i.started) // DAY)
+            for i in history.intervals
+        ] == [
+            ("s1", "enablement", 3),
+            ("s1", "discovery", 4),
+            ("s2", "enablement", 2),
+            ("s2", "discovery", None),
+        ]
+
+    def test_cycle_times(self, project_history):
+        """Test completed visits are summarised per phase."""
+        times = cycle_times(build_history(project_history).intervals)
+
+        assert times == {
+            "enablement": PhaseCycleTime(2, 2.5 * DAY, 2.5 * DAY, 3.0 * DAY),
+            "discovery": PhaseCycleTime(1, 4.0 * DAY, 4.0 * DAY, 4.0 * DAY),
+        }
+        assert format_cycle_times(times)[1].split() == [
+            "enablement",
+            "2",
+            "2.5d",
+            "2.5d",
+            "3.0d",
+        ]
+
+    def test_identical_blobs_parsed_once(self, git_project):
+        """Test reverting to an earlier checklist reuses the parsed blob."""
+        for day, content in enumerate(["- [ ] A\n", "- [x] A\n", "- [ ] A\n"]):
+            commit(git_project, day, checklist("build", content))
+
+        with patch(
+            "checklist_history.scan_lines", wraps=checklist_scanner.scan_lines
+        ) as mock_scan:
+            history = build_history(git_project)
+
+        assert mock_scan.call_count == 2
+        assert [p.checked for p in history.checklist_points] == [0, 1, 0]
+
+    def test_not_a_repository(self, temp_project_root, monkeypatch):
+        """Test a project outside git raises HistoryError."""
+        monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(temp_project_root.parent))
+
+        with pytest.raises(HistoryError):
+            build_history(temp_project_root)
+
+
+@pytest.mark.integration
+class TestHistoryCommand:
+    """Integration tests for the history command."""
+
+    def test_history_writes_json(self, project_history, tmp_path, caplog):
+        """Test the command logs cycle times and writes the JSON report."""
+        caplog.set_level("INFO")
+        output = tmp_path / "history.json"
+
+        with patch(
+            "sys.argv",
+            [
+                "valuetrain.py",
+                "history",
+                "--project-root",
+                str(project_history),
+                "--output",
+                str(output),
+            ],
+        ):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 0
+        assert "build: 2/2 checked" in caplog.text
+        assert "Phase cycle times:" in caplog.text
+        report = json.loads(output.read_text())
+        assert len(report["checklists"]) == 3
+        assert report["cycle_times"]["discovery"]["visits"] == 1
+        assert report["intervals"][-1]["ended"] is None
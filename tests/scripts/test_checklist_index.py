@@ -0,0 +1,135 @@
+"""
+Tests for checklist_index.py script.
+"""
+
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+# Import scripts after path modification
+from checklist_index import INDEX_FILE_NAME  # noqa: E402
+from checklist_index import ChecklistIndex  # noqa: E402
+from checklist_index import format_delta  # noqa: E402
+from checklist_scanner import ChecklistCounts  # noqa: E402
+
+CHECKLIST = """# Build Mode Checklist
+
+## Entry Criteria
+- [x] Requirements completed
+- [ ] Data access confirmed
+- [ ] Team ready
+
+## Exit Criteria
+- [ ] All tests passing
+"""
+
+
+def write_aged(path: Path, content: str, age_seconds: int = 60):
+    """Write a file with an mtime in the past so its index entry is not racy."""
+    path.write_text(content)
+    past = path.stat().st_mtime_ns - age_seconds * 1_000_000_000
+    os.utime(path, ns=(past, past))
+
+
+@pytest.fixture
+def checklist(temp_project_root):
+    """Write a build checklist and return its path."""
+    path = temp_project_root / "docs" / "rules" / "checklists" / "build-checklist.md"
+    write_aged(path, CHECKLIST)
+    return path
+
+
+def run_index(project_root: Path, paths):
+    """Update a fresh index for the project and save it, like one CI run."""
+    index = ChecklistIndex(project_root / INDEX_FILE_NAME)
+    delta = index.update(paths)
+    index.save()
+    return index, delta
+
+
+@pytest.mark.unit
+class TestChecklistIndex:
+    """Test the persisted checklist progress index."""
+
+    def test_first_run_indexes_file(self, temp_project_root, checklist):
+        """Test a checklist without a previous run is reported as new."""
+        index, delta = run_index(temp_project_root, [checklist])
+
+        assert delta.new_files == [checklist]
+        assert format_delta(delta) == ["Indexed build-checklist.md (no previous run)"]
+        assert index.scan(checklist).counts == ChecklistCounts(1, 4)
+
+    def test_unchanged_file_not_reparsed(self, temp_project_root, checklist):
+        """Test a checklist with an unchanged stat is served from the index."""
+        run_index(temp_project_root, [checklist])
+
+        with patch("checklist_index.scan_checklist") as mock_scan:
+            index, delta = run_index(temp_project_root, [checklist])
+
+        mock_scan.assert_not_called()
+        assert index.rescanned == 0
+        assert delta.empty
+        assert index.scan(checklist).unchecked == [
+            (5, "- [ ] Data access confirmed"),
+            (6, "- [ ] Team ready"),
+            (9, "- [ ] All tests passing"),
+        ]
+
+    def test_scan_matches_scanner(self, temp_project_root, checklist):
+        """Test indexed and freshly scanned checklists report the same lines."""
+        from checklist_scanner import scan_checklist
+
+        write_aged(checklist, CHECKLIST + "  * [ ] Indented asterisk\n")
+        run_index(temp_project_root, [checklist])
+
+        index, _ = run_index(temp_project_root, [checklist])
+
+        assert index.rescanned == 0
+        assert index.scan(checklist) == scan_checklist(checklist)
+
+    def test_delta_between_runs(self, temp_project_root, checklist):
+        """Test checked, unchecked, added and removed items are reported."""
+        run_index(temp_project_root, [checklist])
+        write_aged(
+            checklist,
+            """# Build Mode Checklist
+
+## Entry Criteria
+- [ ] Requirements completed
+* [x] Data access confirmed
+- [ ] Budget approved
+
+## Exit Criteria
+1. [ ] All tests passing
+""",
+            age_seconds=30,
+        )
+
+        index, delta = run_index(temp_project_root, [checklist])
+
+        assert index.rescanned == 1
+        assert format_delta(delta) == [
+            "✓ Checked: build-checklist.md:5 Data access confirmed",
+            "✗ Unchecked: build-checklist.md:4 Requirements completed",
+            "+ Added [ ]: build-checklist.md:6 Budget approved",
+            "- Removed: build-checklist.md:6 Team ready",
+        ]
+
+    def test_repeated_items_keyed_separately(self, temp_project_root, checklist):
+        """Test identical items in one section keep distinct keys."""
+        write_aged(checklist, "## Review\n- [ ] Sign off\n- [ ] Sign off\n")
+        run_index(temp_project_root, [checklist])
+        write_aged(
+            checklist, "## Review\n- [ ] Sign off\n- [x] Sign off\n", age_seconds=30
+        )
+
+        _, delta = run_index(temp_project_root, [checklist])
+
+        assert [change.item.line for change in delta.checked] == [3]
+        assert not delta.added and not delta.removed
@@ -0,0 +1,109 @@
+"""
+Tests for checklist_scanner.py script.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+# Import scripts after path modification
+from checklist_scanner import ChecklistCounts  # noqa: E402
+from checklist_scanner import find_checklists  # noqa: E402
+from checklist_scanner import scan_checklist  # noqa: E402
+from checklist_scanner import scan_checklists  # noqa: E402
+
+CHECKLIST = """# Build Mode Checklist
+
+- [x] Kickoff held
+
+## Entry Criteria
+- [ ] Data access confirmed
+* [X] Team ready
++ [ ] Budget approved
+
+### Core Activities
+1. [ ] Write code
+2) [x] Run tests
+   - [ ] Nested sub-item
+\t* [x] Tab-indented sub-item
+- [] Not a checkbox
+- [ ]No space is not a checkbox
+Inline - [ ] mentions are not items
+
+```markdown
+- [ ] Example inside a code block
+```
+
+## Exit Criteria ##
+- [x] All tests passing
+"""
+
+
+@pytest.mark.unit
+class TestScanChecklist:
+    """Test single-pass checklist scanning."""
+
+    def test_counts_per_section(self, temp_project_root):
+        """Test checkbox styles are counted under their nearest heading."""
+        path = temp_project_root / "build-checklist.md"
+        path.write_text(CHECKLIST)
+
+        scan = scan_checklist(path)
+
+        assert scan.sections == {
+            "Build Mode Checklist": ChecklistCounts(1, 1),
+            "Entry Criteria": ChecklistCounts(1, 3),
+            "Core Activities": ChecklistCounts(2, 4),
+            "Exit Criteria": ChecklistCounts(1, 1),
+        }
+        assert scan.counts == ChecklistCounts(5, 9)
+        assert scan.counts.unchecked == 4
+
+    def test_unchecked_lines(self, temp_project_root):
+        """Test unchecked items are reported with line numbers."""
+        path = temp_project_root / "build-checklist.md"
+        path.write_text(CHECKLIST)
+
+        assert scan_checklist(path).unchecked == [
+            (6, "- [ ] Data access confirmed"),
+            (8, "+ [ ] Budget approved"),
+            (11, "1. [ ] Write code"),
+            (13, "- [ ] Nested sub-item"),
+        ]
+
+
+@pytest.mark.unit
+class TestFindChecklists:
+    """Test selecting the checklist set."""
+
+    def test_default_set(self, temp_project_root):
+        """Test every *-checklist.md in docs/rules/checklists is scanned."""
+        from tests.conftest import create_test_checklist
+
+        for mode in ["scope", "build", "intake"]:
+            create_test_checklist(temp_project_root, mode, "- [ ] Item\n")
+        (temp_project_root / "docs" / "rules" / "checklists" / "notes.md").touch()
+
+        paths = find_checklists(temp_project_root)
+        scans = scan_checklists(paths)
+
+        assert [path.name for path in paths] == [
+            "build-checklist.md",
+            "intake-checklist.md",
+            "scope-checklist.md",
+        ]
+        assert [scan.counts for scan in scans] == [ChecklistCounts(0, 1)] * 3
+
+    def test_custom_glob(self, temp_project_root):
+        """Test patterns with a directory are relative to the project root."""
+        from tests.conftest import create_test_artifacts
+
+        create_test_artifacts(temp_project_root, ["docs/team/review.md"])
+
+        assert find_checklists(temp_project_root, "docs/team/*.md") == [
+            temp_project_root / "docs" / "team" / "review.md"
+        ]
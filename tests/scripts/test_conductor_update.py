@@ -13,6 +13,7 @@ import yaml
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
 
 # Import scripts after path modification
+from conductor_update import advance_sessions  # noqa: E402
 from conductor_update import get_next_phase  # noqa: E402
 from conductor_update import get_phase_info  # noqa: E402
 from conductor_update import load_active_session  # noqa: E402
@@ -20,7 +21,10 @@ from conductor_update import load_pipeline_config  # noqa: E402
 from conductor_update import main  # noqa: E402
 from conductor_update import replace_yaml_section  # noqa: E402
 from conductor_update import save_active_session  # noqa: E402
+from conductor_update import session_project_root  # noqa: E402
 from conductor_update import update_session_phase  # noqa: E402
+from parse_cache import load_yaml_file  # noqa: E402
+from pipeline_graph import PipelineGraph  # noqa: E402
 
 
 @pytest.mark.unit
@@ -248,11 +252,55 @@ next_steps:
             next_phase_info,
         )
 
-        assert "phase: discovery" in result
-        assert "mode: discover" in result
+        assert 'phase: "discovery"' in result
+        assert 'mode: "discover"' in result
         assert "Advanced to discovery phase via conductor automation" in result
         assert "Begin discovery phase activities" in result
 
+    def test_update_session_phase_minimal_diff(self, temp_project_root):
+        """Test an advance only rewrites changed lines, keeping comments."""
+        import difflib
+
+        from migrate_session import generate_new_session_content
+        from session_model import SessionDocument
+
+        content = generate_new_session_content(
+            {"mode": "build", "decisions": ["Kickoff"], "next_steps": ["Plan"]},
+            temp_project_root,
+        )
+
+        result = update_session_phase(
+            temp_project_root,
+            content,
+            SessionDocument(content).raw_sections(),
+            "discovery",
+            {"name": "discovery", "mode": "discover"},
+        )
+
+        changed = [
+            line
+            for line in difflib.unified_diff(
+                content.splitlines(), result.splitlines(), n=0, lineterm=""
+            )
+            if line[:1] in "+-"
+            and line[:3] not in ("+++", "---")
+            and not line[1:].startswith("last_updated:")
+        ]
+        assert changed == [
+            "+version: 1",
+            '-mode: "build"  '
+            "# intake|discover|scope|design|build|evaluate|deliver|operate|improve",
+            '-phase: "enablement"  # From pipeline.yml phases',
+            '+mode: "discover"  '
+            "# intake|discover|scope|design|build|evaluate|deliver|operate|improve",
+            '+phase: "discovery"  # From pipeline.yml phases',
+            '+  - "Advanced to discovery phase via conductor automation"',
+            '-  - "Plan"',
+            '+  - "Begin discovery phase activities"',
+            '+  - "Review discovery checklist requirements"',
+            '+  - "Update task assignments for new phase"',
+        ]
+
     def test_update_session_phase_with_missing_sections(self, temp_project_root):
         """Test updating session phase with missing sections."""
         content = """# Active Session Context
@@ -280,8 +328,8 @@ phase: "enablement"
             temp_project_root, content, sections, "discovery", next_phase_info
         )
 
-        assert "phase: discovery" in result
-        assert "mode: discover" in result
+        assert 'phase: "discovery"' in result
+        assert 'mode: "discover"' in result
 
 
 @pytest.mark.unit
@@ -317,6 +365,33 @@ class TestSaveActiveSession:
         assert session_path.exists()
         assert session_path.read_text() == content
 
+    def test_save_session_rejects_stale_update(
+        self, temp_project_root, sample_active_session
+    ):
+        """Test an update derived from an outdated session is not written."""
+        from tests.conftest import create_test_files
+
+        create_test_files(temp_project_root, {}, sample_active_session)
+        sections, content = load_active_session(temp_project_root)
+        info = {"mode": "discover"}
+        first = update_session_phase(
+            temp_project_root, content, sections, "discovery", info
+        )
+        stale = update_session_phase(
+            temp_project_root, content, sections, "scope", info
+        )
+        save_active_session(temp_project_root, first)
+
+        with pytest.raises(SystemExit) as exc_info:
+            save_active_session(temp_project_root, stale)
+
+        assert exc_info.value.code == 1
+        session_path = (
+            temp_project_root / "docs" / "session-context" / "ACTIVE_SESSION.md"
+        )
+        assert session_path.read_text() == first
+        assert "version: 1" in first
+
 
 @pytest.mark.integration
 class TestMainFunction:
@@ -346,8 +421,57 @@ class TestMainFunction:
             temp_project_root / "docs" / "session-context" / "ACTIVE_SESSION.md"
         )
         updated_content = session_path.read_text()
-        assert "phase: discovery" in updated_content
-        assert "mode: discover" in updated_content
+        assert 'phase: "discovery"' in updated_content
+        assert 'mode: "discover"' in updated_content
+
+    def test_main_records_artifact_baseline(
+        self, temp_project_root, sample_pipeline_config, sample_active_session
+    ):
+        """Test advancing records the completed phase's artifact hashes."""
+        import json
+
+        from tests.conftest import create_test_artifacts, create_test_files
+
+        create_test_files(
+            temp_project_root, sample_pipeline_config, sample_active_session
+        )
+        create_test_artifacts(temp_project_root, ["delivery/setup.md"])
+        manifest_path = temp_project_root / ".valuetrain" / "artifacts.lock"
+        manifest_path.parent.mkdir()
+        manifest_path.write_text('{"version": 1, "artifacts": {}}\n')
+
+        with patch(
+            "sys.argv",
+            ["conductor_update.py", "--project-root", str(temp_project_root)],
+        ):
+            main()
+
+        lock = json.loads(manifest_path.read_text())
+        entry = lock["artifacts"]["delivery/setup.md"]
+        assert entry["baseline_sha256"] == entry["sha256"]
+
+    def test_main_skips_baseline_without_manifest(
+        self, temp_project_root, sample_pipeline_config, sample_active_session, caplog
+    ):
+        """Test advancing a project without a manifest does not create one."""
+        import logging
+
+        from tests.conftest import create_test_artifacts, create_test_files
+
+        create_test_files(
+            temp_project_root, sample_pipeline_config, sample_active_session
+        )
+        create_test_artifacts(temp_project_root, ["delivery/setup.md"])
+
+        caplog.set_level(logging.INFO)
+        with patch(
+            "sys.argv",
+            ["conductor_update.py", "--project-root", str(temp_project_root)],
+        ):
+            main()
+
+        assert not (temp_project_root / ".valuetrain").exists()
+        assert "artifact baseline" not in caplog.text
 
     def test_main_dry_run_mode(
         self, temp_project_root, sample_pipeline_config, sample_active_session
@@ -383,6 +507,92 @@ class TestMainFunction:
         updated_content = session_path.read_text()
         assert updated_content == original_content
 
+    def test_main_dry_run_diff_and_json_patch(
+        self, temp_project_root, sample_pipeline_config, sample_active_session, capsys
+    ):
+        """Test dry run prints a section diff and writes a JSON patch."""
+        import json
+
+        from tests.conftest import create_test_files
+
+        create_test_files(
+            temp_project_root, sample_pipeline_config, sample_active_session
+        )
+        patch_path = temp_project_root / "patch.json"
+
+        with patch(
+            "sys.argv",
+            [
+                "conductor_update.py",
+                "--project-root",
+                str(temp_project_root),
+                "--dry-run",
+                "--json-patch",
+                str(patch_path),
+            ],
+        ):
+            main()
+
+        output = capsys.readouterr().out.splitlines()
+        assert output[:2] == [
+            "--- a/docs/session-context/ACTIVE_SESSION.md",
+            "+++ b/docs/session-context/ACTIVE_SESSION.md",
+        ]
+        assert any(line.endswith("@@ ## Current Work") for line in output)
+        assert '+phase: "discovery"' in output
+        assert "# Active Session" not in "\n".join(output)
+
+        ops = json.loads(patch_path.read_text())
+        assert {
+            "op": "replace",
+            "path": "/Current Work/phase",
+            "value": "discovery",
+        } in ops
+
+    def test_main_dry_run_previews_offloaded_decisions(
+        self, temp_project_root, sample_pipeline_config, sample_active_session, capsys
+    ):
+        """Test the dry run diff includes decisions moved to the journal."""
+        import json
+
+        from tests.conftest import create_test_files
+
+        create_test_files(
+            temp_project_root, sample_pipeline_config, sample_active_session
+        )
+        patch_path = temp_project_root / "patch.json"
+        argv = ["conductor_update.py", "--project-root", str(temp_project_root)]
+
+        argv += ["--keep-decisions", "1", "--dry-run", "--json-patch", str(patch_path)]
+
+        with patch("sys.argv", argv):
+            main()
+
+        output = capsys.readouterr().out.splitlines()
+        assert '-  - "Test decision"' in output
+        assert {
+            "op": "replace",
+            "path": "/Session Notes/decisions/0",
+            "value": "Advanced to discovery phase via conductor automation",
+        } in json.loads(patch_path.read_text())
+
+    def test_main_json_patch_requires_dry_run(self, temp_project_root, tmp_path):
+        """Test --json-patch is rejected outside a dry run."""
+        with patch(
+            "sys.argv",
+            [
+                "conductor_update.py",
+                "--project-root",
+                str(temp_project_root),
+                "--json-patch",
+                str(tmp_path / "patch.json"),
+            ],
+        ):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 2
+
     def test_main_force_phase(
         self, temp_project_root, sample_pipeline_config, sample_active_session
     ):
@@ -413,7 +623,7 @@ class TestMainFunction:
             temp_project_root / "docs" / "session-context" / "ACTIVE_SESSION.md"
         )
         updated_content = session_path.read_text()
-        assert "phase: scope" in updated_content
+        assert 'phase: "scope"' in updated_content
 
     def test_main_at_end_of_pipeline(
         self, temp_project_root, sample_pipeline_config, sample_active_session
@@ -517,6 +727,272 @@ agent: "conductor"
 
             assert exc_info.value.code == 1
 
+    def test_main_cyclic_advances_stay_bounded(
+        self, temp_project_root, sample_pipeline_config, sample_active_session
+    ):
+        """Test repeated advances journal transitions and cap inline decisions."""
+        import json
+
+        from tests.conftest import create_test_files
+
+        create_test_files(
+            temp_project_root, sample_pipeline_config, sample_active_session
+        )
+        argv = [
+            "conductor_update.py",
+            "--project-root",
+            str(temp_project_root),
+            "--force-phase",
+            "discovery",
+            "--keep-decisions",
+            "2",
+        ]
+
+        for _ in range(4):
+            with patch("sys.argv", argv):
+                main()
+
+        sections, _ = load_active_session(temp_project_root)
+        notes = yaml.safe_load(sections["Session Notes"])
+        advanced = "Advanced to discovery phase via conductor automation"
+        assert notes["decisions"] == [advanced, advanced]
+        journal = [
+            json.loads(line)
+            for line in (
+                temp_project_root
+                / "docs"
+                / "session-context"
+                / "ACTIVE_SESSION.journal.jsonl"
+            ).open()
+        ]
+        assert [entry["type"] for entry in journal].count("transition") == 4
+        assert [entry["decision"] for entry in journal if "decision" in entry] == [
+            "Test decision",
+            advanced,
+            advanced,
+        ]
+
+    def test_main_compact(
+        self, temp_project_root, sample_pipeline_config, sample_active_session
+    ):
+        """Test --compact moves old decisions without advancing."""
+        from tests.conftest import create_test_files
+
+        create_test_files(
+            temp_project_root, sample_pipeline_config, sample_active_session
+        )
+
+        with patch(
+            "sys.argv",
+            [
+                "conductor_update.py",
+                "--project-root",
+                str(temp_project_root),
+                "--compact",
+                "--keep-decisions",
+                "0",
+            ],
+        ):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 0
+        sections, _ = load_active_session(temp_project_root)
+        assert yaml.safe_load(sections["Session Notes"])["decisions"] == []
+        assert yaml.safe_load(sections["Current Work"])["phase"] == "enablement"
+        assert yaml.safe_load(sections["Session Metadata"])["version"] == 1
+
+
+@pytest.mark.integration
+class TestBatchAdvance:
+    """Integration tests for advancing many sessions in one run."""
+
+    def write_sessions(self, root: Path, session: str, phases: dict) -> dict:
+        """Write one engagement session per name at the given phase."""
+        paths = {}
+        for name, phase in phases.items():
+            path = root / "engagements" / name / "ACTIVE_SESSION.md"
+            path.parent.mkdir(parents=True)
+            path.write_text(session.replace('phase: "enablement"', f'phase: "{phase}"'))
+            paths[name] = path
+        return paths
+
+    def test_session_project_root(self, temp_project_root):
+        """Test standard session paths resolve to their project root."""
+        standard = temp_project_root / "docs" / "session-context" / "ACTIVE_SESSION.md"
+        other = temp_project_root / "engagements" / "a" / "ACTIVE_SESSION.md"
+
+        elsewhere = temp_project_root / "elsewhere"
+
+        assert session_project_root(standard, elsewhere) == temp_project_root
+        assert session_project_root(other, elsewhere) == elsewhere
+
+    def test_advance_sessions_baseline_in_project_root(
+        self, temp_project_root, sample_pipeline_config, sample_active_session
+    ):
+        """Test engagement sessions update the project's artifact manifest."""
+        from tests.conftest import create_test_artifacts
+
+        paths = self.write_sessions(
+            temp_project_root, sample_active_session, {"a": "enablement"}
+        )
+        create_test_artifacts(temp_project_root, ["delivery/setup.md"])
+        manifest_path = temp_project_root / ".valuetrain" / "artifacts.lock"
+        manifest_path.parent.mkdir()
+        manifest_path.write_text('{"version": 1, "artifacts": {}}\n')
+
+        advance_sessions(
+            [paths["a"]],
+            PipelineGraph(sample_pipeline_config),
+            project_root=temp_project_root,
+        )
+
+        assert "delivery/setup.md" in manifest_path.read_text()
+        assert not (paths["a"].parent / ".valuetrain").exists()
+
+    def test_advance_sessions_overlap_within_project(
+        self, temp_project_root, sample_pipeline_config, sample_active_session
+    ):
+        """Test sessions of one project root are written concurrently."""
+        import threading
+
+        paths = self.write_sessions(
+            temp_project_root,
+            sample_active_session,
+            {"a": "enablement", "b": "enablement"},
+        )
+        # Each write waits for the other; a serialized run breaks the barrier
+        both_writing = threading.Barrier(2, timeout=5)
+
+        with patch(
+            "session_journal.write_journaled_session",
+            side_effect=lambda *args: both_writing.wait(),
+        ):
+            results = advance_sessions(
+                list(paths.values()),
+                PipelineGraph(sample_pipeline_config),
+                jobs=2,
+                project_root=temp_project_root,
+            )
+
+        assert [result.status for result in results] == ["advanced", "advanced"]
+
+    @pytest.mark.parametrize("metadata", ["", "# Filled in by the operator\n"])
+    def test_advance_sessions_empty_metadata(
+        self, temp_project_root, sample_pipeline_config, sample_active_session, metadata
+    ):
+        """Test an empty or comment-only Session Metadata block is versioned."""
+        from session_store import session_version
+
+        start = sample_active_session.index('session_id: "2025-01-18-test"')
+        end = sample_active_session.index("```", start)
+        session = sample_active_session[:start] + metadata + sample_active_session[end:]
+        paths = self.write_sessions(temp_project_root, session, {"a": "enablement"})
+
+        results = advance_sessions(
+            [paths["a"]],
+            PipelineGraph(sample_pipeline_config),
+            project_root=temp_project_root,
+        )
+
+        assert [result.status for result in results] == ["advanced"]
+        assert session_version(paths["a"].read_text()) == 1
+
+    def test_advance_sessions(
+        self, temp_project_root, sample_pipeline_config, sample_active_session
+    ):
+        """Test each session is advanced, completed or failed independently."""
+        paths = self.write_sessions(
+            temp_project_root,
+            sample_active_session,
+            {"a": "enablement", "b": "scope", "c": "unknown"},
+        )
+        pipeline = PipelineGraph(sample_pipeline_config)
+
+        results = advance_sessions(
+            list(paths.values()), pipeline, force_phase=None, jobs=2
+        )
+
+        assert [(result.status, result.summary) for result in results] == [
+            ("advanced", "enablement → discovery"),
+            ("completed", "Pipeline complete at 'scope'"),
+            ("completed", "Pipeline complete at 'unknown'"),
+        ]
+        assert 'phase: "discovery"' in paths["a"].read_text()
+        assert 'phase: "scope"' in paths["b"].read_text()
+
+    def test_main_batch_loads_pipeline_once(
+        self, temp_project_root, sample_pipeline_config, sample_active_session, caplog
+    ):
+        """Test a glob of sessions is advanced with a single pipeline load."""
+        from tests.conftest import create_test_files
+
+        caplog.set_level("INFO")
+        create_test_files(
+            temp_project_root, sample_pipeline_config, sample_active_session
+        )
+        paths = self.write_sessions(
+            temp_project_root,
+            sample_active_session,
+            {"a": "enablement", "b": "discovery"},
+        )
+        (temp_project_root / "engagements" / "c").mkdir()
+        (temp_project_root / "engagements" / "c" / "ACTIVE_SESSION.md").write_text(
+            "# Active Session Context\n"
+        )
+
+        with patch(
+            "sys.argv",
+            [
+                "conductor_update.py",
+                "--project-root",
+                str(temp_project_root),
+                "--session",
+                str(temp_project_root / "engagements" / "*" / "ACTIVE_SESSION.md"),
+            ],
+        ):
+            with patch(
+                "conductor_update.load_yaml_file", wraps=load_yaml_file
+            ) as mock_load:
+                with pytest.raises(SystemExit) as exc_info:
+                    main()
+
+        assert exc_info.value.code == 1
+        assert mock_load.call_count == 1
+        assert 'phase: "discovery"' in paths["a"].read_text()
+        assert 'phase: "scope"' in paths["b"].read_text()
+        assert "2 advanced, 0 completed, 1 failed" in caplog.text
+
+    def test_main_batch_dry_run(
+        self, temp_project_root, sample_pipeline_config, sample_active_session
+    ):
+        """Test a batch dry run leaves every session unchanged."""
+        from tests.conftest import create_test_files
+
+        create_test_files(
+            temp_project_root, sample_pipeline_config, sample_active_session
+        )
+        paths = self.write_sessions(
+            temp_project_root, sample_active_session, {"a": "enablement"}
+        )
+
+        with patch(
+            "sys.argv",
+            [
+                "conductor_update.py",
+                "--project-root",
+                str(temp_project_root),
+                "--session",
+                str(paths["a"]),
+                "--dry-run",
+            ],
+        ):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 0
+        assert paths["a"].read_text() == sample_active_session
+
 
 @pytest.mark.unit
 class TestErrorHandling:
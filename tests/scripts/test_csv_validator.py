@@ -0,0 +1,190 @@
+"""
+Tests for csv_validator.py script.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+# Import scripts after path modification
+from csv_validator import SchemaError  # noqa: E402
+from csv_validator import load_schema  # noqa: E402
+from csv_validator import validate_csv  # noqa: E402
+
+SCHEMA_SPEC = """# Schema Specification
+
+Prepared dataset for model training.
+
+```yaml
+columns:
+  - name: customer_id
+    type: integer
+    nullable: false
+    min: 1
+  - name: segment
+    type: string
+    allowed: ["retail", "wholesale"]
+  - name: spend
+    type: float
+    min: 0
+    max: 1000
+  - name: signup_date
+    type: date
+    min: 2020-01-01
+  - name: active
+    type: boolean
+allow_extra_columns: false
+```
+"""
+
+
+@pytest.fixture
+def schema(temp_project_root):
+    """Write schema-spec.md and return the parsed schema."""
+    spec_path = temp_project_root / "schema-spec.md"
+    spec_path.write_text(SCHEMA_SPEC)
+    return load_schema(spec_path)
+
+
+def write_csv(path: Path, rows) -> Path:
+    """Write rows as CSV lines."""
+    path.write_text("".join(",".join(row) + "\n" for row in rows))
+    return path
+
+
+HEADER = ["customer_id", "segment", "spend", "signup_date", "active"]
+
+
+@pytest.mark.unit
+class TestLoadSchema:
+    """Test reading the schema block from schema-spec.md."""
+
+    def test_load_schema_block(self, schema):
+        """Test the YAML block with columns is found."""
+        assert [column["name"] for column in schema["columns"]] == HEADER
+        assert schema["allow_extra_columns"] is False
+
+    def test_skips_unrelated_yaml_blocks(self, temp_project_root):
+        """Test earlier YAML blocks without columns are ignored."""
+        spec_path = temp_project_root / "schema-spec.md"
+        spec_path.write_text(
+            "```yaml\nowner: lab\n```\n\n```yaml\ncolumns:\n  - name: id\n```\n"
+        )
+
+        assert load_schema(spec_path)["columns"] == [{"name": "id"}]
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "# No schema here\n",
+            "```yaml\ncolumns: []\n```\n",
+            "```yaml\ncolumns:\n  - name: id\n    type: decimal\n```\n",
+            "```yaml\ncolumns: [unclosed\n```\n",
+        ],
+    )
+    def test_invalid_schema(self, temp_project_root, content):
+        """Test missing, empty, mistyped and malformed schemas are rejected."""
+        spec_path = temp_project_root / "schema-spec.md"
+        spec_path.write_text(content)
+
+        with pytest.raises(SchemaError):
+            load_schema(spec_path)
+
+
+@pytest.mark.unit
+class TestValidateCsv:
+    """Test streaming CSV validation."""
+
+    def test_valid_file(self, temp_project_root, schema):
+        """Test a conforming file passes."""
+        csv_path = write_csv(
+            temp_project_root / "prepared.csv",
+            [
+                HEADER,
+                ["1", "retail", "10.5", "2021-03-04", "true"],
+                ["2", "wholesale", "", "2022-01-01", "no"],
+            ],
+        )
+
+        report = validate_csv(csv_path, schema)
+
+        assert report.passed
+        assert report.rows == 2
+
+    def test_violations_with_row_numbers(self, temp_project_root, schema):
+        """Test each kind of violation is reported against its row."""
+        csv_path = write_csv(
+            temp_project_root / "prepared.csv",
+            [
+                HEADER,
+                ["1", "retail", "10", "2021-03-04", "true"],
+                ["", "online", "2000", "2019-12-31", "maybe"],
+                ["x", "retail", "-1", "not-a-date", "1"],
+            ],
+        )
+
+        report = validate_csv(csv_path, schema)
+
+        assert [str(violation) for violation in report.violations] == [
+            "Row 3, column 'customer_id': null value in non-nullable column",
+            "Row 3, column 'segment': 'online' is not an allowed value",
+            "Row 3, column 'spend': 2000 is above maximum 1000",
+            "Row 3, column 'signup_date': 2019-12-31 is below minimum 2020-01-01",
+            "Row 3, column 'active': 'maybe' is not a valid boolean",
+            "Row 4, column 'customer_id': 'x' is not a valid integer",
+            "Row 4, column 'spend': -1 is below minimum 0",
+            "Row 4, column 'signup_date': 'not-a-date' is not a valid date",
+        ]
+
+    def test_header_violations(self, temp_project_root, schema):
+        """Test missing and unexpected columns are reported on the header."""
+        csv_path = write_csv(
+            temp_project_root / "prepared.csv",
+            [
+                ["customer_id", "segment", "spend", "signup_date", "notes"],
+                ["1", "retail", "1", "2021-01-01", "x"],
+            ],
+        )
+
+        report = validate_csv(csv_path, schema)
+
+        assert [str(violation) for violation in report.violations] == [
+            "Header, column 'active': missing column",
+            "Header, column 'notes': unexpected column",
+        ]
+
+    def test_empty_file(self, temp_project_root, schema):
+        """Test an empty CSV fails."""
+        csv_path = temp_project_root / "prepared.csv"
+        csv_path.write_text("")
+
+        assert not validate_csv(csv_path, schema).passed
+
+    def test_violations_capped_but_counted(self, temp_project_root, schema):
+        """Test only the first violations are kept but all are counted."""
+        rows = [HEADER] + [["x", "retail", "1", "2021-01-01", "true"]] * 50
+        csv_path = write_csv(temp_project_root / "prepared.csv", rows)
+
+        report = validate_csv(csv_path, schema, chunk_rows=7, max_violations=5)
+
+        assert report.violation_count == 50
+        assert [violation.row for violation in report.violations] == [2, 3, 4, 5, 6]
+
+    def test_process_pool_matches_inline(self, temp_project_root, schema):
+        """Test chunks validated on a process pool give the same report."""
+        rows = [HEADER]
+        for i in range(1, 301):
+            spend = "5000" if i % 37 == 0 else "10"
+            rows.append([str(i), "retail", spend, "2021-01-01", "true"])
+        csv_path = write_csv(temp_project_root / "prepared.csv", rows)
+
+        inline = validate_csv(csv_path, schema, chunk_rows=16)
+        pooled = validate_csv(csv_path, schema, workers=2, chunk_rows=16)
+
+        assert pooled == inline
+        assert pooled.rows == 300
+        assert pooled.violation_count == 8
@@ -0,0 +1,102 @@
+"""
+Tests for file_watcher.py script.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+# Import scripts after path modification
+from file_watcher import FileWatcher  # noqa: E402
+
+
+def bump_mtime(path: Path):
+    """Give a file a distinct mtime."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture(params=[False, True], ids=["polling", "inotify"])
+def use_inotify(request):
+    """Run watcher tests with both backends."""
+    return request.param
+
+
+@pytest.mark.unit
+class TestFileWatcher:
+    """Test change detection."""
+
+    def test_no_changes(self, temp_project_root, use_inotify):
+        """Test wait times out when nothing changes."""
+        target = temp_project_root / "file.md"
+        target.write_text("a")
+        watcher = FileWatcher([target], interval=0.01, use_inotify=use_inotify)
+
+        try:
+            assert watcher.wait(timeout=0.05) == set()
+        finally:
+            watcher.close()
+
+    def test_file_change(self, temp_project_root, use_inotify):
+        """Test a modified file is reported."""
+        target = temp_project_root / "file.md"
+        other = temp_project_root / "other.md"
+        target.write_text("a")
+        other.write_text("b")
+        watcher = FileWatcher([target, other], interval=0.01, use_inotify=use_inotify)
+
+        target.write_text("changed")
+        bump_mtime(target)
+
+        try:
+            assert watcher.wait(timeout=2) == {target}
+        finally:
+            watcher.close()
+
+    def test_directory_entries(self, temp_project_root, use_inotify):
+        """Test a new entry in a watched directory reports the directory."""
+        directory = temp_project_root / "delivery"
+        directory.mkdir()
+        watcher = FileWatcher([directory], interval=0.01, use_inotify=use_inotify)
+
+        (directory / "new.md").write_text("new")
+        bump_mtime(directory)
+
+        try:
+            assert watcher.wait(timeout=2) == {directory}
+        finally:
+            watcher.close()
+
+    def test_directory_created_later(self, temp_project_root, use_inotify):
+        """Test a directory that does not exist yet is reported once created."""
+        directory = temp_project_root / "delivery" / "data"
+        watcher = FileWatcher([directory], interval=0.01, use_inotify=use_inotify)
+
+        directory.mkdir(parents=True)
+
+        try:
+            assert watcher.wait(timeout=2) == {directory}
+        finally:
+            watcher.close()
+
+    def test_set_targets_resets_baseline(self, temp_project_root):
+        """Test replacing targets takes a new snapshot."""
+        first = temp_project_root / "first.md"
+        second = temp_project_root / "second.md"
+        first.write_text("a")
+        watcher = FileWatcher([first], use_inotify=False)
+
+        second.write_text("b")
+        watcher.set_targets([first, second])
+
+        assert watcher.poll() == set()
+        assert watcher.backend == "polling"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,178 @@
+"""
+Tests for fleet.py script.
+"""
+
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+# Import scripts after path modification
+from fleet import ProjectResult  # noqa: E402
+from fleet import SharedPipelineLoader  # noqa: E402
+from fleet import expand_project_roots  # noqa: E402
+from fleet import is_fleet_request  # noqa: E402
+from fleet import report_fleet  # noqa: E402
+from fleet import run_fleet  # noqa: E402
+
+
+def make_project(parent: Path, name: str, pipeline_config: dict) -> Path:
+    """Create a minimal project root with a pipeline.yml."""
+    project_root = parent / name
+    (project_root / "config").mkdir(parents=True)
+    with open(project_root / "config" / "pipeline.yml", "w") as f:
+        yaml.dump(pipeline_config, f)
+    return project_root
+
+
+@pytest.mark.unit
+class TestExpandProjectRoots:
+    """Test expanding project root arguments."""
+
+    def test_is_fleet_request(self):
+        """Test only multiple roots, globs or a manifest select fleet mode."""
+        assert not is_fleet_request(None, None)
+        assert not is_fleet_request([Path("proj")], None)
+        assert is_fleet_request([Path("a"), Path("b")], None)
+        assert is_fleet_request([Path("proj-*")], None)
+        assert is_fleet_request(None, Path("projects.txt"))
+
+    def test_glob_matches_directories(self, temp_project_root):
+        """Test glob patterns expand to matching directories only, sorted."""
+        (temp_project_root / "proj-b").mkdir()
+        (temp_project_root / "proj-a").mkdir()
+        (temp_project_root / "proj-c.txt").write_text("not a project")
+
+        result = expand_project_roots([temp_project_root / "proj-*"])
+
+        assert result == [temp_project_root / "proj-a", temp_project_root / "proj-b"]
+
+    def test_manifest_entries(self, temp_project_root):
+        """Test manifest entries are relative to the manifest, comments ignored."""
+        (temp_project_root / "proj-a").mkdir()
+        manifest = temp_project_root / "projects.txt"
+        manifest.write_text("# engagements\nproj-a\n\nproj-b  # not yet created\n")
+
+        result = expand_project_roots([], manifest)
+
+        assert result == [temp_project_root / "proj-a", temp_project_root / "proj-b"]
+
+    def test_duplicates_removed(self, temp_project_root):
+        """Test a root named twice is checked once."""
+        (temp_project_root / "proj-a").mkdir()
+
+        result = expand_project_roots(
+            [temp_project_root / "proj-a", temp_project_root / "proj-*"]
+        )
+
+        assert result == [temp_project_root / "proj-a"]
+
+
+@pytest.mark.unit
+class TestSharedPipelineLoader:
+    """Test sharing parsed pipelines between projects."""
+
+    def test_identical_pipelines_parsed_once(
+        self, temp_project_root, sample_pipeline_config
+    ):
+        """Test projects with identical pipeline.yml share one graph."""
+        first = make_project(temp_project_root, "a", sample_pipeline_config)
+        second = make_project(temp_project_root, "b", sample_pipeline_config)
+        loader = SharedPipelineLoader()
+
+        with patch("yaml.safe_load", wraps=yaml.safe_load) as mock_load:
+            graph_a = loader.load(first)
+            graph_b = loader.load(second)
+
+        assert graph_a is graph_b
+        assert mock_load.call_count == 1
+        assert loader.parsed == 1
+
+    def test_different_pipelines_parsed_separately(
+        self, temp_project_root, sample_pipeline_config
+    ):
+        """Test projects with different pipelines get their own graph."""
+        first = make_project(temp_project_root, "a", sample_pipeline_config)
+        second = make_project(temp_project_root, "b", {"phases": []})
+        loader = SharedPipelineLoader()
+
+        assert "enablement" in loader.load(first).phases
+        assert loader.load(second).phases == {}
+        assert loader.parsed == 2
+
+    def test_missing_pipeline(self, temp_project_root):
+        """Test a missing pipeline.yml raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            SharedPipelineLoader().load(temp_project_root / "absent")
+
+
+@pytest.mark.unit
+class TestRunFleet:
+    """Test running checks across projects."""
+
+    def test_results_in_input_order(self):
+        """Test results keep the order of the project roots."""
+        roots = [Path(f"proj-{i}") for i in range(10)]
+
+        results = run_fleet(roots, lambda root: ProjectResult(root, True, "ok"), jobs=4)
+
+        assert [result.project_root for result in results] == roots
+
+    def test_runs_concurrently(self):
+        """Test projects are checked on several threads at once."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def check(root):
+            barrier.wait()
+            return ProjectResult(root, True, "ok")
+
+        results = run_fleet([Path("a"), Path("b"), Path("c")], check, jobs=3)
+
+        assert all(result.passed for result in results)
+
+    def test_exits_and_exceptions_become_errors(self):
+        """Test a failing check does not abort the rest of the fleet."""
+
+        def check(root):
+            if root.name == "exits":
+                sys.exit(1)
+            if root.name == "raises":
+                raise ValueError("bad yaml")
+            return ProjectResult(root, True, "ok")
+
+        results = run_fleet([Path("exits"), Path("raises"), Path("ok")], check)
+
+        assert [result.error for result in results] == [True, True, False]
+        assert results[1].summary == "Error: bad yaml"
+        assert results[2].passed
+
+
+@pytest.mark.unit
+class TestReportFleet:
+    """Test the aggregate exit code."""
+
+    def test_all_passed(self):
+        """Test a clean fleet exits 0."""
+        assert report_fleet([ProjectResult(Path("a"), True, "ok")], True) == 0
+
+    def test_failures_respect_strict(self):
+        """Test failed projects only fail CI in strict mode."""
+        results = [
+            ProjectResult(Path("a"), True, "ok"),
+            ProjectResult(Path("b"), False, "1 unchecked items", ["Line 1: - [ ] x"]),
+        ]
+
+        assert report_fleet(results, strict=False) == 0
+        assert report_fleet(results, strict=True) == 1
+
+    def test_errors_always_fail(self):
+        """Test projects that could not be checked always fail CI."""
+        results = [ProjectResult(Path("a"), False, "Error: boom", error=True)]
+
+        assert report_fleet(results, strict=False) == 1
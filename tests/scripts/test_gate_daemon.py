@@ -0,0 +1,137 @@
+"""
+Tests for gate_daemon.py script.
+"""
+
+import os
+import socket
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+# Import scripts after path modification
+from gate_daemon import GateError  # noqa: E402
+from gate_daemon import GateServer  # noqa: E402
+from gate_daemon import GateState  # noqa: E402
+from gate_daemon import query_daemon  # noqa: E402
+
+
+@pytest.fixture
+def gate_project(
+    temp_project_root,
+    sample_pipeline_config,
+    sample_active_session,
+    sample_checklist_with_unchecked,
+):
+    """Project with pipeline, session and build checklist."""
+    from tests.conftest import create_test_checklist, create_test_files
+
+    create_test_files(temp_project_root, sample_pipeline_config, sample_active_session)
+    create_test_checklist(temp_project_root, "build", sample_checklist_with_unchecked)
+    return temp_project_root
+
+
+def bump_mtime(path: Path):
+    """Give a rewritten file a distinct mtime."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.mark.unit
+class TestGateState:
+    """Test query answers from loaded state."""
+
+    def test_answers_match_scripts(self, gate_project):
+        """Test answers mirror the CLI helpers."""
+        state = GateState(gate_project)
+
+        assert state.answer("ping") == "pong"
+        assert state.answer("current-phase") == "enablement"
+        assert state.answer("current-mode") == "build"
+        assert state.answer("next-phase") == "discovery"
+        assert len(state.answer("unchecked-items")) == 8
+        assert state.answer("missing-artifacts") == [
+            str(gate_project / "delivery" / "setup.md"),
+            str(gate_project / "config" / "config.yml"),
+        ]
+
+    def test_reloads_changed_session(self, gate_project, sample_active_session):
+        """Test a changed session file is picked up on the next query."""
+        state = GateState(gate_project)
+        assert state.answer("current-phase") == "enablement"
+
+        session_path = gate_project / "docs" / "session-context" / "ACTIVE_SESSION.md"
+        session_path.write_text(
+            sample_active_session.replace('phase: "enablement"', 'phase: "scope"')
+        )
+        bump_mtime(session_path)
+
+        assert state.answer("current-phase") == "scope"
+        assert state.answer("next-phase") is None
+
+    def test_unchanged_inputs_are_not_reloaded(self, gate_project):
+        """Test repeated queries reuse loaded values."""
+        state = GateState(gate_project)
+
+        first = state.pipeline()
+
+        assert state.pipeline() is first
+
+    def test_unknown_query(self, gate_project):
+        """Test unknown queries raise GateError."""
+        with pytest.raises(GateError):
+            GateState(gate_project).answer("bogus")
+
+    def test_script_exit_becomes_error(self, gate_project, sample_active_session):
+        """Test helper sys.exit calls become query errors."""
+        session_path = gate_project / "docs" / "session-context" / "ACTIVE_SESSION.md"
+        session_path.write_text(
+            sample_active_session.replace('mode: "build"', 'mode: "operate"')
+        )
+
+        with pytest.raises(GateError):
+            GateState(gate_project).answer("unchecked-items")
+
+    def test_missing_assets_registry(self, gate_project):
+        """Test a missing asset registry is reported."""
+        with pytest.raises(GateError):
+            GateState(gate_project).answer("assets")
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets only")
+class TestGateServer:
+    """Integration tests over a real Unix socket."""
+
+    def test_query_round_trip(self, gate_project):
+        """Test the client receives answers and can shut the daemon down."""
+        with tempfile.TemporaryDirectory() as socket_dir:
+            socket_path = Path(socket_dir) / "gate.sock"
+            server = GateServer(socket_path, GateState(gate_project))
+            thread = threading.Thread(target=server.serve_forever)
+            thread.start()
+            try:
+                assert query_daemon(socket_path, "current-phase") == {
+                    "ok": True,
+                    "result": "enablement",
+                }
+                response = query_daemon(socket_path, "bogus")
+                assert response["ok"] is False
+                assert "Unknown query" in response["error"]
+                assert query_daemon(socket_path, "shutdown")["ok"]
+                thread.join(timeout=5)
+            finally:
+                server.shutdown()
+                server.server_close()
+
+            assert not thread.is_alive()
+            assert not socket_path.exists()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
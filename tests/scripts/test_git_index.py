@@ -0,0 +1,87 @@
+"""
+Tests for git_index.py script.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+# Import scripts after path modification
+from git_index import GitIndex  # noqa: E402
+from git_index import GitIndexError  # noqa: E402
+
+
+def git(project_root: Path, *args: str):
+    """Run a git command in the project."""
+    subprocess.run(["git", "-C", str(project_root), *args], check=True)
+
+
+@pytest.fixture
+def git_project(temp_project_root, monkeypatch):
+    """Turn the temporary project into a git repository."""
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(temp_project_root.parent))
+    git(temp_project_root, "init", "-q")
+    return temp_project_root
+
+
+@pytest.mark.unit
+class TestGitIndex:
+    """Test presence answered from the git index."""
+
+    def test_tracked_untracked_and_missing(self, git_project):
+        """Test staged files are present and on-disk files are untracked."""
+        from tests.conftest import create_test_artifacts
+
+        create_test_artifacts(
+            git_project, ["delivery/setup.md", "delivery/data/prepared.csv"]
+        )
+        git(git_project, "add", "delivery/setup.md")
+        paths = [
+            git_project / "delivery" / "setup.md",
+            git_project / "delivery" / "data" / "prepared.csv",
+            git_project / "delivery" / "missing.md",
+        ]
+
+        index = GitIndex.load(git_project)
+
+        assert index.exists(paths[0])
+        assert index.missing(paths) == paths[1:]
+        assert index.untracked(paths) == [paths[1]]
+
+    def test_ignored_files_are_untracked(self, git_project):
+        """Test git-ignored artifacts on disk are still reported as untracked."""
+        from tests.conftest import create_test_artifacts
+
+        (git_project / ".gitignore").write_text("*.csv\n")
+        create_test_artifacts(git_project, ["prepared.csv"])
+
+        index = GitIndex.load(git_project)
+
+        assert index.untracked([git_project / "prepared.csv"]) == [
+            git_project / "prepared.csv"
+        ]
+
+    def test_paths_relative_to_subdirectory_root(self, git_project):
+        """Test a project root below the repository top level works."""
+        from tests.conftest import create_test_artifacts
+
+        create_test_artifacts(git_project, ["projects/a/delivery/setup.md"])
+        git(git_project, "add", ".")
+        project_root = git_project / "projects" / "a"
+
+        index = GitIndex.load(project_root)
+
+        assert index.exists(project_root / "delivery" / "setup.md")
+        assert not index.exists(git_project / "outside.md")
+
+    def test_not_a_repository(self, temp_project_root, monkeypatch):
+        """Test a project outside any repository raises GitIndexError."""
+        monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(temp_project_root.parent))
+
+        with pytest.raises(GitIndexError):
+            GitIndex.load(temp_project_root)
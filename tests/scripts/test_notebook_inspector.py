@@ -0,0 +1,142 @@
+"""
+Tests for notebook_inspector.py script.
+"""
+
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+# Import scripts after path modification
+from notebook_inspector import SKIPPED  # noqa: E402
+from notebook_inspector import NotebookError  # noqa: E402
+from notebook_inspector import inspect_notebook  # noqa: E402
+from notebook_inspector import iter_values  # noqa: E402
+
+
+def code_cell(source, execution_count=None, outputs=()):
+    """Build an nbformat 4 code cell."""
+    return {
+        "cell_type": "code",
+        "execution_count": execution_count,
+        "metadata": {},
+        "outputs": list(outputs),
+        "source": source,
+    }
+
+
+def write_notebook(path: Path, cells) -> Path:
+    """Write an nbformat 4 notebook the way Jupyter does."""
+    notebook = {"cells": cells, "metadata": {}, "nbformat": 4, "nbformat_minor": 5}
+    path.write_text(json.dumps(notebook, indent=1))
+    return path
+
+
+@pytest.mark.unit
+class TestIterValues:
+    """Test the incremental JSON tokenizer."""
+
+    DOCUMENT = {
+        "cells": [1, -2.5e3, True, False, None, 'say "hi"\né', {}, []],
+        "meta": {"empty": "", "nested": {"key": "value"}},
+    }
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 4096])
+    def test_matches_json_at_any_chunk_size(self, chunk_size):
+        """Test tokens split across chunk boundaries decode correctly."""
+        raw = json.dumps(self.DOCUMENT).encode()
+
+        values = list(iter_values(io.BytesIO(raw), chunk_size))
+
+        assert values == [
+            (("cells", 0), 1),
+            (("cells", 1), -2500.0),
+            (("cells", 2), True),
+            (("cells", 3), False),
+            (("cells", 4), None),
+            (("cells", 5), 'say "hi"\né'),
+            (("meta", "empty"), ""),
+            (("meta", "nested", "key"), "value"),
+        ]
+
+    def test_long_strings_skipped(self):
+        """Test large payloads are skipped rather than decoded."""
+        raw = json.dumps({"png": "A" * 100_000, "text": "x\\" * 5000}).encode()
+
+        values = list(iter_values(io.BytesIO(raw), 1024))
+
+        assert values == [(("png",), SKIPPED), (("text",), SKIPPED)]
+
+    @pytest.mark.parametrize(
+        "raw",
+        [b'{"a": 1', b'{"a" 1}', b'{"a": tru}', b"[1] 2", b'["abc', b"}"],
+    )
+    def test_malformed_json_rejected(self, raw):
+        """Test truncated and malformed documents raise NotebookError."""
+        with pytest.raises(NotebookError):
+            list(iter_values(io.BytesIO(raw), 2))
+
+
+@pytest.mark.unit
+class TestInspectNotebook:
+    """Test notebook execution checks."""
+
+    def test_executed_notebook_passes(self, temp_project_root):
+        """Test an executed notebook with large plot outputs passes."""
+        plot = {
+            "output_type": "display_data",
+            "data": {"image/png": "iVBORw0KGgo" * 50_000, "text/plain": ["<Fig>"]},
+            "metadata": {},
+        }
+        path = write_notebook(
+            temp_project_root / "train.ipynb",
+            [
+                {"cell_type": "markdown", "metadata": {}, "source": ["# Train"]},
+                code_cell(["model.fit(X, y)\n"], 1),
+                code_cell("plot(model)", 2, [plot]),
+                code_cell([], None),
+            ],
+        )
+
+        report = inspect_notebook(path, chunk_size=4096)
+
+        assert report.passed
+        assert report.code_cells == 3
+
+    def test_unexecuted_and_error_cells_reported(self, temp_project_root):
+        """Test cells without execution counts and error outputs are problems."""
+        error = {
+            "output_type": "error",
+            "ename": "KeyError",
+            "evalue": "'target'\nsecond line",
+            "traceback": ["..."],
+        }
+        path = write_notebook(
+            temp_project_root / "profile.ipynb",
+            [
+                code_cell(["df = load()\n"], 1),
+                code_cell(["df.describe()\n"], None),
+                code_cell(["df['target']\n"], 2, [error]),
+            ],
+        )
+
+        report = inspect_notebook(path)
+
+        assert not report.passed
+        assert report.problems() == [
+            "1 of 3 code cells have not been executed (cells 2)",
+            "cell 3 raised KeyError: 'target'",
+        ]
+
+    def test_old_nbformat_rejected(self, temp_project_root):
+        """Test notebooks that are not nbformat 4 raise NotebookError."""
+        path = temp_project_root / "old.ipynb"
+        path.write_text(json.dumps({"worksheets": [], "nbformat": 3}))
+
+        with pytest.raises(NotebookError):
+            inspect_notebook(path)
@@ -0,0 +1,167 @@
+"""
+Tests for parse_cache.py script.
+"""
+
+import os
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+import yaml
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+# Import scripts after path modification
+from parse_cache import CACHE_DIR_NAME  # noqa: E402
+from parse_cache import ParseCache  # noqa: E402
+from parse_cache import load_yaml_file  # noqa: E402
+
+
+def age_file(path: Path, seconds: int = 60):
+    """Move a file's mtime into the past so cache entries are not racy."""
+    stat = path.stat()
+    past = stat.st_mtime_ns - seconds * 1_000_000_000
+    os.utime(path, ns=(past, past))
+
+
+@pytest.mark.unit
+class TestParseCache:
+    """Test the persistent parse cache."""
+
+    def test_cache_hit_skips_parse(self, temp_project_root):
+        """Test an unchanged file is served without re-parsing."""
+        source = temp_project_root / "config" / "pipeline.yml"
+        source.write_text("phases: []\n")
+        age_file(source)
+        cache = ParseCache(temp_project_root / CACHE_DIR_NAME)
+        parse = Mock(side_effect=yaml.safe_load)
+
+        first = cache.load(source, "yaml", parse)
+        second = cache.load(source, "yaml", parse)
+
+        assert first == second == {"phases": []}
+        assert parse.call_count == 1
+
+    def test_cache_invalidated_on_change(self, temp_project_root):
+        """Test a modified file is re-parsed."""
+        source = temp_project_root / "config" / "pipeline.yml"
+        source.write_text("phases: []\n")
+        age_file(source)
+        cache = ParseCache(temp_project_root / CACHE_DIR_NAME)
+        cache.load(source, "yaml", yaml.safe_load)
+
+        source.write_text("phases: [a]\n")
+
+        assert cache.load(source, "yaml", yaml.safe_load) == {"phases": ["a"]}
+
+    def test_touched_file_with_same_content_reuses_value(self, temp_project_root):
+        """Test an mtime-only change is resolved by the content hash."""
+        source = temp_project_root / "config" / "pipeline.yml"
+        source.write_text("phases: []\n")
+        cache = ParseCache(temp_project_root / CACHE_DIR_NAME)
+        cache.load(source, "yaml", yaml.safe_load)
+        parse = Mock(side_effect=yaml.safe_load)
+
+        os.utime(source)
+
+        assert cache.load(source, "yaml", parse) == {"phases": []}
+        parse.assert_not_called()
+
+    def test_keys_are_independent(self, temp_project_root):
+        """Test different keys for the same file are cached separately."""
+        source = temp_project_root / "config" / "pipeline.yml"
+        source.write_text("phases: []\n")
+        cache = ParseCache(temp_project_root / CACHE_DIR_NAME)
+
+        cache.load(source, "yaml", yaml.safe_load)
+        result = cache.load(source, "length", len)
+
+        assert result == len("phases: []\n")
+
+    def test_parse_errors_are_not_cached(self, temp_project_root):
+        """Test parse failures propagate and leave no entry behind."""
+        source = temp_project_root / "config" / "pipeline.yml"
+        source.write_text("invalid: yaml: [unclosed")
+        cache = ParseCache(temp_project_root / CACHE_DIR_NAME)
+
+        with pytest.raises(yaml.YAMLError):
+            cache.load(source, "yaml", yaml.safe_load)
+
+        assert not (temp_project_root / CACHE_DIR_NAME).exists()
+
+    def test_unserializable_values_are_not_cached(self, temp_project_root):
+        """Test values JSON cannot store are returned but not persisted."""
+        source = temp_project_root / "notes.yml"
+        source.write_text("day: 2025-01-18\n")
+        cache = ParseCache(temp_project_root / CACHE_DIR_NAME)
+
+        result = cache.load(source, "yaml", yaml.safe_load)
+
+        assert str(result["day"]) == "2025-01-18"
+        assert not (temp_project_root / CACHE_DIR_NAME).exists()
+
+    def test_corrupt_entry_is_ignored(self, temp_project_root):
+        """Test a corrupt cache entry falls back to parsing."""
+        source = temp_project_root / "config" / "pipeline.yml"
+        source.write_text("phases: []\n")
+        cache_dir = temp_project_root / CACHE_DIR_NAME
+        cache = ParseCache(cache_dir)
+        cache.load(source, "yaml", yaml.safe_load)
+        for entry in cache_dir.iterdir():
+            entry.write_text("{not json")
+
+        assert cache.load(source, "yaml", yaml.safe_load) == {"phases": []}
+
+    def test_eviction_bounds_cache_size(self, temp_project_root):
+        """Test least recently used entries are evicted past the size budget."""
+        cache_dir = temp_project_root / CACHE_DIR_NAME
+        cache = ParseCache(cache_dir, max_bytes=1500)
+
+        for index in range(10):
+            source = temp_project_root / f"file{index}.yml"
+            source.write_text(f"value: {'x' * 200}\n")
+            cache.load(source, "yaml", yaml.safe_load)
+
+        total = sum(entry.stat().st_size for entry in cache_dir.iterdir())
+        assert 0 < total <= 1500
+
+    def test_for_project_disabled_by_env(self, temp_project_root, monkeypatch):
+        """Test the cache can be disabled through the environment."""
+        monkeypatch.setenv("VALUETRAIN_NO_CACHE", "1")
+
+        assert ParseCache.for_project(temp_project_root) is None
+
+    def test_for_project_location(self, temp_project_root, monkeypatch):
+        """Test the project cache lives under .valuetrain-cache."""
+        monkeypatch.delenv("VALUETRAIN_NO_CACHE", raising=False)
+
+        cache = ParseCache.for_project(temp_project_root)
+
+        assert cache.cache_dir == temp_project_root / ".valuetrain-cache"
+
+
+@pytest.mark.unit
+class TestLoadYamlFile:
+    """Test YAML loading with and without a cache."""
+
+    def test_load_without_cache(self, temp_project_root):
+        """Test direct YAML loading."""
+        source = temp_project_root / "config" / "pipeline.yml"
+        source.write_text("phases: []\n")
+
+        assert load_yaml_file(source) == {"phases": []}
+
+    def test_load_with_cache(self, temp_project_root):
+        """Test YAML loading through the cache."""
+        source = temp_project_root / "config" / "pipeline.yml"
+        source.write_text("phases: []\n")
+        cache = ParseCache(temp_project_root / CACHE_DIR_NAME)
+
+        assert load_yaml_file(source, cache) == {"phases": []}
+        assert any((temp_project_root / CACHE_DIR_NAME).iterdir())
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,173 @@
+"""
+Tests for pipeline_graph.py script.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+# Import scripts after path modification
+from pipeline_graph import PipelineGraph  # noqa: E402
+
+PROJECT_PIPELINE = Path(__file__).parent.parent.parent / "config" / "pipeline.yml"
+
+
+@pytest.fixture
+def project_graph():
+    """Compiled graph of the repository's own pipeline.yml."""
+    with open(PROJECT_PIPELINE, "r") as f:
+        return PipelineGraph(yaml.safe_load(f))
+
+
+@pytest.mark.unit
+class TestPipelineGraphLookups:
+    """Test indexed lookups."""
+
+    def test_phase_lookup(self, sample_pipeline_config):
+        """Test phases are indexed by name."""
+        graph = PipelineGraph(sample_pipeline_config)
+
+        assert graph.phase("discovery")["owner"] == "onboarder"
+        assert graph.phase("nonexistent") is None
+
+    def test_next_phase(self, sample_pipeline_config):
+        """Test next_phase mirrors the configured value."""
+        graph = PipelineGraph(sample_pipeline_config)
+
+        assert graph.next_phase("enablement") == "discovery"
+        assert graph.next_phase("scope") is None
+        assert graph.next_phase("nonexistent") is None
+
+    def test_artifacts_and_reverse_index(self, sample_pipeline_config):
+        """Test artifact lookups in both directions."""
+        graph = PipelineGraph(sample_pipeline_config)
+
+        assert graph.artifacts("enablement") == ["setup.md", "config.yml"]
+        assert graph.artifacts("nonexistent") == []
+        assert graph.artifact_phases["scope.md"] == ["scope"]
+
+    def test_mode_and_owner_indexes(self, project_graph):
+        """Test mode and owner indexes."""
+        assert project_graph.mode_of("training")["name"] == "build"
+        assert project_graph.owner_of("deployment")["name"] == "ops"
+        assert project_graph.phases_by_mode["improve"] == [
+            "improvement",
+            "retraining",
+        ]
+        assert "monitoring" in project_graph.phases_by_owner["ops"]
+
+    def test_first_definition_wins(self):
+        """Test duplicate phase names resolve to the first definition."""
+        graph = PipelineGraph(
+            {
+                "phases": [
+                    {"name": "a", "next_phase": "b"},
+                    {"name": "a", "next_phase": "c"},
+                ]
+            }
+        )
+
+        assert graph.next_phase("a") == "b"
+
+    def test_empty_config(self):
+        """Test an empty configuration compiles to an empty graph."""
+        graph = PipelineGraph(None)
+
+        assert graph.phases == {}
+        assert not graph.is_cyclic()
+
+    def test_coerce(self, sample_pipeline_config):
+        """Test coerce compiles dicts and passes graphs through."""
+        graph = PipelineGraph.coerce(sample_pipeline_config)
+
+        assert isinstance(graph, PipelineGraph)
+        assert PipelineGraph.coerce(graph) is graph
+
+
+@pytest.mark.unit
+class TestPipelineGraphStructure:
+    """Test successor tables, cycles and reachability."""
+
+    def test_successors_and_predecessors(self, project_graph):
+        """Test precomputed edge tables."""
+        assert project_graph.successors["monitoring"] == ("evaluation",)
+        assert set(project_graph.predecessors["monitoring"]) == {
+            "deployment",
+            "retraining",
+        }
+        assert project_graph.predecessors["opportunity"] == ()
+
+    def test_detects_improvement_loop(self, project_graph):
+        """Test the monitoring/retraining loop is detected."""
+        assert project_graph.is_cyclic()
+        assert project_graph.cycles == [
+            ["monitoring", "evaluation", "improvement", "retraining"]
+        ]
+        assert project_graph.cycle_of("retraining") == project_graph.cycles[0]
+        assert project_graph.cycle_of("opportunity") is None
+
+    def test_linear_pipeline_is_acyclic(self, sample_pipeline_config):
+        """Test a linear pipeline has no cycles."""
+        graph = PipelineGraph(sample_pipeline_config)
+
+        assert not graph.is_cyclic()
+        assert graph.cycles == []
+
+    def test_self_loop(self):
+        """Test a phase pointing at itself is a cycle."""
+        graph = PipelineGraph({"phases": [{"name": "a", "next_phase": "a"}]})
+
+        assert graph.cycles == [["a"]]
+
+    def test_reachability(self, project_graph):
+        """Test reachability queries across the loop."""
+        assert project_graph.can_reach("opportunity", "retraining")
+        assert project_graph.can_reach("retraining", "monitoring")
+        assert project_graph.can_reach("monitoring", "monitoring")
+        assert not project_graph.can_reach("monitoring", "training")
+        assert not project_graph.can_reach("deployment", "deployment")
+
+    def test_branching_next_phase(self):
+        """Test list-valued next_phase produces multiple successors."""
+        graph = PipelineGraph(
+            {
+                "phases": [
+                    {"name": "a", "next_phase": ["b", "c"]},
+                    {"name": "b"},
+                    {"name": "c", "next_phase": "a"},
+                ]
+            }
+        )
+
+        assert graph.successors["a"] == ("b", "c")
+        assert graph.reachable_from("a") == {"a", "b", "c"}
+        assert graph.cycles == [["a", "c"]]
+
+    def test_undefined_targets(self):
+        """Test dangling next_phase references are reported."""
+        graph = PipelineGraph({"phases": [{"name": "a", "next_phase": "missing"}]})
+
+        assert graph.undefined_targets() == [("a", "missing")]
+        assert not graph.is_cyclic()
+
+    def test_large_pipeline(self):
+        """Test compilation of a long chain does not recurse."""
+        phases = [
+            {"name": f"p{index}", "next_phase": f"p{index + 1}"}
+            for index in range(5000)
+        ]
+        phases.append({"name": "p5000", "next_phase": "p0"})
+
+        graph = PipelineGraph({"phases": phases})
+
+        assert len(graph.cycles) == 1
+        assert len(graph.cycles[0]) == 5001
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
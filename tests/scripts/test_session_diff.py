@@ -0,0 +1,131 @@
+"""
+Tests for session_diff.py script.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+# Import scripts after path modification
+from session_diff import iter_unified_diff  # noqa: E402
+from session_diff import json_patch  # noqa: E402
+from session_diff import section_changes  # noqa: E402
+
+OLD_SESSION = """# Active Session
+
+## Session Metadata
+```yaml
+session_id: "s-1"
+version: 1
+```
+
+Prose that is never diffed.
+
+## Current Work
+```yaml
+mode: "build"
+phase: "enablement"
+agent: "conductor"
+```
+
+## Session Notes
+```yaml
+decisions:
+  - "First"
+  - "Second"
+blockers: []
+```
+"""
+
+NEW_SESSION = (
+    OLD_SESSION.replace("version: 1", "version: 2")
+    .replace('phase: "enablement"', 'phase: "discovery"')
+    .replace('  - "Second"\n', '  - "Second"\n  - "Third"\n')
+)
+
+
+@pytest.mark.unit
+class TestSectionChanges:
+    """Test changed section detection."""
+
+    def test_only_changed_sections(self):
+        """Test unchanged sections are skipped and start lines are recorded."""
+        changes = list(section_changes(OLD_SESSION, NEW_SESSION))
+
+        assert [change.name for change in changes] == [
+            "Session Metadata",
+            "Current Work",
+            "Session Notes",
+        ]
+        assert changes[1].old_start == 12
+        assert changes[1].new_start == 12
+
+    def test_identical_documents(self):
+        """Test identical documents have no changes."""
+        assert list(section_changes(OLD_SESSION, OLD_SESSION)) == []
+        assert list(iter_unified_diff(OLD_SESSION, OLD_SESSION)) == []
+        assert json_patch(OLD_SESSION, OLD_SESSION) == []
+
+
+@pytest.mark.unit
+class TestUnifiedDiff:
+    """Test per-section unified diff output."""
+
+    def test_hunks_use_file_line_numbers(self):
+        """Test hunk headers point at lines in the full file."""
+        lines = list(iter_unified_diff(OLD_SESSION, NEW_SESSION, "S.md", context=0))
+
+        assert lines == [
+            "--- a/S.md",
+            "+++ b/S.md",
+            "@@ -6 +6 @@ ## Session Metadata",
+            "-version: 1",
+            "+version: 2",
+            "@@ -14 +14 @@ ## Current Work",
+            '-phase: "enablement"',
+            '+phase: "discovery"',
+            "@@ -22,0 +23 @@ ## Session Notes",
+            '+  - "Third"',
+        ]
+
+    def test_matches_file_lines(self):
+        """Test removed and added lines are the lines at the reported numbers."""
+        old_lines = OLD_SESSION.split("\n")
+        new_lines = NEW_SESSION.split("\n")
+
+        lines = list(iter_unified_diff(OLD_SESSION, NEW_SESSION))
+
+        assert "Prose that is never diffed." not in "\n".join(lines)
+        header = next(line for line in lines if line.endswith("## Current Work"))
+        old_range, new_range = header.split(" ")[1:3]
+        old_start = int(old_range[1:].split(",")[0])
+        new_start = int(new_range[1:].split(",")[0])
+        assert old_lines[old_start - 1] == 'mode: "build"'
+        assert new_lines[new_start - 1] == 'mode: "build"'
+
+
+@pytest.mark.unit
+class TestJsonPatch:
+    """Test RFC 6902 patch generation."""
+
+    def test_scalar_and_list_changes(self):
+        """Test scalars are replaced and list items are added by index."""
+        assert json_patch(OLD_SESSION, NEW_SESSION) == [
+            {"op": "replace", "path": "/Session Metadata/version", "value": 2},
+            {"op": "replace", "path": "/Current Work/phase", "value": "discovery"},
+            {"op": "add", "path": "/Session Notes/decisions/2", "value": "Third"},
+        ]
+
+    def test_removals_and_escaping(self):
+        """Test removed keys, trailing list items and escaped pointers."""
+        old = OLD_SESSION.replace("blockers: []", 'blockers: []\n"a/b~c": 1')
+        new = OLD_SESSION.replace('  - "Second"\n', "")
+
+        assert json_patch(old, new) == [
+            {"op": "remove", "path": "/Session Notes/a~1b~0c"},
+            {"op": "remove", "path": "/Session Notes/decisions/1"},
+        ]
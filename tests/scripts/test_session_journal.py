@@ -0,0 +1,160 @@
+"""
+Tests for session_journal.py script.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+# Import scripts after path modification
+from session_journal import compact_session  # noqa: E402
+from session_journal import journal_path_for  # noqa: E402
+from session_journal import offload_decisions  # noqa: E402
+from session_journal import read_journal  # noqa: E402
+from session_journal import write_journaled_session  # noqa: E402
+from session_model import SessionDocument  # noqa: E402
+from session_store import StaleSessionError  # noqa: E402
+
+SESSION = """# Active Session Context
+
+## Session Metadata
+```yaml
+session_id: "2025-01-18-test"
+version: {version}
+```
+
+## Current Work
+```yaml
+mode: "build"
+phase: "enablement"
+```
+
+## Session Notes
+```yaml
+decisions:
+{decisions}
+blockers: []
+```
+"""
+
+
+def session(count: int, version: int = 0) -> str:
+    """Return session content with `count` numbered decisions."""
+    decisions = "\n".join(f'  - "Decision {i}"' for i in range(1, count + 1))
+    return SESSION.format(version=version, decisions=decisions)
+
+
+def decisions(content: str) -> list:
+    """Return the inline decisions of session content."""
+    return SessionDocument(content).section("Session Notes")["decisions"]
+
+
+@pytest.fixture
+def session_path(temp_project_root):
+    """Return the project's session path."""
+    return temp_project_root / "docs" / "session-context" / "ACTIVE_SESSION.md"
+
+
+@pytest.mark.unit
+class TestOffloadDecisions:
+    """Test capping inline decisions."""
+
+    def test_keeps_newest(self):
+        """Test only the newest decisions stay inline."""
+        content, overflow = offload_decisions(session(5), keep=2)
+
+        assert overflow == ["Decision 1", "Decision 2", "Decision 3"]
+        assert decisions(content) == ["Decision 4", "Decision 5"]
+        assert SessionDocument(content).section("Session Notes")["blockers"] == []
+
+    def test_within_limit_unchanged(self):
+        """Test content under the limit is returned untouched."""
+        content = session(2)
+
+        assert offload_decisions(content, keep=2) == (content, [])
+
+
+@pytest.mark.unit
+class TestJournaledWrites:
+    """Test session writes that append to the journal."""
+
+    def test_transition_and_overflow_journaled(self, session_path):
+        """Test overflowing decisions and the transition are journaled."""
+        session_path.write_text(session(3))
+
+        moved = write_journaled_session(
+            session_path, session(4, version=1), ("enablement", "discovery"), keep=3
+        )
+
+        assert moved == 1
+        assert decisions(session_path.read_text()) == [
+            "Decision 2",
+            "Decision 3",
+            "Decision 4",
+        ]
+        entries = list(read_journal(journal_path_for(session_path)))
+        assert [entry["type"] for entry in entries] == ["decision", "transition"]
+        assert entries[0]["decision"] == "Decision 1"
+        assert entries[1]["from_phase"] == "enablement"
+        assert entries[1]["to_phase"] == "discovery"
+        assert entries[1]["session_id"] == "2025-01-18-test"
+        assert entries[1]["version"] == 1
+
+    def test_rejected_write_not_journaled(self, session_path):
+        """Test nothing is journaled when the session write is stale."""
+        session_path.write_text(session(1, version=3))
+
+        with pytest.raises(StaleSessionError):
+            write_journaled_session(
+                session_path, session(1, version=1), ("enablement", "discovery")
+            )
+
+        assert not journal_path_for(session_path).exists()
+
+    def test_failed_journal_append_keeps_session(self, session_path):
+        """Test decisions stay inline when the journal cannot be written."""
+        from unittest.mock import patch
+
+        original = session(3)
+        session_path.write_text(original)
+
+        with patch("session_journal.append_journal", side_effect=OSError("full")):
+            with pytest.raises(OSError):
+                write_journaled_session(session_path, session(4, version=1), keep=3)
+
+        assert session_path.read_text() == original
+
+    def test_journal_path(self, session_path):
+        """Test the journal lives next to the session."""
+        assert journal_path_for(session_path).name == "ACTIVE_SESSION.journal.jsonl"
+
+
+@pytest.mark.unit
+class TestCompactSession:
+    """Test rolling old decisions into the journal."""
+
+    def test_compact(self, session_path):
+        """Test compaction keeps the newest decisions and bumps the version."""
+        session_path.write_text(session(30, version=4))
+
+        assert compact_session(session_path, keep=5) == 25
+
+        content = session_path.read_text()
+        assert decisions(content) == [f"Decision {i}" for i in range(26, 31)]
+        assert SessionDocument(content).section("Session Metadata")["version"] == 5
+        journal = list(read_journal(journal_path_for(session_path)))
+        assert [entry["decision"] for entry in journal] == [
+            f"Decision {i}" for i in range(1, 26)
+        ]
+
+    def test_compact_is_idempotent(self, session_path):
+        """Test compacting an already compact session does not rewrite it."""
+        session_path.write_text(session(3))
+
+        assert compact_session(session_path, keep=5) == 0
+        assert session_path.read_text() == session(3)
+        assert not journal_path_for(session_path).exists()
@@ -0,0 +1,201 @@
+"""
+Tests for session_model.py script.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+# Import scripts after path modification
+from session_model import SessionDocument  # noqa: E402
+from session_model import session_path_for  # noqa: E402
+
+
+@pytest.mark.unit
+class TestSessionDocument:
+    """Test the single-pass session index."""
+
+    def test_indexes_all_sections(self, sample_active_session):
+        """Test every section heading is indexed in document order."""
+        document = SessionDocument(sample_active_session)
+
+        assert document.section_names() == [
+            "Session Metadata",
+            "Current Work",
+            "Task Context",
+            "Work Progress",
+            "Artifacts",
+            "Session Notes",
+            "Git Context",
+            "Tool Access",
+        ]
+
+    def test_section_offsets_point_at_yaml_body(self, sample_active_session):
+        """Test recorded offsets bound the fenced YAML body."""
+        document = SessionDocument(sample_active_session)
+        span = document.sections["Current Work"]
+        lines = sample_active_session.split("\n")
+
+        assert lines[span.heading_line] == "## Current Work"
+        assert lines[span.yaml_start_line - 1] == "```yaml"
+        assert lines[span.yaml_end_line] == "```"
+        assert sample_active_session[span.yaml_start :].startswith('mode: "build"')
+
+    def test_section_yaml_raw_text(self, sample_active_session):
+        """Test raw YAML extraction for a section."""
+        document = SessionDocument(sample_active_session)
+
+        raw = document.section_yaml("Git Context")
+
+        assert raw.split("\n")[0] == 'repository: "test-repo"'
+        assert raw.split("\n")[-1] == 'last_commit: "abc123"'
+
+    def test_sections_parse_lazily(self, sample_active_session):
+        """Test only requested sections are YAML-parsed."""
+        document = SessionDocument(sample_active_session)
+
+        current_work = document.section("Current Work")
+
+        assert current_work["mode"] == "build"
+        assert list(document._parsed) == ["Current Work"]
+
+    def test_lazy_parse_skips_broken_sections(self, sample_active_session):
+        """Test a broken unrelated section does not affect Current Work."""
+        content = sample_active_session.replace(
+            '  - "Test decision"', "  - [unclosed bracket"
+        )
+        document = SessionDocument(content)
+
+        assert document.section("Current Work")["phase"] == "enablement"
+        with pytest.raises(yaml.YAMLError):
+            document.section("Session Notes")
+
+    def test_missing_section(self, sample_active_session):
+        """Test missing sections return empty values."""
+        document = SessionDocument(sample_active_session)
+
+        assert document.section_yaml("Nonexistent") == ""
+        assert document.section("Nonexistent") == {}
+        assert not document.has_yaml("Nonexistent")
+
+    def test_section_without_yaml(self):
+        """Test sections without a fenced block are indexed but have no YAML."""
+        content = """# Session
+
+## Schema Definition
+Some prose.
+
+### Required Fields
+- `session_id`
+"""
+        document = SessionDocument(content)
+
+        assert "Schema Definition" in document.sections
+        assert not document.has_yaml("Schema Definition")
+        assert "Required Fields" not in document.sections
+
+    def test_raw_sections_excludes_empty(self):
+        """Test raw_sections only includes sections with YAML content."""
+        content = """## Current Work
+```yaml
+mode: "build"
+```
+
+## Empty
+```yaml
+```
+
+## Prose
+Nothing here.
+"""
+        document = SessionDocument(content)
+
+        assert document.raw_sections() == {"Current Work": 'mode: "build"'}
+
+    def test_unterminated_fence(self):
+        """Test an unterminated fence runs to the end of the document."""
+        document = SessionDocument('## Current Work\n```yaml\nmode: "build"\n')
+
+        assert document.section("Current Work") == {"mode": "build"}
+
+    def test_from_path(self, temp_project_root, sample_active_session):
+        """Test reading a session document from disk."""
+        session_path = session_path_for(temp_project_root)
+        session_path.write_text(sample_active_session)
+
+        document = SessionDocument.from_path(session_path)
+
+        assert document.content == sample_active_session
+        assert session_path == (
+            temp_project_root / "docs" / "session-context" / "ACTIVE_SESSION.md"
+        )
+
+
+@pytest.mark.unit
+class TestReplaceSections:
+    """Test one-pass multi-section replacement."""
+
+    def test_replace_multiple_sections(self, sample_active_session):
+        """Test several sections are replaced in one call."""
+        document = SessionDocument(sample_active_session)
+
+        result = document.replace_sections(
+            {
+                "Session Notes": "decisions: []\n",
+                "Current Work": "mode: discover\nphase: discovery\n",
+            }
+        )
+        updated = SessionDocument(result)
+
+        assert updated.section("Current Work") == {
+            "mode": "discover",
+            "phase": "discovery",
+        }
+        assert updated.section("Session Notes") == {"decisions": []}
+        assert updated.section_yaml("Git Context") == document.section_yaml(
+            "Git Context"
+        )
+        assert result.endswith(sample_active_session.split("## Git Context")[1])
+
+    def test_replace_preserves_untouched_content(self, sample_active_session):
+        """Test replacing a section with its own YAML is a no-op."""
+        document = SessionDocument(sample_active_session)
+
+        result = document.replace_sections(
+            {"Current Work": document.section_yaml("Current Work")}
+        )
+
+        assert result == sample_active_session
+
+    def test_replace_skips_missing_sections(self, sample_active_session):
+        """Test missing or YAML-less sections are ignored."""
+        document = SessionDocument(sample_active_session + "\n## Prose\nText\n")
+
+        result = document.replace_sections({"Nonexistent": "a: 1", "Prose": "b: 2"})
+
+        assert result == document.content
+
+    def test_heading_without_yaml_does_not_leak(self):
+        """Test a YAML-less section does not capture the next section's block."""
+        content = """## Prose
+Text
+
+## Current Work
+```yaml
+mode: "build"
+```
+"""
+        document = SessionDocument(content)
+
+        result = document.replace_sections({"Prose": "mode: discover"})
+
+        assert result == content
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,138 @@
+"""
+Tests for session_store.py script.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+# Import scripts after path modification
+from fs_utils import LockTimeout  # noqa: E402
+from fs_utils import file_lock  # noqa: E402
+from fs_utils import lock_path_for  # noqa: E402
+from session_store import StaleSessionError  # noqa: E402
+from session_store import session_version  # noqa: E402
+from session_store import write_session  # noqa: E402
+
+SESSION = """# Active Session Context
+
+## Session Metadata
+```yaml
+session_id: "2025-01-18-test"
+{version}
+```
+
+## Current Work
+```yaml
+phase: "{phase}"
+```
+"""
+
+
+def session(phase: str, version: int = None) -> str:
+    """Return session content at a phase and optional version."""
+    line = f"version: {version}" if version is not None else ""
+    return SESSION.format(phase=phase, version=line)
+
+
+@pytest.fixture
+def session_path(temp_project_root):
+    """Return the project's session path."""
+    return temp_project_root / "docs" / "session-context" / "ACTIVE_SESSION.md"
+
+
+@pytest.mark.unit
+class TestSessionVersion:
+    """Test reading the optimistic version counter."""
+
+    def test_version(self):
+        """Test the version is read from Session Metadata."""
+        assert session_version(session("build", 3)) == 3
+
+    def test_unset_version_is_zero(self):
+        """Test sessions predating the counter are at version 0."""
+        assert session_version(session("build")) == 0
+
+    def test_no_metadata(self):
+        """Test sessions without Session Metadata have no version."""
+        assert session_version("# Notes\n") is None
+
+
+@pytest.mark.unit
+class TestWriteSession:
+    """Test atomic, lock-protected session writes."""
+
+    def test_write_next_version(self, session_path):
+        """Test a write bumping the on-disk version by one succeeds."""
+        session_path.write_text(session("build"))
+
+        assert write_session(session_path, session("discovery", 1)) == 1
+        assert session_path.read_text() == session("discovery", 1)
+        assert lock_path_for(session_path).exists()
+        assert [p.name for p in session_path.parent.glob("*.tmp")] == []
+
+    def test_stale_writer_rejected(self, session_path):
+        """Test a writer based on an older version does not clobber."""
+        session_path.write_text(session("build"))
+        write_session(session_path, session("discovery", 1))
+
+        with pytest.raises(StaleSessionError, match="at version 1"):
+            write_session(session_path, session("scope", 1))
+
+        assert session_path.read_text() == session("discovery", 1)
+
+    def test_new_file_and_unversioned_content(self, session_path):
+        """Test missing files and content without metadata are written as is."""
+        write_session(session_path, session("build", 5))
+        write_session(session_path, "# Notes\n")
+
+        assert session_path.read_text() == "# Notes\n"
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+    def test_file_mode_preserved(self, session_path):
+        """Test writes keep the file's mode and new files follow the umask."""
+        import os
+
+        write_session(session_path, session("build"))
+        umask = os.umask(0)
+        os.umask(umask)
+        assert session_path.stat().st_mode & 0o777 == 0o666 & ~umask
+
+        session_path.chmod(0o640)
+        write_session(session_path, session("discovery", 1))
+        assert session_path.stat().st_mode & 0o777 == 0o640
+
+    def test_lock_timeout(self, session_path):
+        """Test a writer gives up when another holds the lock."""
+        session_path.write_text(session("build"))
+
+        with file_lock(session_path, timeout=1):
+            with pytest.raises(LockTimeout):
+                write_session(session_path, session("discovery", 1), timeout=0.1)
+
+        assert session_path.read_text() == session("build")
+
+    def test_concurrent_writers(self, session_path):
+        """Test only one of several writers from the same version wins."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        session_path.write_text(session("build"))
+
+        def attempt(phase: str) -> bool:
+            try:
+                write_session(session_path, session(phase, 1))
+                return True
+            except StaleSessionError:
+                return False
+
+        phases = [f"phase-{i}" for i in range(8)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            outcomes = list(executor.map(attempt, phases))
+
+        assert outcomes.count(True) == 1
+        winner = phases[outcomes.index(True)]
+        assert session_path.read_text() == session(winner, 1)
@@ -0,0 +1,54 @@
+"""
+Tests for startup_benchmark.py script.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+# Import scripts after path modification
+from startup_benchmark import ENTRY_POINTS  # noqa: E402
+from startup_benchmark import measure_entry_point  # noqa: E402
+from startup_benchmark import parse_importtime  # noqa: E402
+
+
+@pytest.mark.unit
+class TestParseImporttime:
+    """Test parsing of -X importtime output."""
+
+    def test_parse_cumulative_times(self):
+        """Test cumulative times are keyed by module name."""
+        stderr = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       899 |       2077 |     urllib.parse
+import time:      2032 |      26124 | check_todo
+"""
+
+        result = parse_importtime(stderr)
+
+        assert result == {"_io": 120, "urllib.parse": 2077, "check_todo": 26124}
+
+    def test_ignores_unrelated_lines(self):
+        """Test non-importtime lines are skipped."""
+        assert parse_importtime("Traceback (most recent call last):\n") == {}
+
+
+@pytest.mark.slow
+class TestMeasureEntryPoint:
+    """Test measuring real entry points."""
+
+    @pytest.mark.parametrize("module", ENTRY_POINTS)
+    def test_entry_points_defer_heavy_imports(self, module):
+        """Test no entry point imports yaml, json or datetime eagerly."""
+        report = measure_entry_point(module, repeat=1)
+
+        assert report["cumulative_ms"] > 0
+        assert report["deferred_violations"] == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
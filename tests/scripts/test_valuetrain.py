@@ -0,0 +1,208 @@
+"""
+Tests for valuetrain.py script.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+# Import scripts after path modification
+from pipeline_graph import PipelineGraph  # noqa: E402
+from valuetrain import main  # noqa: E402
+from valuetrain import run_artifact_gate  # noqa: E402
+from valuetrain import run_todo_gate  # noqa: E402
+
+
+def run_main(argv):
+    """Run the CLI and return its exit code."""
+    with patch("sys.argv", ["valuetrain.py"] + argv):
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+    return exc_info.value.code
+
+
+@pytest.mark.unit
+class TestGates:
+    """Test individual gate functions."""
+
+    def test_todo_gate_reports_unchecked(
+        self, temp_project_root, sample_checklist_with_unchecked
+    ):
+        """Test the todo gate fails with unchecked items."""
+        from tests.conftest import create_test_checklist
+
+        create_test_checklist(
+            temp_project_root, "build", sample_checklist_with_unchecked
+        )
+
+        result = run_todo_gate(temp_project_root, {"mode": "build"})
+
+        assert not result.passed
+        assert result.messages[0] == "8 unchecked items in build-checklist.md"
+
+    def test_todo_gate_missing_mode(self, temp_project_root):
+        """Test the todo gate errors without a mode."""
+        result = run_todo_gate(temp_project_root, {})
+
+        assert result.error
+
+    def test_artifact_gate(self, temp_project_root, sample_pipeline_config):
+        """Test the artifact gate reports missing artifacts."""
+        from tests.conftest import create_test_artifacts
+
+        create_test_artifacts(temp_project_root, ["delivery/setup.md"])
+        pipeline = PipelineGraph(sample_pipeline_config)
+
+        result = run_artifact_gate(temp_project_root, pipeline, "enablement")
+
+        assert not result.passed
+        assert result.messages == [
+            f"Missing: {temp_project_root / 'config' / 'config.yml'}"
+        ]
+
+
+@pytest.mark.integration
+class TestGateCommand:
+    """Integration tests for the gate command."""
+
+    def setup_project(self, root, pipeline_config, session, checklist, artifacts):
+        from tests.conftest import (
+            create_test_artifacts,
+            create_test_checklist,
+            create_test_files,
+        )
+
+        create_test_files(root, pipeline_config, session)
+        create_test_checklist(root, "build", checklist)
+        create_test_artifacts(root, artifacts)
+
+    def test_gate_passes_and_advances(
+        self,
+        temp_project_root,
+        sample_pipeline_config,
+        sample_active_session,
+        sample_checklist_all_checked,
+    ):
+        """Test a passing gate run advances the session."""
+        self.setup_project(
+            temp_project_root,
+            sample_pipeline_config,
+            sample_active_session,
+            sample_checklist_all_checked,
+            ["delivery/setup.md", "config/config.yml"],
+        )
+
+        code = run_main(["gate", "--project-root", str(temp_project_root), "--advance"])
+
+        assert code == 0
+        session_path = (
+            temp_project_root / "docs" / "session-context" / "ACTIVE_SESSION.md"
+        )
+        assert 'phase: "discovery"' in session_path.read_text()
+
+    def test_gate_failure_skips_advance(
+        self,
+        temp_project_root,
+        sample_pipeline_config,
+        sample_active_session,
+        sample_checklist_with_unchecked,
+    ):
+        """Test a failing gate blocks the advance and fails in strict mode."""
+        self.setup_project(
+            temp_project_root,
+            sample_pipeline_config,
+            sample_active_session,
+            sample_checklist_with_unchecked,
+            [],
+        )
+
+        code = run_main(
+            [
+                "gate",
+                "--project-root",
+                str(temp_project_root),
+                "--advance",
+                "--strict",
+            ]
+        )
+
+        assert code == 1
+        session_path = (
+            temp_project_root / "docs" / "session-context" / "ACTIVE_SESSION.md"
+        )
+        assert session_path.read_text() == sample_active_session
+
+    def test_gate_non_strict_failure_exits_zero(
+        self,
+        temp_project_root,
+        sample_pipeline_config,
+        sample_active_session,
+        sample_checklist_with_unchecked,
+    ):
+        """Test failed gates do not fail the run without --strict."""
+        self.setup_project(
+            temp_project_root,
+            sample_pipeline_config,
+            sample_active_session,
+            sample_checklist_with_unchecked,
+            [],
+        )
+
+        assert run_main(["gate", "--project-root", str(temp_project_root)]) == 0
+
+    def test_gate_dry_run_does_not_write(
+        self,
+        temp_project_root,
+        sample_pipeline_config,
+        sample_active_session,
+        sample_checklist_all_checked,
+    ):
+        """Test --dry-run leaves the session untouched."""
+        self.setup_project(
+            temp_project_root,
+            sample_pipeline_config,
+            sample_active_session,
+            sample_checklist_all_checked,
+            ["delivery/setup.md", "config/config.yml"],
+        )
+
+        code = run_main(
+            [
+                "gate",
+                "--project-root",
+                str(temp_project_root),
+                "--advance",
+                "--dry-run",
+            ]
+        )
+
+        assert code == 0
+        session_path = (
+            temp_project_root / "docs" / "session-context" / "ACTIVE_SESSION.md"
+        )
+        assert session_path.read_text() == sample_active_session
+
+    def test_gate_missing_checklist_is_error(
+        self, temp_project_root, sample_pipeline_config, sample_active_session
+    ):
+        """Test a gate that aborts makes the run fail even without --strict."""
+        from tests.conftest import create_test_files
+
+        create_test_files(
+            temp_project_root, sample_pipeline_config, sample_active_session
+        )
+
+        assert run_main(["gate", "--project-root", str(temp_project_root)]) == 1
+
+    def test_gate_missing_session(self, temp_project_root):
+        """Test missing inputs fail the run."""
+        assert run_main(["gate", "--project-root", str(temp_project_root)]) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,144 @@
+"""
+Tests for yaml_patch.py script.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+# Add scripts to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+# Import scripts after path modification
+from yaml_patch import patch_or_dump  # noqa: E402
+from yaml_patch import patch_yaml  # noqa: E402
+
+CURRENT_WORK = """mode: "design"  # intake|discover|scope|design|build
+phase: 'enablement'  # From pipeline.yml phases
+agent: conductor
+task:
+  issue_number: null
+  title: "Value Train"
+branch: "main"
+"""
+
+SESSION_NOTES = """decisions:
+  - "First decision"
+  - "Second decision"  # why
+blockers: []
+next_steps:
+  - "Old step"
+"""
+
+
+def updated(text: str, **changes) -> dict:
+    """Return the parsed text with top-level changes applied."""
+    value = yaml.safe_load(text)
+    value.update(changes)
+    return value
+
+
+@pytest.mark.unit
+class TestPatchScalars:
+    """Test in-place scalar edits."""
+
+    def test_preserves_comments_and_quotes(self):
+        """Test only the changed values are rewritten, in their quote style."""
+        patched = patch_yaml(
+            CURRENT_WORK, updated(CURRENT_WORK, mode="discover", phase="it's")
+        )
+
+        assert patched.splitlines() == [
+            'mode: "discover"  # intake|discover|scope|design|build',
+            "phase: 'it''s'  # From pipeline.yml phases",
+            "agent: conductor",
+            "task:",
+            "  issue_number: null",
+            '  title: "Value Train"',
+            'branch: "main"',
+        ]
+
+    def test_plain_scalar_quoted_when_needed(self):
+        """Test plain values that need quoting still round-trip."""
+        new = updated(CURRENT_WORK, agent="yes")
+
+        patched = patch_yaml(CURRENT_WORK, new)
+
+        assert "agent: 'yes'" in patched
+        assert yaml.safe_load(patched) == new
+
+    def test_new_key_appended(self):
+        """Test added keys are appended without touching existing lines."""
+        patched = patch_yaml(CURRENT_WORK, updated(CURRENT_WORK, version=1))
+
+        assert patched == CURRENT_WORK + "version: 1\n"
+
+
+@pytest.mark.unit
+class TestPatchSequences:
+    """Test block sequence edits."""
+
+    def test_append_keeps_existing_items(self):
+        """Test appended items reuse the existing indent and quote style."""
+        notes = yaml.safe_load(SESSION_NOTES)
+        notes["decisions"].append('Advanced to "discovery"')
+
+        patched = patch_yaml(SESSION_NOTES, notes)
+
+        assert patched.splitlines()[:4] == [
+            "decisions:",
+            '  - "First decision"',
+            '  - "Second decision"  # why',
+            '  - "Advanced to \\"discovery\\""',
+        ]
+
+    def test_replace_and_fill_empty(self):
+        """Test replaced lists and empty flow lists become block sequences."""
+        new = updated(SESSION_NOTES, next_steps=["Step a", "Step b"], blockers=["x"])
+
+        patched = patch_yaml(SESSION_NOTES, new)
+
+        assert patched.splitlines()[3:] == [
+            "blockers:",
+            '  - "x"',
+            "next_steps:",
+            '  - "Step a"',
+            '  - "Step b"',
+        ]
+
+    def test_emptied_list(self):
+        """Test removing every item leaves an empty flow list."""
+        patched = patch_yaml(SESSION_NOTES, updated(SESSION_NOTES, decisions=[]))
+
+        assert patched.splitlines()[0] == "decisions: []"
+        assert yaml.safe_load(patched)["decisions"] == []
+
+
+@pytest.mark.unit
+class TestFallback:
+    """Test structural changes fall back to a full dump."""
+
+    def test_nested_mapping_change(self):
+        """Test changes inside nested mappings are not patched."""
+        task = {"issue_number": 2, "title": "Value Train"}
+
+        assert patch_yaml(CURRENT_WORK, updated(CURRENT_WORK, task=task)) is None
+
+    def test_removed_key(self):
+        """Test removed keys are not patched."""
+        value = yaml.safe_load(CURRENT_WORK)
+        del value["branch"]
+
+        assert patch_yaml(CURRENT_WORK, value) is None
+        assert patch_or_dump(CURRENT_WORK, value) == yaml.dump(
+            value, default_flow_style=False, sort_keys=False
+        )
+
+    def test_complex_sequence_items(self):
+        """Test sequences of mappings are not patched."""
+        text = "todos:\n  - id: 1\n    status: pending\n"
+        value = {"todos": [{"id": 1, "status": "done"}]}
+
+        assert patch_yaml(text, value) is None